@@ -0,0 +1,8 @@
+'''
+Benchmark suite of the framework overhead: minder discovery, loading, dispatch and concurrency limits.
+
+    python -m benchmarks                                   # Run and print the results
+    python -m benchmarks --save benchmarks/baseline.json   # Store a baseline
+    python -m benchmarks --compare benchmarks/baseline.json --threshold 0.25
+                                                           # Fail (exit code 1) on regressions above 25%
+'''
@@ -0,0 +1,58 @@
+import argparse
+import sys
+from benchmarks import harness, suite # The suite registers the benchmarks
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Guardin Mind benchmark suite")
+    parser.add_argument("-k", dest="pattern", help="Only run benchmarks whose name contains this text", default=None)
+    parser.add_argument("--repeat", type=int, help="Samples per benchmark", default=7)
+    parser.add_argument("--min-time", type=float, help="Minimum duration of one sample (seconds)", default=0.1)
+    parser.add_argument("--save", metavar="PATH", help="Store the results as a baseline", default=None)
+    parser.add_argument("--compare", metavar="PATH", help="Compare the results with a baseline", default=None)
+    parser.add_argument("--retries", type=int, help="Times a regressed benchmark is measured again before it is reported", default=2)
+    parser.add_argument("--threshold", type=float, help="Allowed slowdown before a regression is reported (0.25 = 25%%)", default=0.25)
+    args = parser.parse_args()
+
+    print(f"{'benchmark':36s} {'min':>10s} {'median':>10s}")
+    results = harness.run(
+        args.pattern, args.repeat, args.min_time,
+        report=lambda name, result: print(f"{name:36s} {harness.format_time(result['min']):>10s} {harness.format_time(result['median']):>10s}"),
+    )
+
+    calibration = harness.calibrate(args.repeat, args.min_time) if args.save or args.compare else None
+
+    if args.save:
+        harness.save(results, args.save, calibration)
+        print(f"Baseline saved to {args.save}")
+
+    if args.compare:
+        baseline = harness.load(args.compare)
+        scale = calibration / baseline["calibration"] if baseline.get("calibration") else 1.0
+        if baseline["machine"] != harness.machine_info():
+            print(f"WARNING: baseline recorded on another machine or Python: {baseline['machine']}")
+            print(f"         Ratios are scaled by the calibration loop ({scale:.2f}x), re-record the baseline locally for a reliable gate")
+
+        rows = harness.compare(results, baseline["results"], args.threshold, scale=scale)
+
+        # Noisy machines: measure regressed benchmarks again and keep their best result
+        for _ in range(args.retries):
+            suspects = [row["name"] for row in rows if row["status"] == "regression"]
+            if not suspects:
+                break
+            for name, result in harness.run(repeat=args.repeat, min_time=args.min_time, names=suspects).items():
+                if result["min"] < results[name]["min"]:
+                    results[name] = result
+            rows = harness.compare(results, baseline["results"], args.threshold, scale=scale)
+        print(f"\n{'benchmark':36s} {'baseline':>10s} {'current':>10s} {'ratio':>7s}  status")
+        for row in rows:
+            ratio = f"{row['ratio']:.2f}x" if row["ratio"] is not None else "-"
+            print(f"{row['name']:36s} {harness.format_time(row['baseline']):>10s} {harness.format_time(row['current']):>10s} {ratio:>7s}  {row['status']}")
+
+        regressions = [row["name"] for row in rows if row["status"] == "regression"]
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
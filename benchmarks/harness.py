@@ -0,0 +1,150 @@
+'''
+Minimal benchmark harness: registration, timing, baselines and comparison
+'''
+
+import json
+import platform
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+
+class Benchmark:
+    '''
+    A registered benchmark.
+
+    `setup(folder)` is a generator: it prepares the benchmark in a temporary folder, yields the
+    function to time and cleans up after the yield. `ops` is the number of operations performed
+    by one call of the function, results are reported per operation.
+    '''
+
+    def __init__(self, name: str, setup, ops: int = 1):
+        self.name = name
+        self.setup = setup
+        self.ops = ops
+
+    @contextmanager
+    def prepare(self):
+        with tempfile.TemporaryDirectory() as folder:
+            generator = self.setup(folder)
+            func = next(generator)
+            try:
+                yield func
+            finally:
+                generator.close()
+
+REGISTRY: list[Benchmark] = []
+
+def benchmark(name: str, ops: int = 1):
+    '''
+    Registers a benchmark setup generator (see `Benchmark`).
+    '''
+    def decorator(setup):
+        REGISTRY.append(Benchmark(name, setup, ops))
+        return setup
+    return decorator
+
+def measure(func, ops: int = 1, repeat: int = 7, min_time: float = 0.1) -> dict:
+    '''
+    Times `func`: the number of loops is doubled until one sample takes at least `min_time` seconds,
+    then `repeat` samples are taken. Returns seconds per operation (min and median) and the loops used.
+    '''
+    loops = 1
+    while True:
+        elapsed = _time(func, loops)
+        if elapsed >= min_time or min_time == 0:
+            break
+        loops *= 2
+
+    samples = [elapsed] + [_time(func, loops) for _ in range(repeat - 1)]
+    per_op = [sample / (loops * ops) for sample in samples]
+    return {"min": min(per_op), "median": statistics.median(per_op), "loops": loops, "repeat": repeat}
+
+def run(pattern: str | None = None, repeat: int = 7, min_time: float = 0.1, report=None, names: list[str] | None = None) -> dict[str, dict]:
+    '''
+    Runs the registered benchmarks whose name contains `pattern` (or is in `names`).
+    `report(name, result)` is called after each one.
+    '''
+    results = {}
+    for bench in REGISTRY:
+        if pattern and pattern not in bench.name:
+            continue
+        if names is not None and bench.name not in names:
+            continue
+        with bench.prepare() as func:
+            result = measure(func, bench.ops, repeat, min_time)
+        results[bench.name] = result
+        if report is not None:
+            report(bench.name, result)
+    return results
+
+def calibrate(repeat: int = 7, min_time: float = 0.1) -> float:
+    '''
+    Times a fixed pure-Python workload (seconds per call). Stored with a baseline, it scales the
+    comparison to the speed of the current machine.
+    '''
+    return measure(_calibration_workload, repeat=repeat, min_time=min_time)["min"]
+
+def save(results: dict[str, dict], path: str, calibration: float | None = None) -> None:
+    '''
+    Stores results as a baseline, with the `calibrate()` time of the machine that recorded them.
+    '''
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"machine": machine_info(), "calibration": calibration, "results": results}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+def load(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], threshold: float, statistic: str = "min", scale: float = 1.0) -> list[dict]:
+    '''
+    Compares results with a baseline. A benchmark regressed when it is more than `threshold`
+    (a fraction, 0.25 = 25%) slower than its baseline. `scale` is the current calibration time
+    divided by the baseline one: ratios are relative to the speed of each machine.
+    '''
+    rows = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            rows.append({"name": name, "baseline": None, "current": result[statistic], "ratio": None, "status": "new"})
+            continue
+
+        ratio = result[statistic] / (base[statistic] * scale) if base[statistic] else float("inf")
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append({"name": name, "baseline": base[statistic], "current": result[statistic], "ratio": ratio, "status": status})
+    return rows
+
+def machine_info() -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+def format_time(seconds: float | None) -> str:
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+def _calibration_workload():
+    # Interpreter-bound mix of the work the benchmarks do: calls, attribute and dict access, string formatting
+    values = {}
+    for i in range(200):
+        values[f"key{i}"] = divmod(i * 31, 7)
+    return sum(quotient for quotient, _ in values.values())
+
+def _time(func, loops: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loops):
+        func()
+    return time.perf_counter() - start
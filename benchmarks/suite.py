@@ -0,0 +1,136 @@
+'''
+Benchmarks of the framework overhead, on generated fixture minders
+'''
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from guardin_mind import Mind, MinderSearch
+from guardin_mind.manager import limit_concurrency
+from guardin_mind.mind_utils.module_cache import module_registry
+from benchmarks.harness import benchmark
+
+MINDER_TEMPLATE = '''from guardin_mind.manager import ConfigRead
+
+class {name}:
+    def __init__(self):
+        ConfigRead(self)
+
+    def ask_sync(self, text):
+        return text
+'''
+
+CONFIG_TEMPLATE = '''[minder]
+name = "{name}"
+version = "0.1.0"
+description = "Generated benchmark minder"
+authors = [{{ name = "Benchmark", email = "benchmark@example.org" }}]
+'''
+
+THREADS = 8
+CALLS_PER_THREAD = 500
+ASYNC_CALLS = 1000
+
+def make_minders(mind_folder: str, count: int) -> list[str]:
+    '''
+    Installs `count` generated minders (`Minder0`, `Minder1`, ...) in `<mind_folder>/minders`.
+    '''
+    names = [f"Minder{i}" for i in range(count)]
+    for name in names:
+        folder = os.path.join(mind_folder, "minders", name)
+        os.makedirs(folder)
+        with open(os.path.join(folder, "minder.py"), "w", encoding="utf-8") as f:
+            f.write(MINDER_TEMPLATE.format(name=name))
+        with open(os.path.join(folder, "minder_config.toml"), "w", encoding="utf-8") as f:
+            f.write(CONFIG_TEMPLATE.format(name=name))
+    return names
+
+# Discovery
+
+def _search(installed: int):
+    def setup(folder):
+        names = make_minders(folder, installed)
+        search = MinderSearch(minders_dir=folder)
+        name = names[len(names) // 2]
+        search.search_minder_locally(name) # Builds the index
+        yield lambda: search.search_minder_locally(name)
+    return setup
+
+for _installed in (10, 100, 1000):
+    benchmark(f"search_minder_locally[{_installed}]")(_search(_installed))
+
+@benchmark("search_minder_locally[1000, miss]")
+def search_miss(folder):
+    make_minders(folder, 1000)
+    search = MinderSearch(minders_dir=folder)
+    search.search_minder_locally("Minder0")
+    yield lambda: search.search_minder_locally("NotInstalled")
+
+# Loading
+
+@benchmark("load_minder[cold]")
+def load_cold(folder):
+    make_minders(folder, 1)
+    search = MinderSearch(minders_dir=folder)
+    path = os.path.join(search.search_minder_locally("Minder0"), "minder.py")
+
+    def load():
+        module_registry.invalidate(path) # Forces the module to be executed again
+        search.load_minder(path, "Minder0")
+
+    yield load
+    module_registry.invalidate(path)
+
+@benchmark("load_minder[warm]")
+def load_warm(folder):
+    make_minders(folder, 1)
+    search = MinderSearch(minders_dir=folder)
+    path = os.path.join(search.search_minder_locally("Minder0"), "minder.py")
+    search.load_minder(path, "Minder0")
+    yield lambda: search.load_minder(path, "Minder0")
+    module_registry.invalidate(path)
+
+# Dispatch
+
+@benchmark("mind_getattr[hit]")
+def getattr_hit(folder):
+    make_minders(folder, 1)
+    mind = Mind(path=folder)
+    mind.Minder0
+    yield lambda: mind.Minder0
+
+@benchmark("config_read[instance]")
+def config_read(folder):
+    make_minders(folder, 1)
+    minder_cls = Mind(path=folder).Minder0
+    minder_cls() # Parses and caches the config
+    yield minder_cls
+
+# Concurrency limits
+
+@benchmark("limit_concurrency[threads]", ops=THREADS * CALLS_PER_THREAD)
+def limit_threads(folder):
+    @limit_concurrency(4)
+    def call():
+        pass
+
+    def worker(_):
+        for _ in range(CALLS_PER_THREAD):
+            call()
+
+    pool = ThreadPoolExecutor(max_workers=THREADS)
+    yield lambda: list(pool.map(worker, range(THREADS)))
+    pool.shutdown()
+
+@benchmark("limit_concurrency[asyncio]", ops=ASYNC_CALLS)
+def limit_asyncio(folder):
+    @limit_concurrency(4)
+    async def call():
+        await asyncio.sleep(0)
+
+    async def drive():
+        await asyncio.gather(*(call() for _ in range(ASYNC_CALLS)))
+
+    loop = asyncio.new_event_loop()
+    yield lambda: loop.run_until_complete(drive())
+    loop.close()
@@ -1,4 +1,4 @@
 from .mind import Mind, MinderSearch
-from .mind_utils.exceptions import MindVersionError, PythonVersionError
+from .mind_utils.exceptions import MindVersionError, PythonVersionError, MinderDependencyError, ArchiveDownloadError, LockfileError, QueueFullError, DeadlineExceededError, RateLimitExceededError, CallTimeoutError
 
 __version__ = "1.0.5"
@@ -1,20 +1,65 @@
 import argparse
-from guardin_mind.package_manager import install_minder, uninstall_minder
-from pydantic import ValidationError
-from colorama import Fore, Style, init
 from guardin_mind import __version__
+from guardin_mind.configs import _default_socket_path
+
+# Heavy dependencies (requests, pydantic, packaging, colorama) are imported
+# only by the subcommands that need them, to keep CLI startup fast
+
+def print_error(e: Exception) -> None:
+    from colorama import Fore, Style
+
+    print(Fore.RED + f"ERROR: {e}" + Style.RESET_ALL)
 
 def install_command(args):
-    # Iterate through the list of minders to install each one
+    from guardin_mind.package_manager import install_minders, install_locked
+    from pydantic import ValidationError
+
+    if args.locked:
+        # Install the exact commits and packages of the lockfile
+        try:
+            install_locked(args.lockfile, args.path, args.author_minder or None, args.jobs, args.offline, args.cache_dir, args.wheel_dir)
+        except ValidationError as e:
+            print(e)
+        except Exception as e:
+            print_error(e)
+        return
+
+    # Install all minders with one shared dependency resolution pass
+    try:
+        install_minders(args.author_minder, args.path, args.jobs)
+        return
+    except ValidationError as e:
+        print(e)
+        return
+    except Exception as e:
+        if len(args.author_minder) == 1:
+            print_error(e)
+            return
+
+    # One minder failed: install the others one by one, reporting every failure
     for minder in args.author_minder:
         try:
-            install_minder(minder, args.path)
+            install_minders([minder], args.path, args.jobs)
         except ValidationError as e:
             print(e)
-        except:
-            pass
+        except Exception as e:
+            print_error(e)
+
+def lock_command(args):
+    from guardin_mind.package_manager import lock_minders
+    from pydantic import ValidationError
+
+    try:
+        lock_minders(args.author_minder, args.output, args.jobs, args.branch, args.cache_dir, args.wheel_dir)
+    except ValidationError as e:
+        print(e)
+    except Exception as e:
+        print_error(e)
 
 def uninstall_command(args):
+    from guardin_mind.package_manager import uninstall_minder
+    from pydantic import ValidationError
+
     # Iterate through the list of minders to uninstall each one
     for minder in args.author_minder:
         try:
@@ -24,7 +69,71 @@ def uninstall_command(args):
         except:
             pass
 
+def serve_command(args):
+    from guardin_mind.mind_utils.ipc import MindServer
+
+    # Host one Mind for every local process (blocks until interrupted)
+    server = MindServer(args.socket, path=args.path, preload=args.preload, workers=args.workers)
+    print(f"Serving Mind on {server.socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+def parse_cli_value(value: str):
+    import ast
+
+    # Python literals (numbers, lists, ...) are converted, anything else stays a string
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return value
+
+def profile_command(args):
+    import asyncio
+    import inspect
+    from concurrent.futures import ThreadPoolExecutor
+    from guardin_mind import Mind
+
+    mind = Mind(path=args.path)
+    profiler = mind.enable_profiling([args.minder], [args.method], sampling_interval=args.interval)
+
+    # The minder class is found through MinderSearch.get_minder
+    minder = getattr(mind, args.minder)()
+    method = getattr(minder, args.method)
+    call_args = [parse_cli_value(value) for value in args.args]
+
+    # Drive the method with N calls, `concurrency` at a time
+    if inspect.iscoroutinefunction(method):
+        async def drive():
+            semaphore = asyncio.Semaphore(args.concurrency)
+
+            async def call():
+                async with semaphore:
+                    await method(*call_args)
+
+            await asyncio.gather(*(call() for _ in range(args.iterations)))
+
+        asyncio.run(drive())
+    else:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            list(pool.map(lambda _: method(*call_args), range(args.iterations)))
+
+    profiler.stop()
+
+    output = args.output or f"{args.minder}.{args.method}"
+    profiler.dump_stats(f"{output}.pstats")
+    profiler.write_collapsed(f"{output}.collapsed")
+
+    timing = profiler.timings()[args.minder][args.method]
+    print(f"{args.minder}.{args.method}: {timing['calls']} calls, {timing['errors']} errors")
+    print(f"    wall {timing['wall_time']:.4f}s, cpu {timing['cpu_time']:.4f}s, await {timing['await_time']:.4f}s")
+    profiler.stats().sort_stats("cumulative").print_stats(args.top)
+    print(f"Profile written to {output}.pstats, collapsed stacks to {output}.collapsed")
+
 def version_command(args):
+    from colorama import Fore, Style, init
+
     init(autoreset=True)
 
     print(f"{Style.BRIGHT}Guardin Mind{Style.RESET_ALL} (version {Fore.CYAN}{__version__}{Style.RESET_ALL})")
@@ -46,7 +155,7 @@ def main():
     install_parser = subparsers.add_parser("install", help="Install minder")
     install_parser.add_argument(
         "author_minder",
-        nargs="+",  # One or more minders can be provided
+        nargs="*",  # One or more minders can be provided, none with --locked
         help="The name(s) of the minder(s) to install. Format: `author_MinderName`."
     )
     install_parser.add_argument(
@@ -54,8 +163,74 @@ def main():
         help="Absolute path to the folder for installing minders", 
         default=None
     )
+    install_parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        help="Maximum number of minders downloaded in parallel",
+        default=8
+    )
+    install_parser.add_argument(
+        "--locked",
+        action="store_true",
+        help="Install the minders of the lockfile (all of them by default) at their locked commits"
+    )
+    install_parser.add_argument(
+        "--lockfile",
+        help="Path of the lockfile used with --locked",
+        default="mind.lock"
+    )
+    install_parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="With --locked, no network access: archives from the local archive cache, Python packages from --wheel-dir"
+    )
+    install_parser.add_argument(
+        "--cache-dir",
+        help="Folder of the archive cache (e.g. shared by several machines)",
+        default=None
+    )
+    install_parser.add_argument(
+        "--wheel-dir",
+        help="With --locked, folder of the Python packages downloaded by `mind lock --wheel-dir`",
+        default=None
+    )
     install_parser.set_defaults(func=install_command)
 
+    # Define 'lock' subcommand parser
+    lock_parser = subparsers.add_parser("lock", help="Pin minders and their dependencies in a lockfile")
+    lock_parser.add_argument(
+        "author_minder",
+        nargs="+",  # One or more minders can be provided
+        help="The name(s) of the minder(s) to lock. Format: `author_MinderName`."
+    )
+    lock_parser.add_argument(
+        "-o", "--output",
+        help="Path of the lockfile",
+        default="mind.lock"
+    )
+    lock_parser.add_argument(
+        "--branch",
+        help="Branch of the minder repositories to lock",
+        default="main"
+    )
+    lock_parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        help="Maximum number of minders downloaded in parallel",
+        default=8
+    )
+    lock_parser.add_argument(
+        "--cache-dir",
+        help="Folder of the archive cache",
+        default=None
+    )
+    lock_parser.add_argument(
+        "--wheel-dir",
+        help="Download the locked Python packages into this folder, for `mind install --locked --offline`",
+        default=None
+    )
+    lock_parser.set_defaults(func=lock_command)
+
     # Define 'uninstall' subcommand parser
     uninstall_parser = subparsers.add_parser("uninstall", help="Uninstall minder")
     uninstall_parser.add_argument(
@@ -75,9 +250,84 @@ def main():
     )
     uninstall_parser.set_defaults(func=uninstall_command)
 
+    # Define 'serve' subcommand parser
+    serve_parser = subparsers.add_parser("serve", help="Share loaded minders with local processes")
+    serve_parser.add_argument(
+        "--socket",
+        help="Path of the Unix domain socket (owner-only, every client can run code in the server)",
+        default=_default_socket_path
+    )
+    serve_parser.add_argument(
+        "--path",
+        help="Absolute path to the mind folder with installed minders",
+        default=None
+    )
+    serve_parser.add_argument(
+        "--preload",
+        nargs="*",
+        help="Minders instantiated when the server starts",
+        default=[]
+    )
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of threads running sync minder methods",
+        default=None
+    )
+    serve_parser.set_defaults(func=serve_command)
+
+    # Define 'profile' subcommand parser
+    profile_parser = subparsers.add_parser("profile", help="Profile a minder method")
+    profile_parser.add_argument("minder", help="Name of the minder")
+    profile_parser.add_argument("method", help="Name of the method to call")
+    profile_parser.add_argument(
+        "--args",
+        nargs="*",
+        help="Positional arguments of the method (Python literals or strings)",
+        default=[]
+    )
+    profile_parser.add_argument(
+        "--path",
+        help="Absolute path to the mind folder with installed minders",
+        default=None
+    )
+    profile_parser.add_argument(
+        "-n", "--iterations",
+        type=int,
+        help="Number of calls",
+        default=100
+    )
+    profile_parser.add_argument(
+        "-c", "--concurrency",
+        type=int,
+        help="Number of concurrent calls (threads or coroutines)",
+        default=1
+    )
+    profile_parser.add_argument(
+        "--interval",
+        type=float,
+        help="Seconds between stack samples",
+        default=0.001
+    )
+    profile_parser.add_argument(
+        "-o", "--output",
+        help="Output path prefix, `<Minder>.<method>` by default",
+        default=None
+    )
+    profile_parser.add_argument(
+        "--top",
+        type=int,
+        help="Number of functions printed",
+        default=15
+    )
+    profile_parser.set_defaults(func=profile_command)
+
     # Parse the CLI arguments and execute the selected subcommand function
     args = parser.parse_args()
 
+    if args.command == "install" and not args.author_minder and not args.locked:
+        install_parser.error("the following arguments are required: author_minder (or --locked)")
+
     if args.version:
         version_command(args)
     elif hasattr(args, "func"):
@@ -1,16 +1,29 @@
 import os
-import platform
 from pathlib import Path
 
 # Default mind folder
-if platform.system() == "Windows":
-    user_profile = Path.home()
-else:
-    user_profile = Path.home()
-_default_mind_folder = Path(user_profile) / ".guardin_mind"
+_default_mind_folder = Path.home() / ".guardin_mind"
 _default_minders_folder = (_default_mind_folder / "minders") # Folder for minders installation
-_default_minders_folder.mkdir(parents=True, exist_ok=True)
 
 # To string
 _default_mind_folder = str(_default_mind_folder)
 _default_minders_folder = str(_default_minders_folder)
+
+def ensure_minders_folder(minders_folder: str = _default_minders_folder) -> str:
+    """
+    Creates the minders folder on first use (not at import time) and returns its path
+    """
+    os.makedirs(minders_folder, exist_ok=True)
+    return minders_folder
+
+# Unix domain socket of `mind serve`
+_default_socket_path = str(Path(_default_mind_folder) / "mind.sock")
+
+# Local caches (downloaded minder archives, etc.)
+_default_cache_folder = str(Path(_default_mind_folder) / "cache")
+
+# Template of the minder archive URL. Can point to a mirror or a local stand-in server
+_archive_url_template = os.environ.get("GUARDIN_MIND_ARCHIVE_URL", "https://github.com/{repo}/archive/{ref}.zip")
+
+# Template of the URL resolving a minder branch to its latest commit (GitHub API, JSON with a `sha` field)
+_commit_url_template = os.environ.get("GUARDIN_MIND_COMMIT_URL", "https://api.github.com/repos/{repo}/commits/{branch}")
@@ -1 +1,6 @@
-from .manager import ConfigRead, limit_concurrency
\ No newline at end of file
+from .manager import ConfigRead, MinderConfig, ConcurrencyLimiter, limit_concurrency, is_cancelled
+from .scheduler import PriorityScheduler, schedule
+from .adaptive import AdaptiveLimiter, adaptive_limit
+from .rate_limit import TokenBucket, RateLimiter, rate_limit
+from .cache import MemoCache, memoize
+from .batching import Batcher, batch
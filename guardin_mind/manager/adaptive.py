@@ -0,0 +1,214 @@
+import inspect
+import math
+import time
+from functools import wraps
+from guardin_mind.manager.manager import ConcurrencyLimiter
+
+class AdaptiveLimiter(ConcurrencyLimiter):
+    """
+    A ConcurrencyLimiter whose limit follows the observed latency and error rate (like Netflix concurrency-limits).
+
+    Every call reports its latency and outcome with `record()`, and the limit is adjusted between `min_limit` and `max_limit`:
+
+    - "aimd": additive increase, multiplicative decrease. While the limiter is busy (at least half of the
+      slots in flight), every successful call raises the limit by 1/limit, about +1 per `limit` calls.
+      An error, or a call slower than `latency_target`, multiplies the limit by `backoff`. Without a
+      `latency_target`, the short-term average latency above `tolerance` times the no-load latency
+      (measured like in "gradient") counts as slow.
+    - "gradient": compares the short-term average latency with the no-load latency (the lowest recent
+      average, drifting up slowly so that a permanently slower downstream is accepted). The limit is scaled
+      by their ratio (clamped to 0.5..1, latencies up to `tolerance` times the no-load one are not penalised),
+      plus a headroom of sqrt(limit) to probe for more capacity, and smoothed. Errors multiply it by `backoff`.
+
+    The limit is decreased at most once per `limit` calls, so the calls that were already in flight when
+    the downstream degraded do not divide it again. The current limit is `max_concurrent` (also in `stats()`,
+    where `drops` counts the times it was lowered).
+    """
+
+    ALGORITHMS = ("aimd", "gradient")
+
+    def __init__(
+            self,
+            initial_limit: int = 10,
+            min_limit: int = 1,
+            max_limit: int = 200,
+            algorithm: str = "aimd",
+            latency_target: float | None = None, # AIMD: seconds above which a call counts as a drop, derived from the no-load latency if None
+            backoff: float = 0.9, # Factor applied to the limit on a drop
+            smoothing: float = 0.2, # Gradient: weight of a new limit estimate
+            tolerance: float = 1.5, # Latency increase (ratio) over the no-load latency tolerated without lowering the limit
+            short_window: int = 10, # Number of calls of the short-term latency average
+            long_window: int = 500 # Number of calls over which the no-load latency drifts up
+        ):
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unknown adaptive algorithm: {algorithm} (expected one of {', '.join(self.ALGORITHMS)})")
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+
+        super().__init__(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.algorithm = algorithm
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self.smoothing = smoothing
+        self.tolerance = tolerance
+        self._short_alpha = 2 / (short_window + 1)
+        self._long_alpha = 2 / (long_window + 1)
+
+        self._estimate = float(initial_limit) # Fractional limit, the effective limit is its integer part
+        self._short_latency = None
+        self._no_load_latency = None
+        self._last_drop = None # Sample number of the last decrease
+
+        # Counters
+        self._samples = 0
+        self._errors = 0
+        self._drops = 0
+
+    def record(self, latency: float, error: bool = False) -> None:
+        """
+        Reports a finished call (before its slot is released) and adjusts the limit.
+
+        Args:
+            latency (float): Call duration in seconds.
+            error (bool): The call failed.
+        """
+        with self._lock:
+            self._samples += 1
+            if error:
+                self._errors += 1
+
+            self._observe_locked(latency)
+            if self.algorithm == "aimd":
+                estimate = self._aimd_locked(latency, error)
+            else:
+                estimate = self._gradient_locked(latency, error)
+
+            previous = self._limit
+            self._set_limit_locked(estimate)
+            if self._limit < previous:
+                self._drops += 1
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        with self._lock:
+            stats.update({
+                "algorithm": self.algorithm,
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "samples": self._samples,
+                "errors": self._errors,
+                "drops": self._drops,
+                "latency_avg": self._short_latency,
+                "latency_no_load": self._no_load_latency,
+            })
+        return stats
+
+    # Limit algorithms, called with self._lock held
+
+    def _observe_locked(self, latency: float) -> None:
+        # Short-term average latency and no-load latency (lowest recent average, drifting up slowly)
+        if self._short_latency is None:
+            self._short_latency = self._no_load_latency = latency
+        else:
+            self._short_latency += self._short_alpha * (latency - self._short_latency)
+            if self._short_latency < self._no_load_latency:
+                self._no_load_latency = self._short_latency
+            else:
+                self._no_load_latency += self._long_alpha * (self._short_latency - self._no_load_latency)
+
+    def _aimd_locked(self, latency: float, error: bool) -> float:
+        if self.latency_target is not None:
+            slow = latency > self.latency_target
+        else:
+            slow = self._short_latency > self.tolerance * self._no_load_latency
+        if error or slow:
+            return self._drop_locked()
+        if self._busy_locked():
+            return self._estimate + 1 / self._estimate
+        return self._estimate
+
+    def _gradient_locked(self, latency: float, error: bool) -> float:
+        if error:
+            return self._drop_locked()
+
+        gradient = max(0.5, min(1.0, self.tolerance * self._no_load_latency / self._short_latency)) if self._short_latency > 0 else 1.0
+        target = self._estimate * gradient + math.sqrt(self._estimate)
+        if gradient == 1.0 and not self._busy_locked():
+            # Not limited by the limiter: no evidence that more concurrency would be handled
+            target = min(target, self._estimate)
+        return self._estimate * (1 - self.smoothing) + target * self.smoothing
+
+    def _drop_locked(self) -> float:
+        # Multiplicative decrease, once per window of `limit` calls
+        if self._last_drop is not None and self._samples - self._last_drop < self._limit:
+            return self._estimate
+        self._last_drop = self._samples
+        return self._estimate * self.backoff
+
+    def _busy_locked(self) -> bool:
+        # The reporting call is still in flight
+        return self._in_flight * 2 >= self._limit
+
+    def _set_limit_locked(self, estimate: float) -> None:
+        self._estimate = min(max(estimate, float(self.min_limit)), float(self.max_limit))
+        limit = int(self._estimate)
+        if limit != self._limit:
+            self._limit = limit
+            # A higher limit frees slots for the queued calls
+            self._dispatch_locked()
+
+def adaptive_limit(initial_limit: int | AdaptiveLimiter = 10, **options):
+    """
+    Limits the number of concurrent calls of the decorated sync and async functions with a limit
+    adjusted from their latency and errors (see AdaptiveLimiter for the options).
+
+    Sync and async callers share the same budget. Pass an AdaptiveLimiter instance to share one
+    limit between several methods. The limiter is available as `wrapper.limiter`.
+    """
+    if isinstance(initial_limit, AdaptiveLimiter):
+        limiter = initial_limit
+    else:
+        limiter = AdaptiveLimiter(initial_limit, **options)
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                await limiter.acquire_async()
+                start = time.perf_counter()
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception:
+                    limiter.record(time.perf_counter() - start, error=True)
+                    raise
+                else:
+                    limiter.record(time.perf_counter() - start)
+                    return result
+                finally:
+                    # Also on cancellation, which is not reported as an error
+                    limiter.release()
+            async_wrapper.limiter = limiter
+            return async_wrapper
+        else:
+            @wraps(func)
+            def sync_wrapper(*args, **kwargs):
+                limiter.acquire()
+                start = time.perf_counter()
+                try:
+                    result = func(*args, **kwargs)
+                except Exception:
+                    limiter.record(time.perf_counter() - start, error=True)
+                    raise
+                else:
+                    limiter.record(time.perf_counter() - start)
+                    return result
+                finally:
+                    limiter.release()
+            sync_wrapper.limiter = limiter
+            return sync_wrapper
+
+    return decorator
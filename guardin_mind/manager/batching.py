@@ -0,0 +1,174 @@
+import asyncio
+import inspect
+import threading
+from functools import wraps
+
+class _Batch:
+    """
+    Items collected for one call of the batch implementation
+    """
+    __slots__ = ("context", "items", "futures", "timer", "full", "done", "results", "error")
+
+    def __init__(self, context: tuple, sync: bool = False):
+        self.context = context # Leading arguments (e.g. `self`), shared by the whole batch
+        self.items = []
+        self.futures = [] # Futures of the async callers
+        self.timer = None
+        self.full = threading.Event() if sync else None # Events of the sync callers
+        self.done = threading.Event() if sync else None
+        self.results = None
+        self.error = None
+
+class Batcher:
+    """
+    Collects individual calls into batches by size or time window and counts them
+    """
+
+    def __init__(self, max_size: int, max_wait: float):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.max_wait = max_wait
+
+        self._lock = threading.Lock()
+        self._pending: dict = {} # (loop id, context ids) -> _Batch being filled
+        self._tasks: set = set() # Running async batches, event loops only keep weak references to tasks
+        self.batches = 0
+        self.items = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_size": self.max_size,
+                "max_wait": self.max_wait,
+                "batches": self.batches,
+                "items": self.items,
+                "avg_batch_size": self.items / self.batches if self.batches else 0.0,
+            }
+
+    def _count(self, batch: _Batch) -> None:
+        with self._lock:
+            self.batches += 1
+            self.items += len(batch.items)
+
+    @staticmethod
+    def _check_results(batch: _Batch, results) -> list:
+        results = list(results)
+        if len(results) != len(batch.items):
+            raise ValueError(f"Batch implementation returned {len(results)} results for {len(batch.items)} items")
+        return results
+
+def batch(max_size: int = 32, max_wait: float = 0.005):
+    """
+    Coalesces individual calls into batches.
+
+    The decorated function receives a list of items (after its leading arguments such as `self`)
+    and must return a list of results in the same order. Callers pass a single item and get
+    a single result back:
+
+        @batch(max_size=64, max_wait=0.002)
+        async def embed(self, texts: list[str]) -> list[list[float]]:
+            ...
+
+        vector = await minder.embed("hello")
+
+    A batch is run when it holds `max_size` items or `max_wait` seconds after its first item.
+    Async callers are batched per event loop, sync callers from any threads are batched together
+    (the first caller of a batch runs it). Calls with different leading arguments are never mixed.
+    The batcher is available as `wrapper.batcher`.
+    """
+
+    def decorator(func):
+        batcher = Batcher(max_size, max_wait)
+
+        if inspect.iscoroutinefunction(func):
+            async def run(batch: _Batch) -> None:
+                try:
+                    results = Batcher._check_results(batch, await func(*batch.context, batch.items))
+                except BaseException as e:
+                    for future in batch.futures:
+                        if not future.done():
+                            future.set_exception(e)
+                    if not isinstance(e, Exception):
+                        raise
+                    return
+                for future, result in zip(batch.futures, results):
+                    if not future.done():
+                        future.set_result(result)
+
+            def flush(loop, key, batch: _Batch) -> None:
+                with batcher._lock:
+                    if batcher._pending.get(key) is batch:
+                        del batcher._pending[key]
+                batcher._count(batch)
+                task = loop.create_task(run(batch))
+                batcher._tasks.add(task)
+                task.add_done_callback(batcher._tasks.discard)
+
+            @wraps(func)
+            async def async_wrapper(*args):
+                *context, item = args
+                loop = asyncio.get_running_loop()
+                key = (id(loop), *map(id, context))
+                future = loop.create_future()
+
+                with batcher._lock:
+                    current = batcher._pending.get(key)
+                    if current is None:
+                        current = batcher._pending[key] = _Batch(tuple(context))
+                        current.timer = loop.call_later(batcher.max_wait, flush, loop, key, current)
+                    current.items.append(item)
+                    current.futures.append(future)
+                    is_full = len(current.items) >= batcher.max_size
+
+                if is_full:
+                    current.timer.cancel()
+                    flush(loop, key, current)
+
+                return await future
+
+            async_wrapper.batcher = batcher
+            return async_wrapper
+        else:
+            @wraps(func)
+            def sync_wrapper(*args):
+                *context, item = args
+                key = (None, *map(id, context))
+
+                with batcher._lock:
+                    current = batcher._pending.get(key)
+                    leader = current is None
+                    if leader:
+                        current = batcher._pending[key] = _Batch(tuple(context), sync=True)
+                    index = len(current.items)
+                    current.items.append(item)
+                    if len(current.items) >= batcher.max_size:
+                        # Close the batch, no more items are added
+                        del batcher._pending[key]
+                        current.full.set()
+
+                if not leader:
+                    current.done.wait()
+                else:
+                    # The first caller waits for the window (or a full batch) and runs the batch
+                    current.full.wait(batcher.max_wait)
+                    with batcher._lock:
+                        if batcher._pending.get(key) is current:
+                            del batcher._pending[key]
+                    batcher._count(current)
+                    try:
+                        current.results = Batcher._check_results(current, func(*current.context, current.items))
+                    except BaseException as e:
+                        current.error = e
+                    finally:
+                        current.done.set()
+
+                if current.error is not None:
+                    raise current.error
+                return current.results[index]
+
+            sync_wrapper.batcher = batcher
+            return sync_wrapper
+
+    return decorator
@@ -0,0 +1,319 @@
+import asyncio
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from functools import wraps
+from guardin_mind.configs import _default_cache_folder
+
+_MISSING = object()
+
+class _InFlight:
+    """
+    A sync call being computed by one thread while identical calls wait for its result
+    """
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+class _InstanceRef(weakref.ref):
+    """
+    Weak reference standing for a minder instance in memory keys, one per live instance,
+    so cached results do not keep instances alive and work for unhashable instances
+    """
+    __slots__ = ("key",)
+
+    def __init__(self, obj, callback):
+        super().__init__(obj, callback)
+        self.key = id(obj)
+
+    def __hash__(self):
+        return self.key
+
+    def __eq__(self, other):
+        return self is other
+
+class MemoCache:
+    """
+    Size-bounded LRU cache with TTL, hit/miss/eviction counters and an optional on-disk tier.
+
+    The disk tier stores one pickle file per key under `disk_folder`, so cached results survive
+    process restarts and are shared by every process using the same mind folder.
+    """
+
+    def __init__(self, maxsize: int | None = 128, ttl: float | None = None, disk_folder: str | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.disk_folder = disk_folder
+
+        self._lock = threading.Lock()
+        self._data: OrderedDict = OrderedDict() # key -> (expires_at (time.monotonic) | None, value)
+        self._in_flight: dict = {} # key -> _InFlight | asyncio.Task
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.disk_hits = 0
+        self.shared = 0 # Calls that joined an identical in-flight call
+
+    def get(self, key, disk_key: str | None = None):
+        """
+        Returns the cached value or `_MISSING`, counting hits and misses
+        """
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+                self.expirations += 1
+
+        if disk_key is not None:
+            value = self._disk_get(disk_key)
+            if value is not _MISSING:
+                with self._lock:
+                    self.hits += 1
+                    self.disk_hits += 1
+                self._memory_set(key, value)
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return _MISSING
+
+    def set(self, key, value, disk_key: str | None = None) -> None:
+        self._memory_set(key, value)
+        if disk_key is not None:
+            self._disk_set(disk_key, value)
+
+    def clear(self) -> None:
+        """
+        Drops every in-memory entry (the disk tier is kept)
+        """
+        with self._lock:
+            self._data.clear()
+
+    def discard_owner(self, owner) -> None:
+        """
+        Drops the in-memory entries of one instance (its results can no longer be requested)
+        """
+        with self._lock:
+            for key in [key for key in self._data if key[0] is owner]:
+                del self._data[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "disk_hits": self.disk_hits,
+                "shared": self.shared,
+            }
+
+    def _memory_set(self, key, value) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def _disk_path(self, disk_key: str) -> str:
+        return os.path.join(self.disk_folder, f"{disk_key}.pkl")
+
+    def _disk_get(self, disk_key: str):
+        try:
+            with open(self._disk_path(disk_key), "rb") as f:
+                expires_at, value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            return _MISSING
+
+        # The disk tier uses wall-clock time, it must survive restarts
+        if expires_at is not None and expires_at <= time.time():
+            return _MISSING
+        return value
+
+    def _disk_set(self, disk_key: str, value) -> None:
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        try:
+            data = pickle.dumps((expires_at, value))
+            os.makedirs(self.disk_folder, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.disk_folder, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._disk_path(disk_key))
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            # Unpicklable results are only cached in memory
+            pass
+
+def memoize(maxsize: int | None = 128, ttl: float | None = None, key=None, disk: bool = False, disk_namespace: str | None = None, disk_folder: str | None = None):
+    """
+    Memoizes sync and async minder methods.
+
+    Args:
+        maxsize (int | None): Maximum number of in-memory results, least recently used are evicted first (None - unbounded).
+        ttl (float | None): Seconds a result stays valid (None - forever).
+        key (callable | None): Builds the cache key from the call arguments (`key(*args, **kwargs)`).
+            By default the positional and keyword arguments are used, they must be hashable. Methods
+            are also keyed by their instance (held by a weak reference, its results are dropped with it).
+        disk (bool): Also store results on disk under `<mind_folder>/cache/memoize`, so they survive restarts.
+            Results and keys must be picklable. The disk tier is shared by every instance and process,
+            so with `disk=True` `self` is not part of the default key in either tier.
+        disk_namespace (str | None): Folder of the disk tier, the function qualified name by default.
+        disk_folder (str | None): Root folder of the disk tier.
+
+    Concurrent identical calls share one underlying call: threads wait for the first caller,
+    coroutines await one shared task. The cache is available as `wrapper.cache`.
+    """
+
+    def decorator(func):
+        folder = None
+        if disk:
+            folder = os.path.join(disk_folder or os.path.join(_default_cache_folder, "memoize"), disk_namespace or func.__qualname__)
+        cache = MemoCache(maxsize, ttl, folder)
+
+        parameters = list(inspect.signature(func).parameters)
+        skip_self = bool(parameters) and parameters[0] == "self"
+
+        # One weak reference per live instance of a memoized method
+        owners: dict[int, _InstanceRef] = {}
+        owners_lock = threading.Lock()
+
+        def forget_owner(owner: _InstanceRef) -> None:
+            with owners_lock:
+                if owners.get(owner.key) is owner:
+                    del owners[owner.key]
+            cache.discard_owner(owner)
+
+        def owner_of(instance):
+            with owners_lock:
+                owner = owners.get(id(instance))
+                if owner is None or owner() is not instance:
+                    try:
+                        owner = owners[id(instance)] = _InstanceRef(instance, forget_owner)
+                    except TypeError:
+                        # Not weakly referenceable (__slots__ without __weakref__): held by the cache
+                        return instance
+                return owner
+
+        def make_keys(args, kwargs):
+            owner = None
+            if key is not None:
+                call_key = key(*args, **kwargs)
+            else:
+                call_args = args
+                if skip_self and args:
+                    call_args = args[1:]
+                    if not disk:
+                        owner = owner_of(args[0])
+                # Keyword arguments always get their own slot, so they never collide with positional ones
+                call_key = (call_args, tuple(sorted(kwargs.items())))
+            memory_key = (owner, call_key)
+            hash(memory_key) # Unhashable arguments raise TypeError
+
+            disk_key = None
+            if disk:
+                try:
+                    disk_key = hashlib.sha256(pickle.dumps(call_key)).hexdigest()
+                except (pickle.PicklingError, TypeError, AttributeError):
+                    pass
+            return memory_key, disk_key
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    memory_key, disk_key = make_keys(args, kwargs)
+                except TypeError:
+                    # Uncacheable arguments
+                    return await func(*args, **kwargs)
+
+                value = cache.get(memory_key, disk_key)
+                if value is not _MISSING:
+                    return value
+
+                # One underlying call per key and event loop, shielded from the cancellation of single callers
+                loop = asyncio.get_running_loop()
+                flight_key = (id(loop), memory_key)
+                with cache._lock:
+                    task = cache._in_flight.get(flight_key)
+                    if task is None:
+                        task = loop.create_task(func(*args, **kwargs))
+                        cache._in_flight[flight_key] = task
+                        task.add_done_callback(lambda t: _finish_task(cache, flight_key, memory_key, disk_key, t))
+                    else:
+                        cache.shared += 1
+
+                return await asyncio.shield(task)
+
+            async_wrapper.cache = cache
+            return async_wrapper
+        else:
+            @wraps(func)
+            def sync_wrapper(*args, **kwargs):
+                try:
+                    memory_key, disk_key = make_keys(args, kwargs)
+                except TypeError:
+                    # Uncacheable arguments
+                    return func(*args, **kwargs)
+
+                value = cache.get(memory_key, disk_key)
+                if value is not _MISSING:
+                    return value
+
+                with cache._lock:
+                    flight = cache._in_flight.get(memory_key)
+                    leader = flight is None
+                    if leader:
+                        flight = cache._in_flight[memory_key] = _InFlight()
+                    else:
+                        cache.shared += 1
+
+                if not leader:
+                    # Wait for the identical call already running in another thread
+                    flight.event.wait()
+                    if flight.error is not None:
+                        raise flight.error
+                    return flight.value
+
+                try:
+                    flight.value = func(*args, **kwargs)
+                    cache.set(memory_key, flight.value, disk_key)
+                    return flight.value
+                except BaseException as e:
+                    flight.error = e
+                    raise
+                finally:
+                    with cache._lock:
+                        cache._in_flight.pop(memory_key, None)
+                    flight.event.set()
+
+            sync_wrapper.cache = cache
+            return sync_wrapper
+
+    return decorator
+
+def _finish_task(cache: MemoCache, flight_key, memory_key, disk_key, task) -> None:
+    # Done callback of a shared async call: store the result and forget the in-flight task
+    with cache._lock:
+        cache._in_flight.pop(flight_key, None)
+    if not task.cancelled() and task.exception() is None:
+        cache.set(memory_key, task.result(), disk_key)
@@ -1,13 +1,89 @@
 import threading
+import time
+import sys
+import contextvars
+import weakref
+from collections import deque
+from dataclasses import dataclass, fields
 from functools import wraps
+from types import MappingProxyType
 import os
 import tomllib
 import inspect
 import asyncio
+from guardin_mind.mind_utils.exceptions import CallTimeoutError
+
+@dataclass(frozen=True)
+class MinderConfig:
+    """
+    Immutable parsed [minder] section of a minder_config.toml, shared by every instance of a minder
+    """
+    name: str
+    version: str
+    description: str | None = None
+    authors: tuple | None = None
+    readme: str | None = None
+    urls: tuple | None = None
+    license: str | None = None
+    python: str | None = None # Required python version
+    mind: str | None = None # Required mind version
+    install_requires: tuple | None = None # List of required libraries
+    requires_minders: tuple | None = None # List of required minders
+
+    def items(self):
+        """
+        Yields (attribute name, value) of the fields present in the config file
+        """
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if value is not None:
+                yield field.name, value
+
+def _freeze(value):
+    # Lists become tuples and tables become read-only mappings, so the shared config cannot be mutated
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+def _thaw(value):
+    # Mutable copy of a frozen value, with the types tomllib returns (lists and dicts)
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+class _ConfigField:
+    """
+    Class attribute resolving a config field from the MinderConfig of the instance (`__minder_config__`).
+    Lists and tables are copied into the instance on first access (like functools.cached_property),
+    so instances can change them without changing the shared config.
+    """
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = getattr(instance.__dict__.get("__minder_config__"), self.name, None)
+        if value is None:
+            raise AttributeError(f"'{type(instance).__name__}' object has no attribute '{self.name}'")
+        if isinstance(value, (tuple, MappingProxyType)):
+            value = instance.__dict__[self.name] = _thaw(value)
+        return value
 
 class ConfigRead:
     """
     Reads the minder config and writes them to the given target object (like Template)
+
+    The config is located next to the file that calls ConfigRead (or at an explicit `path`),
+    parsed once per file (re-parsed when the file mtime changes) into one immutable MinderConfig
+    shared between instances (`self.config`, `target.__minder_config__`). The fields are read through
+    class-level descriptors from that shared config: constructing an instance copies nothing.
     """
 
     # Required config fields
@@ -29,20 +105,101 @@ class ConfigRead:
         'requires-minders'   # List of required minders
     ]
 
-    def __init__(self, target):
+    # Parsed configs: path -> ((mtime, size), MinderConfig)
+    _cache: dict[str, tuple[tuple[int, int], MinderConfig]] = {}
+    _cache_lock = threading.Lock()
+
+    # Target class -> (config its descriptors were checked for, fields the class defines itself)
+    _classes = weakref.WeakKeyDictionary()
+
+    def __init__(self, target, path: str | None = None):
         self.target = target
 
-        self.import_dir = os.path.dirname(inspect.stack()[1].filename).replace("\\", "/")
-        self.config_path = f'{self.import_dir}/minder_config.toml'
+        if path is not None:
+            # Explicit config file or minder folder
+            path = os.fspath(path)
+            self.config_path = path if path.endswith(".toml") else f"{path}/minder_config.toml"
+            self.import_dir = os.path.dirname(self.config_path)
+        else:
+            # Directory of the calling file, without materialising the whole stack
+            self.import_dir = os.path.dirname(sys._getframe(1).f_code.co_filename)
+            self.config_path = f'{self.import_dir}/minder_config.toml'
+
+        self.import_dir = self.import_dir.replace("\\", "/")
+        self.config_path = self.config_path.replace("\\", "/")
 
         self.read_config()
 
-    def read_config(self):
+    def read_config(self) -> MinderConfig:
+        config = self.config = ConfigRead.load(self.config_path)
+        target = self.target
+
+        attrs = getattr(target, "__dict__", None)
+        if attrs is None:
+            # No instance dict (__slots__): plain attributes
+            for name, value in config.items():
+                setattr(target, name, _thaw(value))
+            return config
+
+        # Copies made from a previous config are dropped, the descriptors read the new one
+        previous = attrs.get("__minder_config__")
+        if previous is not None and previous is not config:
+            for name, _ in previous.items():
+                attrs.pop(name, None)
+        attrs["__minder_config__"] = config
+
+        # Fields the class defines itself are shadowed per instance, as plain attributes
+        for name in ConfigRead._class_fields(type(target), config):
+            attrs[name] = _thaw(getattr(config, name))
+
+        return config
+
+    @classmethod
+    def _class_fields(cls, target_cls: type, config: MinderConfig) -> tuple[str, ...]:
+        # Installs the field descriptors of `config` on the target class, once per class and config
+        checked = cls._classes.get(target_cls)
+        if checked is not None and checked[0] is config:
+            return checked[1]
+
+        own = []
+        for name, _ in config.items():
+            attr = inspect.getattr_static(target_cls, name, None)
+            if attr is None:
+                setattr(target_cls, name, _ConfigField(name))
+            elif not isinstance(attr, _ConfigField):
+                own.append(name)
+
+        own = tuple(own)
+        cls._classes[target_cls] = (config, own)
+        return own
+
+    @classmethod
+    def load(cls, config_path: str) -> MinderConfig:
+        """
+        Returns the parsed config file, using the cache while the file is unchanged
+        """
         try:
-            with open(self.config_path, 'rb') as f:
+            stat = os.stat(config_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found at: {config_path}")
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        cached = cls._cache.get(config_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        config = cls._parse(config_path)
+        with cls._cache_lock:
+            cls._cache[config_path] = (key, config)
+        return config
+
+    @classmethod
+    def _parse(cls, config_path: str) -> MinderConfig:
+        try:
+            with open(config_path, 'rb') as f:
                 config = tomllib.load(f)
         except FileNotFoundError:
-            raise FileNotFoundError(f"Config file not found at: {self.config_path}")
+            raise FileNotFoundError(f"Config file not found at: {config_path}")
         except tomllib.TOMLDecodeError as e:
             raise ValueError(f"Invalid TOML format: {e}")
 
@@ -51,38 +208,462 @@ class ConfigRead:
         if minder_config is None:
             raise ValueError("Missing [minder] section in config")
 
-        # Assigning required fields
+        # Required fields
         for field in ConfigRead.required_fields:
-            if field in minder_config:
-                setattr(self.target, field.replace('-', '_'), minder_config[field])
-            else:
+            if field not in minder_config:
                 raise ValueError(f"Missing required field: {field}")
 
-        # Assigning optional fields
-        for field in ConfigRead.optional_fields:
-            if field in minder_config:
-                setattr(self.target, field.replace('-', '_'), minder_config[field])
+        # Required and optional fields
+        values = {
+            field.replace('-', '_'): _freeze(minder_config[field])
+            for field in ConfigRead.required_fields + ConfigRead.optional_fields
+            if field in minder_config
+        }
+        return MinderConfig(**values)
+
+class _Waiter:
+    """
+    A queued acquirer of a ConcurrencyLimiter slot: a thread (event) or a coroutine (future bound to its loop)
+    """
+    __slots__ = ("event", "loop", "future", "granted", "cancelled", "enqueued_at", "priority", "deadline")
+
+    def __init__(self, loop=None, priority: int = 0, deadline: float | None = None):
+        self.loop = loop
+        self.future = loop.create_future() if loop is not None else None
+        self.event = threading.Event() if loop is None else None
+        self.granted = False # Set under the limiter lock when the slot is handed over
+        self.cancelled = False # Set under the limiter lock when the waiter gave up or was dropped
+        self.enqueued_at = time.monotonic()
+        self.priority = priority
+        self.deadline = deadline # time.monotonic() after which the waiter is dropped from the queue
+
+    def wake(self) -> bool:
+        # Wakes the waiting thread or coroutine, False if its event loop is closed
+        if self.loop is None:
+            self.event.set()
+            return True
+        try:
+            self.loop.call_soon_threadsafe(_resolve_future, self.future)
+        except RuntimeError:
+            return False
+        return True
+
+def _resolve_future(future):
+    # Runs in the waiter's event loop
+    if not future.done():
+        future.set_result(None)
+
+class ConcurrencyLimiter:
+    """
+    Limits the number of concurrent calls with a single budget shared by threads and any number of event loops.
+
+    Slots are handed out in FIFO order: a released slot is passed directly to the oldest waiter,
+    whether it is a thread or a coroutine running in any loop. Nothing is bound to an event loop
+    until a coroutine actually has to wait, so the limiter can be created at import/decoration time.
+    """
+
+    def __init__(self, max_concurrent: int):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+
+        self._limit = max_concurrent
+        self._lock = threading.Lock()
+        self._queue = deque() # FIFO of _Waiter, cancelled waiters are skipped lazily
+        self._in_flight = 0
+        self._queued = 0
+
+        # Counters
+        self._acquired = 0
+        self._waited = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        self._expired = 0
+        self._timed_out = 0
+        self._timed_out_unstarted = 0
+
+        self._call_threads = None # _CallThreads running the sync calls with a timeout, created on first use
+
+    @property
+    def max_concurrent(self) -> int:
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """
+        Acquires a slot, blocking the current thread. Returns False if the timeout expired.
+        """
+        return self._acquire(timeout)
+
+    async def acquire_async(self, timeout: float | None = None) -> bool:
+        """
+        Acquires a slot without blocking the event loop. Returns False if the timeout expired.
+        """
+        return await self._acquire_async(timeout)
+
+    def _acquire(self, timeout: float | None, priority: int = 0, deadline: float | None = None) -> bool:
+        timeout = self._effective_timeout(timeout, deadline)
+
+        with self._lock:
+            if self._try_acquire_locked():
+                return True
+            if timeout is not None and timeout <= 0:
+                return False
+            waiter = _Waiter(priority=priority, deadline=deadline)
+            self._enqueue_locked(waiter)
+
+        if waiter.event.wait(timeout):
+            # Woken up: either granted a slot or dropped from the queue
+            return waiter.granted
+
+        with self._lock:
+            # The slot may have been handed over right after the timeout
+            if waiter.granted:
+                return True
+            self._cancel_locked(waiter)
+            self._count_expired_locked(deadline)
+        return False
+
+    async def _acquire_async(self, timeout: float | None, priority: int = 0, deadline: float | None = None) -> bool:
+        timeout = self._effective_timeout(timeout, deadline)
 
-def limit_concurrency(max_concurrent: int):
-    # Семофор для синхронных вызовов
-    sync_semaphore = threading.Semaphore(max_concurrent)
-    # Семофор для асинхронных вызовов
-    async_semaphore = asyncio.Semaphore(max_concurrent)
+        with self._lock:
+            if self._try_acquire_locked():
+                return True
+            if timeout is not None and timeout <= 0:
+                return False
+            waiter = _Waiter(asyncio.get_running_loop(), priority, deadline)
+            self._enqueue_locked(waiter)
+
+        try:
+            if timeout is None:
+                await waiter.future
+            else:
+                await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                if waiter.granted:
+                    return True
+                self._cancel_locked(waiter)
+                self._count_expired_locked(deadline)
+            return False
+        except BaseException:
+            # Cancelled while waiting: give the slot back if it was already handed over
+            with self._lock:
+                granted = waiter.granted
+                if not granted:
+                    self._cancel_locked(waiter)
+            if granted:
+                self.release()
+            raise
+
+        return waiter.granted
+
+    @staticmethod
+    def _effective_timeout(timeout: float | None, deadline: float | None) -> float | None:
+        # Never wait past the deadline
+        if deadline is None:
+            return timeout
+        remaining = deadline - time.monotonic()
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def release(self) -> None:
+        """
+        Releases a slot, handing it over to the oldest waiter if there is one.
+        """
+        with self._lock:
+            self._in_flight -= 1
+            self._dispatch_locked()
+
+    def stats(self) -> dict:
+        """
+        Returns live counters: in-flight and queued calls, acquisitions and wait times (seconds).
+        """
+        with self._lock:
+            return {
+                "max_concurrent": self._limit,
+                "in_flight": self._in_flight,
+                "queued": self._queued,
+                "acquired": self._acquired,
+                "waited": self._waited,
+                "wait_time_total": self._wait_time_total,
+                "wait_time_max": self._wait_time_max,
+                "wait_time_avg": self._wait_time_total / self._waited if self._waited else 0.0,
+                "expired": self._expired,
+                "timed_out": self._timed_out,
+                "timed_out_unstarted": self._timed_out_unstarted,
+                "abandoned": self._call_threads.abandoned if self._call_threads is not None else 0,
+            }
+
+    def count_timeout(self, started: bool = True) -> None:
+        """
+        Counts a call that timed out while holding or waiting for a slot
+        (`started=False`: it never started running).
+        """
+        with self._lock:
+            self._timed_out += 1
+            if not started:
+                self._timed_out_unstarted += 1
+
+    def call_threads(self) -> "_CallThreads":
+        """
+        Threads running the sync calls of this limiter that have a timeout.
+        """
+        if self._call_threads is None:
+            with self._lock:
+                if self._call_threads is None:
+                    self._call_threads = _CallThreads()
+        return self._call_threads
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+    async def __aenter__(self):
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+
+    # Queue operations, overridden by limiters with a different ordering
+
+    def _push_locked(self, waiter: _Waiter) -> None:
+        self._queue.append(waiter)
+
+    def _pop_locked(self) -> _Waiter | None:
+        while self._queue:
+            waiter = self._queue.popleft()
+            if not waiter.cancelled:
+                return waiter
+        return None
+
+    # Internal helpers, must be called with self._lock held
+
+    def _try_acquire_locked(self) -> bool:
+        # Fast path: a free slot and nobody waiting before us (FIFO fairness)
+        if self._in_flight < self._limit and not self._queued:
+            self._in_flight += 1
+            self._acquired += 1
+            return True
+        return False
+
+    def _enqueue_locked(self, waiter: _Waiter) -> None:
+        self._push_locked(waiter)
+        self._queued += 1
+
+    def _cancel_locked(self, waiter: _Waiter) -> None:
+        if not waiter.cancelled:
+            waiter.cancelled = True
+            self._queued -= 1
+
+    def _count_expired_locked(self, deadline: float | None) -> None:
+        if deadline is not None and deadline <= time.monotonic():
+            self._expired += 1
+
+    def _dispatch_locked(self) -> None:
+        # Hand free slots over to the waiters in queue order
+        while self._in_flight < self._limit:
+            waiter = self._pop_locked()
+            if waiter is None:
+                return
+            self._queued -= 1
+
+            if waiter.deadline is not None and waiter.deadline <= time.monotonic():
+                # The deadline has passed while queued: drop the waiter instead of running it
+                waiter.cancelled = True
+                self._expired += 1
+                waiter.wake()
+                continue
+
+            if self._grant_locked(waiter):
+                self._in_flight += 1
+
+    def _grant_locked(self, waiter: _Waiter) -> bool:
+        waiter.granted = True
+        if not waiter.wake():
+            # The waiter's event loop is closed
+            waiter.granted = False
+            waiter.cancelled = True
+            return False
+
+        wait_time = time.monotonic() - waiter.enqueued_at
+        self._acquired += 1
+        self._waited += 1
+        self._wait_time_total += wait_time
+        self._wait_time_max = max(self._wait_time_max, wait_time)
+        return True
+
+# Cancellation flag of the sync call running in the current context (see is_cancelled())
+_cancel_event: contextvars.ContextVar[threading.Event | None] = contextvars.ContextVar("guardin_mind_cancel_event", default=None)
+
+def is_cancelled() -> bool:
+    """
+    True if the sync call running in this thread timed out and its caller gave up.
+
+    A timed-out sync call cannot be interrupted, it keeps running in its worker thread.
+    Long-running minder code can poll this flag to stop early (cooperative cancellation).
+    """
+    event = _cancel_event.get()
+    return event is not None and event.is_set()
+
+class _CallThreads:
+    """
+    Worker threads of the sync calls of one limiter that have a timeout.
+
+    A call never waits for a thread: when no thread is idle a new one is started. Timed-out calls
+    keep running in their threads (`abandoned`), so they cannot starve the calls that hold the slots
+    after them. Idle threads exit after `idle_timeout` seconds.
+    """
+
+    def __init__(self, idle_timeout: float = 60.0):
+        self.idle_timeout = idle_timeout
+        self._cond = threading.Condition()
+        self._work = deque() # (future, fn, args, kwargs) not picked up yet
+        self._idle = 0 # Threads waiting for work
+        self.abandoned = 0 # Timed-out calls still running
+
+    def submit(self, fn, *args, **kwargs):
+        from concurrent.futures import Future # Imported lazily, only calls with a timeout need it
+
+        future = Future()
+        with self._cond:
+            self._work.append((future, fn, args, kwargs))
+            spawn = len(self._work) > self._idle
+            self._cond.notify()
+        if spawn:
+            threading.Thread(target=self._run, name="minder-call", daemon=True).start()
+        return future
+
+    def abandon(self, future) -> None:
+        # The caller gave up on a running call, counted until it returns
+        with self._cond:
+            self.abandoned += 1
+        future.add_done_callback(self._forget)
+
+    def _forget(self, future) -> None:
+        with self._cond:
+            self.abandoned -= 1
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._work:
+                    self._idle += 1
+                    has_work = self._cond.wait_for(lambda: self._work, self.idle_timeout)
+                    self._idle -= 1
+                    if not has_work:
+                        return
+                future, fn, args, kwargs = self._work.popleft()
+
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+            del future, fn, args, kwargs
+
+def _call_with_timeout(limiter: ConcurrencyLimiter, func, args, kwargs, timeout: float):
+    # Runs a sync call in a worker thread, the caller stops waiting (and frees its slot) after `timeout`
+    from concurrent.futures import TimeoutError as FutureTimeoutError
+
+    deadline = time.monotonic() + timeout
+    if not limiter.acquire(timeout):
+        limiter.count_timeout()
+        raise CallTimeoutError(f"No concurrency slot became free within {timeout} s")
+
+    try:
+        cancel_event = threading.Event()
+        context = contextvars.copy_context()
+        context.run(_cancel_event.set, cancel_event)
+        threads = limiter.call_threads()
+        future = threads.submit(context.run, func, *args, **kwargs)
+        try:
+            return future.result(max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            cancel_event.set()
+            started = not future.cancel() # Only possible while it has not started
+            if started:
+                threads.abandon(future)
+            limiter.count_timeout(started)
+            raise CallTimeoutError(f"Call did not finish within {timeout} s") from None
+    finally:
+        limiter.release()
+
+async def _call_with_timeout_async(limiter: ConcurrencyLimiter, func, args, kwargs, timeout: float):
+    # The call is cancelled when the timeout expires, its slot is freed when the cancellation completes
+    deadline = time.monotonic() + timeout
+    if not await limiter.acquire_async(timeout):
+        limiter.count_timeout()
+        raise CallTimeoutError(f"No concurrency slot became free within {timeout} s")
+
+    try:
+        scope = asyncio.timeout(max(0.0, deadline - time.monotonic()))
+        try:
+            async with scope:
+                return await func(*args, **kwargs)
+        except TimeoutError:
+            if not scope.expired():
+                raise # Raised by the function itself
+            limiter.count_timeout()
+            raise CallTimeoutError(f"Call did not finish within {timeout} s") from None
+    finally:
+        limiter.release()
+
+def limit_concurrency(max_concurrent: int | ConcurrencyLimiter, timeout: float | None = None):
+    """
+    Limits the number of concurrent calls of the decorated sync and async functions.
+
+    Sync and async callers share the same budget. Pass a ConcurrencyLimiter instance
+    to share one budget between several methods. The limiter is available as `wrapper.limiter`.
+
+    `timeout` (seconds, waiting for a slot included) bounds every call, and each call accepts
+    a `_timeout` keyword argument (removed before the function is called) overriding it.
+    A call that times out raises CallTimeoutError and frees its slot:
+    - an async call is cancelled;
+    - a sync call runs in a worker thread, the caller stops waiting for it and the call keeps
+      running until it returns or notices `is_cancelled()`.
+    Cancelling an async caller cancels the call and frees its slot as well.
+    """
+    if isinstance(max_concurrent, ConcurrencyLimiter):
+        limiter = max_concurrent
+    else:
+        limiter = ConcurrencyLimiter(max_concurrent)
 
     def decorator(func):
         if inspect.iscoroutinefunction(func):
             # Асинхронная функция
             @wraps(func)
-            async def async_wrapper(*args, **kwargs):
-                async with async_semaphore:
+            async def async_wrapper(*args, _timeout: float | None = None, **kwargs):
+                call_timeout = _timeout if _timeout is not None else timeout
+                if call_timeout is not None:
+                    return await _call_with_timeout_async(limiter, func, args, kwargs, call_timeout)
+                async with limiter:
                     return await func(*args, **kwargs)
+            async_wrapper.limiter = limiter
             return async_wrapper
         else:
             # Синхронная функция
             @wraps(func)
-            def sync_wrapper(*args, **kwargs):
-                with sync_semaphore:
+            def sync_wrapper(*args, _timeout: float | None = None, **kwargs):
+                call_timeout = _timeout if _timeout is not None else timeout
+                if call_timeout is not None:
+                    return _call_with_timeout(limiter, func, args, kwargs, call_timeout)
+                with limiter:
                     return func(*args, **kwargs)
+            sync_wrapper.limiter = limiter
             return sync_wrapper
 
     return decorator
@@ -0,0 +1,246 @@
+import asyncio
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from guardin_mind.mind_utils.exceptions import RateLimitExceededError
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens per second, at most `burst` tokens saved up.
+
+    Tokens are reserved rather than taken: a caller that has to wait gets the time at which its tokens
+    will be available and the balance goes negative, so later callers queue behind it (FIFO). Nothing
+    is bound to a thread or an event loop, so one bucket is shared by threads and any number of loops.
+    """
+
+    __slots__ = ("rate", "burst", "_tokens", "_updated", "_lock")
+
+    def __init__(self, rate: float, burst: float):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """
+        Tokens currently available (negative while callers are waiting for reserved tokens).
+        """
+        with self._lock:
+            self._refill_locked()
+            return self._tokens
+
+    def reserve(self, tokens: float = 1, max_wait: float | None = None) -> float | None:
+        """
+        Reserves tokens. Returns the number of seconds to wait before using them, or None
+        (nothing reserved) if that would be longer than `max_wait`.
+        """
+        if tokens > self.burst:
+            raise ValueError(f"Cannot reserve {tokens} tokens from a bucket of {self.burst}")
+
+        with self._lock:
+            self._refill_locked()
+            wait = max(0.0, (tokens - self._tokens) / self.rate)
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= tokens
+            return wait
+
+    def refund(self, tokens: float = 1) -> None:
+        """
+        Gives back reserved tokens that were not used (e.g. the caller was cancelled while waiting).
+        """
+        with self._lock:
+            self._refill_locked()
+            self._tokens = min(float(self.burst), self._tokens + tokens)
+
+    def _refill_locked(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+class RateLimiter:
+    """
+    Request-per-second budget of minder methods: one token bucket, or one per key.
+
+    When the budget is exhausted a call, depending on `mode`:
+    - "wait": waits for its tokens (at most `max_wait` seconds, unlimited by default);
+    - "shed": fails fast with RateLimitExceededError (or after waiting at most `max_wait` seconds);
+    - "fallback": like "shed", but the decorated function returns `fallback(*args, **kwargs)` instead.
+
+    Args:
+        rate (float): Tokens (calls) per second.
+        burst (float | None): Bucket size, calls that may run at once after an idle period (`rate` by default).
+        key (callable | None): `key(*args, **kwargs)` of the decorated function, one bucket per returned key.
+        mode (str): "wait", "shed" or "fallback".
+        max_wait (float | None): Longest wait before a call is rejected.
+        fallback (callable | None): Result of rejected calls in "fallback" mode (may be async for async functions).
+        max_keys (int): Buckets kept in memory, the least recently used ones are dropped (they are full again anyway).
+    """
+
+    MODES = ("wait", "shed", "fallback")
+
+    def __init__(
+            self,
+            rate: float,
+            burst: float | None = None,
+            key=None,
+            mode: str = "wait",
+            max_wait: float | None = None,
+            fallback=None,
+            max_keys: int = 10_000
+        ):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown rate limit mode: {mode} (expected one of {', '.join(self.MODES)})")
+        if mode == "fallback" and fallback is None:
+            raise ValueError("The fallback mode needs a fallback function")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.key = key
+        self.mode = mode
+        self.max_wait = max_wait if max_wait is not None or mode == "wait" else 0.0
+        self.fallback = fallback
+        self.max_keys = max_keys
+
+        TokenBucket(self.rate, self.burst) # Validates the bucket parameters early
+        self._lock = threading.Lock()
+        self._buckets: OrderedDict = OrderedDict() # Key -> TokenBucket, in least recently used order
+
+        # Counters
+        self._allowed = 0
+        self._waited = 0
+        self._wait_time_total = 0.0
+        self._rejected = 0
+        self._fallbacks = 0
+
+    def bucket(self, key=None) -> TokenBucket:
+        """
+        Returns the token bucket of a key, creating it on first use.
+        """
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.burst)
+                if len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+            return bucket
+
+    def acquire(self, key=None, tokens: float = 1) -> None:
+        """
+        Takes tokens, blocking the current thread while the budget is exhausted.
+
+        Raises:
+            RateLimitExceededError: If the tokens are not available within `max_wait`.
+        """
+        wait = self._reserve(key, tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, key=None, tokens: float = 1) -> None:
+        """
+        Takes tokens without blocking the event loop.
+
+        Raises:
+            RateLimitExceededError: If the tokens are not available within `max_wait`.
+        """
+        wait = self._reserve(key, tokens)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                # The reserved tokens were not used
+                self.bucket(key).refund(tokens)
+                raise
+
+    def stats(self) -> dict:
+        """
+        Returns live counters: allowed, waited and rejected calls and the total wait time (seconds).
+        """
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "mode": self.mode,
+                "keys": len(self._buckets),
+                "allowed": self._allowed,
+                "waited": self._waited,
+                "wait_time_total": self._wait_time_total,
+                "rejected": self._rejected,
+                "fallbacks": self._fallbacks,
+            }
+
+    def _reserve(self, key, tokens: float) -> float:
+        bucket = self.bucket(key)
+        wait = bucket.reserve(tokens, self.max_wait)
+        with self._lock:
+            if wait is None:
+                self._rejected += 1
+            else:
+                self._allowed += 1
+                if wait > 0:
+                    self._waited += 1
+                    self._wait_time_total += wait
+
+        if wait is None:
+            retry_after = max(0.0, (tokens - bucket.tokens) / self.rate)
+            raise RateLimitExceededError(f"Rate limit of {self.rate:g} calls per second exceeded, retry after {retry_after:.3f} s", retry_after)
+        return wait
+
+    def _count_fallback(self) -> None:
+        with self._lock:
+            self._fallbacks += 1
+
+def rate_limit(rate: float | RateLimiter, burst: float | None = None, key=None, mode: str = "wait", max_wait: float | None = None, fallback=None):
+    """
+    Limits the rate of calls of the decorated sync and async functions with a token bucket
+    (see RateLimiter for the options).
+
+    Threads and event loops share the same buckets. Pass a RateLimiter instance to share one budget
+    between several methods. The rate limiter is available as `wrapper.rate_limiter`.
+    """
+    if isinstance(rate, RateLimiter):
+        limiter = rate
+    else:
+        limiter = RateLimiter(rate, burst, key, mode, max_wait, fallback)
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    await limiter.acquire_async(limiter.key(*args, **kwargs) if limiter.key else None)
+                except RateLimitExceededError:
+                    if limiter.mode != "fallback":
+                        raise
+                    limiter._count_fallback()
+                    result = limiter.fallback(*args, **kwargs)
+                    return await result if inspect.isawaitable(result) else result
+                return await func(*args, **kwargs)
+            async_wrapper.rate_limiter = limiter
+            return async_wrapper
+        else:
+            @wraps(func)
+            def sync_wrapper(*args, **kwargs):
+                try:
+                    limiter.acquire(limiter.key(*args, **kwargs) if limiter.key else None)
+                except RateLimitExceededError:
+                    if limiter.mode != "fallback":
+                        raise
+                    limiter._count_fallback()
+                    return limiter.fallback(*args, **kwargs)
+                return func(*args, **kwargs)
+            sync_wrapper.rate_limiter = limiter
+            return sync_wrapper
+
+    return decorator
@@ -0,0 +1,146 @@
+import heapq
+import inspect
+import itertools
+import time
+from functools import wraps
+from guardin_mind.manager.manager import ConcurrencyLimiter, _Waiter
+from guardin_mind.mind_utils.exceptions import QueueFullError, DeadlineExceededError
+
+class PriorityScheduler(ConcurrencyLimiter):
+    """
+    Request queue for minder methods: a ConcurrencyLimiter that hands out slots by priority and deadline.
+
+    - Lower `priority` values run first (like `nice`), calls with equal priority run in FIFO order.
+    - A `deadline` is a `time.monotonic()` timestamp. Calls whose deadline has passed are rejected
+      before they are queued and dropped from the queue before they run (DeadlineExceededError).
+    - `max_queue` bounds the number of waiting calls; further calls fail fast with QueueFullError.
+    """
+
+    def __init__(self, max_concurrent: int, max_queue: int | None = None, default_priority: int = 0, default_timeout: float | None = None):
+        super().__init__(max_concurrent)
+        self.max_queue = max_queue
+        self.default_priority = default_priority
+        self.default_timeout = default_timeout # Seconds a call may wait in the queue when no deadline is given
+
+        self._heap = [] # (priority, sequence, waiter)
+        self._sequence = itertools.count()
+        self._rejected = 0
+
+    def acquire(self, timeout: float | None = None, priority: int | None = None, deadline: float | None = None) -> bool:
+        """
+        Acquires a slot, blocking the current thread.
+
+        Raises:
+            QueueFullError: If the queue is full.
+            DeadlineExceededError: If the deadline passed before a slot was available.
+        """
+        priority, deadline = self._call_params(priority, deadline)
+        if not self._acquire(timeout, priority, deadline):
+            return self._not_acquired(deadline)
+        return self._check_deadline(deadline)
+
+    async def acquire_async(self, timeout: float | None = None, priority: int | None = None, deadline: float | None = None) -> bool:
+        """
+        Acquires a slot without blocking the event loop.
+
+        Raises:
+            QueueFullError: If the queue is full.
+            DeadlineExceededError: If the deadline passed before a slot was available.
+        """
+        priority, deadline = self._call_params(priority, deadline)
+        if not await self._acquire_async(timeout, priority, deadline):
+            return self._not_acquired(deadline)
+        return self._check_deadline(deadline)
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        with self._lock:
+            stats["max_queue"] = self.max_queue
+            stats["rejected"] = self._rejected
+        return stats
+
+    def _call_params(self, priority: int | None, deadline: float | None) -> tuple[int, float | None]:
+        if priority is None:
+            priority = self.default_priority
+        if deadline is None and self.default_timeout is not None:
+            deadline = time.monotonic() + self.default_timeout
+
+        # Reject requests that are already late
+        if deadline is not None and deadline <= time.monotonic():
+            with self._lock:
+                self._expired += 1
+            raise DeadlineExceededError("Request deadline has already passed")
+
+        return priority, deadline
+
+    def _not_acquired(self, deadline: float | None) -> bool:
+        if deadline is not None and deadline <= time.monotonic():
+            raise DeadlineExceededError("Request deadline passed while waiting in the queue")
+        return False
+
+    def _check_deadline(self, deadline: float | None) -> bool:
+        # The slot may have been granted at the very moment the deadline passed
+        if deadline is not None and deadline <= time.monotonic():
+            with self._lock:
+                self._expired += 1
+            self.release()
+            raise DeadlineExceededError("Request deadline passed before it could run")
+        return True
+
+    # Priority queue instead of the FIFO queue
+
+    def _enqueue_locked(self, waiter: _Waiter) -> None:
+        if self.max_queue is not None and self._queued >= self.max_queue:
+            self._rejected += 1
+            raise QueueFullError(f"Request queue is full ({self.max_queue} waiting calls)")
+        super()._enqueue_locked(waiter)
+
+    def _push_locked(self, waiter: _Waiter) -> None:
+        heapq.heappush(self._heap, (waiter.priority, next(self._sequence), waiter))
+
+    def _pop_locked(self) -> _Waiter | None:
+        while self._heap:
+            waiter = heapq.heappop(self._heap)[2]
+            if not waiter.cancelled:
+                return waiter
+        return None
+
+def schedule(max_concurrent: int | PriorityScheduler, max_queue: int | None = None, default_priority: int = 0, default_timeout: float | None = None):
+    """
+    Runs the decorated sync and async functions through a priority request queue.
+
+    Every call accepts two extra keyword arguments, removed before the function is called:
+        _priority (int): Lower values run first (default `default_priority`).
+        _deadline (float): `time.monotonic()` timestamp after which the call is dropped if it has not started.
+
+    Pass a PriorityScheduler instance to share one queue between several methods.
+    The scheduler is available as `wrapper.limiter`.
+    """
+    if isinstance(max_concurrent, PriorityScheduler):
+        scheduler = max_concurrent
+    else:
+        scheduler = PriorityScheduler(max_concurrent, max_queue, default_priority, default_timeout)
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, _priority: int | None = None, _deadline: float | None = None, **kwargs):
+                await scheduler.acquire_async(priority=_priority, deadline=_deadline)
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    scheduler.release()
+            async_wrapper.limiter = scheduler
+            return async_wrapper
+        else:
+            @wraps(func)
+            def sync_wrapper(*args, _priority: int | None = None, _deadline: float | None = None, **kwargs):
+                scheduler.acquire(priority=_priority, deadline=_deadline)
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    scheduler.release()
+            sync_wrapper.limiter = scheduler
+            return sync_wrapper
+
+    return decorator
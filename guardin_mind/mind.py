@@ -1,12 +1,19 @@
-from colorama import init, Fore, Style # Use colorama for color prints
 from guardin_mind.configs import _default_mind_folder
+from guardin_mind.mind_utils.lazy import LazyMinderClass
+from guardin_mind.mind_utils.minder_index import MinderIndex
+from guardin_mind.mind_utils.module_cache import module_registry
 import os
-import inspect
-import importlib.util
 import re
-from typing import TypeVar, Type
+import threading
+import time
+from typing import TypeVar, Type, TYPE_CHECKING
 
-init(autoreset=True) # Init colorama
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+    from guardin_mind.mind_utils.hot_reload import MinderWatcher
+    from guardin_mind.mind_utils.instance_pool import MinderPool
+    from guardin_mind.mind_utils.metrics import MetricsRegistry
+    from guardin_mind.mind_utils.profiler import MinderProfiler
 
 T = TypeVar("T")
 
@@ -20,10 +27,14 @@ class MinderSearch:
         # If debug mode is enabled, log the key directories involved in the execution.
         self.minders_dir = minders_dir if minders_dir is not None else _default_mind_folder
 
+        # Persistent index of the installed minders (shared by every MinderSearch on the same folder)
+        self.index = MinderIndex.for_folder(os.path.join(self.minders_dir, "minders"))
+
     def search_minder_locally(self, minder_name: str) -> str | None:
         '''
         Searches for a minder directory matching the given name inside the local "minders" directory.
         This method performs a case-sensitive match and does not recurse into subdirectories.
+        Lookups go through the persistent minder index, so they do not list the whole folder.
 
         Args:
             minder_name (str): The exact name of the minder directory to find.
@@ -31,22 +42,19 @@ class MinderSearch:
         Returns:
             str | None: The absolute path to the minder directory if found, otherwise None.
         '''
-        minders_dir = os.path.join(self.minders_dir, "minders")
-
-        # Iterate over entries in the "minders" directory
-        for entry in os.listdir(minders_dir):
-            full_path = os.path.join(minders_dir, entry)
-            # Check if entry is a directory and matches the minder_name exactly (case-sensitive)
-            if os.path.isdir(full_path) and entry == minder_name:
-                # Return normalized absolute path with forward slashes for consistency
-                return full_path.replace("\\", "/")
+        entry = self.index.lookup(minder_name)
 
         # Return None if no matching minder directory found
-        return None
+        if entry is None:
+            return None
+
+        # Normalized absolute path with forward slashes for consistency
+        return entry["path"]
 
     def load_minder(self, minder_path: str, minder_name: str) -> type | None:
         '''
         Dynamically loads a minder module from the given Python file path and retrieves the minder class by name.
+        Modules are shared process-wide, so an unchanged minder file is executed only once.
 
         Args:
             minder_path (str): Absolute path to the minder's Python (.py) file.
@@ -56,17 +64,8 @@ class MinderSearch:
             type | None: The minder class if successfully loaded, None otherwise.
         '''
         try:
-            # Extract module name from the file name (without extension)
-            module_name = os.path.splitext(os.path.basename(minder_path))[0]
-
-            # Create a module specification from the file location
-            spec = importlib.util.spec_from_file_location(module_name, minder_path)
-            if spec is None:
-                raise ImportError(f"Cannot create module spec for minder at path: {minder_path}")
-
-            # Create a new module based on the specification and load it
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            # Load the module through the process-wide registry
+            module = module_registry.load(minder_path)
 
             # Retrieve the class with the given minder_name from the loaded module
             cls = getattr(module, minder_name, None)
@@ -130,21 +129,72 @@ class Mind(MinderSearch):
         debug_mode (bool): Enables detailed logging if True.
         logger (logging.Logger): Logger instance for debug/info/error messages.
         _dynamic_classes (dict): Cache for dynamically created minder classes.
+        _loading (dict): Loads in progress, keyed by minder name (one load per name, other callers wait for it).
+        _misses (dict): Recently missing minders, keyed by name, remembered for `miss_ttl` seconds.
     '''
 
     def __init__(
             self,
-            path: str | None = None # Accepts the folder path of a specific minders folder
+            path: str | None = None, # Accepts the folder path of a specific minders folder
+            warm_up: list[str] | None = None, # Minder names whose instance pools are filled at creation
+            pool_size: int = 1, # Size of the instance pools created for `warm_up`
+            server: str | None = None, # Socket path of a `mind serve` server, minders are then used remotely
+            shared_memory_threshold: int | None = None, # Client mode: buffers of at least this many bytes go through shared memory
+            metrics: "bool | MetricsRegistry" = False, # Instrument minder calls (True - new registry, available as `mind.metrics`)
+            preload: list[str] | None = None, # Minder names imported in the background at creation
+            hot_reload: bool = False, # Reload minders whose files changed (see `enable_hot_reload()`)
+            miss_ttl: float = 1.0 # Seconds a missing minder is remembered before the disk is searched again
         ):
 
         self.minder_path = None # Fixed None
 
+        # Functions applied to every loaded minder class (e.g. instrumentation), each returns a class
+        self._class_hooks = []
+        self._hooked_classes = {} # Original class -> class returned by the hooks
+
+        # Client of a shared Mind server (client mode)
+        self._client = None
+        if server is not None:
+            from guardin_mind.mind_utils.ipc import MindClient # Imported lazily, pulls in asyncio and socket
+            self._client = MindClient(server, shared_memory_threshold=shared_memory_threshold)
+
         # Dictionary to hold dynamically created minder classes
         self._dynamic_classes = {}
 
+        # Loads in progress and recent misses, keyed by minder name, and the background loader threads (created on first use)
+        self._cache_lock = threading.Lock()
+        self._loading: dict[str, "Future"] = {}
+        self._misses: dict[str, tuple[float, Exception]] = {} # Minder name -> (expiry, error)
+        self.miss_ttl = miss_ttl
+        self._loader = None
+
+        # Instance pools, keyed by minder name
+        self._pools = {}
+
+        # Watcher of the loaded minders (hot reload)
+        self._watcher = None
+
+        # Opt-in call instrumentation
+        self.metrics = None
+        if metrics:
+            from guardin_mind.mind_utils.metrics import MetricsRegistry # Imported lazily, only instrumented minds need it
+            self.metrics = metrics if isinstance(metrics, MetricsRegistry) else MetricsRegistry()
+            self.add_class_hook(self.metrics.instrument_class)
+
         # Initialize parent class (MinderSearch)
         super().__init__(minders_dir=path)
 
+        # Eager warm-up of the instance pools
+        for minder_name in warm_up or []:
+            self.pool(minder_name, size=pool_size).warm_up()
+
+        if hot_reload:
+            self.enable_hot_reload()
+
+        # Background import of the minders needed soon
+        if preload:
+            self.preload(preload)
+
     def __getattr__(self, name):
         '''
         Override __getattr__ to dynamically create and return minder classes on-demand.
@@ -163,22 +213,327 @@ class Mind(MinderSearch):
 
         Example:
             mind_instance.SomeMinder  # Automatically creates and returns SomeMinder class if it doesn't exist yet.
+
+        In client mode (`Mind(server=...)`) a RemoteMinderClass is returned instead: calling it returns
+        a proxy of the minder instance shared by the server.
+
+        Loading is single-flight: when several threads access a new minder at once, one of them loads
+        it and the others wait for its result. A missing minder is remembered for `miss_ttl` seconds.
+        '''
+        # Private and dunder attributes are never minders
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        minder_cls = self._dynamic_classes.get(name)
+        if minder_cls is not None:
+            return minder_cls
+
+        future, owner = self._claim_load(name)
+        if owner:
+            self._run_load(name, future)
+        return future.result()
+
+    def lazy(self, name: str) -> LazyMinderClass:
+        '''
+        Returns a proxy of a minder class that is loaded on first use (call or attribute access),
+        so creating it costs nothing on the request path.
+
+        Example:
+            SomeMinder = mind.lazy("SomeMinder")
+            SomeMinder().ask_sync("Hello")  # The minder is imported here
+        '''
+        return LazyMinderClass(self, name)
+
+    async def aload(self, name: str) -> type:
+        '''
+        Returns a minder class like `mind.<name>`, but runs discovery and import in a worker thread,
+        so the event loop is not blocked. Concurrent loads of the same minder are shared.
+
+        Example:
+            SomeMinder = await mind.aload("SomeMinder")
+        '''
+        minder_cls = self._dynamic_classes.get(name)
+        if minder_cls is not None:
+            return minder_cls
+
+        import asyncio # Imported lazily, only asyncio applications use aload
+        return await asyncio.wrap_future(self._load_in_background(name))
+
+    def preload(self, names: list[str]) -> dict[str, "Future"]:
+        '''
+        Starts importing the given minders concurrently in background threads and returns at once.
+        Accessing a minder that is still loading waits for its background load.
+
+        Args:
+            names (list[str]): Minder names.
+
+        Returns:
+            dict[str, Future]: A future per minder name, resolving to the minder class
+                (or to the error raised while loading it).
         '''
-        if name not in self._dynamic_classes:
-            minder_cls = self.get_minder(name)
-            if minder_cls is None:
-                raise AttributeError(f"No minder class found for '{name}'")
+        return {name: self._load_in_background(name) for name in names}
 
-            # Кэшировать и вернуть
-            self._dynamic_classes[name] = minder_cls
+    def evict(self, name: str | None = None) -> None:
+        '''
+        Forgets a cached minder class (all of them if `name` is None) and the recent misses.
+        The next access looks the minder up again, reusing its module if the file did not change.
+        Existing instances and instance pools are not affected.
+        '''
+        with self._cache_lock:
+            names = list(self._dynamic_classes) if name is None else [name]
+            for minder_name in names:
+                self._forget_hooked(self._dynamic_classes.pop(minder_name, None))
+
+            if name is None:
+                self._misses.clear()
+            else:
+                self._misses.pop(name, None)
+
+        # An evicted minder is no longer reloaded, it is tracked again when it is loaded again
+        if self._watcher is not None:
+            for minder_name in names:
+                self._watcher.untrack(minder_name)
+
+    def invalidate(self, name: str | None = None) -> None:
+        '''
+        Like `evict()`, but the minder modules are also executed again on the next access,
+        e.g. after the minder files were changed in place.
+        '''
+        names = list(self._dynamic_classes) if name is None else [name]
+        if self._client is None:
+            for minder_name in names:
+                folder = self.search_minder_locally(minder_name)
+                if folder is not None:
+                    module_registry.invalidate(os.path.join(folder, "minder.py"))
+        self.evict(name)
+
+    def _claim_load(self, name: str) -> tuple["Future", bool]:
+        # Returns the future of the minder class and True if the caller has to run the load
+        from concurrent.futures import Future # Imported lazily, only needed when a minder is not cached
+
+        with self._cache_lock:
+            future = self._loading.get(name)
+            if future is not None:
+                return future, False
+
+            future = Future()
+            minder_cls = self._dynamic_classes.get(name)
+            if minder_cls is not None:
+                future.set_result(minder_cls)
+                return future, False
+
+            miss = self._misses.get(name)
+            if miss is not None:
+                expiry, error = miss
+                if expiry > time.monotonic():
+                    # A fresh exception, so repeated raises do not chain tracebacks
+                    future.set_exception(type(error)(*error.args))
+                    return future, False
+                del self._misses[name]
+
+            self._loading[name] = future
+            return future, True
+
+    def _run_load(self, name: str, future: "Future") -> None:
+        # Runs a claimed load and hands its result to every waiting caller
+        try:
+            minder_cls = self._load_class(name)
+        except BaseException as e:
+            with self._cache_lock:
+                if isinstance(e, (ValueError, FileNotFoundError)) and self.miss_ttl > 0:
+                    # Missing (or broken) minder: do not search the disk again for a while
+                    self._misses[name] = (time.monotonic() + self.miss_ttl, e)
+                del self._loading[name]
+            future.set_exception(e)
+        else:
+            with self._cache_lock:
+                del self._loading[name]
+            future.set_result(minder_cls)
+
+    def _load_in_background(self, name: str) -> "Future":
+        # Runs the load in a loader thread, shared with any concurrent load of the same minder
+        future, owner = self._claim_load(name)
+        if owner:
+            with self._cache_lock:
+                if self._loader is None:
+                    from concurrent.futures import ThreadPoolExecutor # Imported lazily, only needed for background loads
+                    self._loader = ThreadPoolExecutor(thread_name_prefix="mind-loader")
+            self._loader.submit(self._run_load, name, future)
+        return future
+
+    def _load_class(self, name: str):
+        # Loads a minder class (or its remote stand-in) and caches it
+        if self._client is not None:
+            # Client mode: the minder lives in the server process
+            from guardin_mind.mind_utils.ipc import RemoteMinderClass
+            self._dynamic_classes[name] = RemoteMinderClass(self._client, name)
+            return self._dynamic_classes[name]
+
+        minder_cls = self.get_minder(name)
+        if minder_cls is None:
+            raise AttributeError(f"No minder class found for '{name}'")
 
+        # Кэшировать и вернуть
+        self._dynamic_classes[name] = self._apply_class_hooks(minder_cls)
+        if self._watcher is not None:
+            self._watcher.track(name)
         return self._dynamic_classes[name]
 
-    def load(self, cls: Type[T]) -> T:
-        name = cls.__name__
+    def enable_hot_reload(self, interval: float = 1.0, settle: float = 0.1, use_inotify: bool = True) -> "MinderWatcher":
+        '''
+        Watches the loaded minders and reloads them in a background thread when their `minder.py`
+        or `minder_config.toml` change (e.g. after `mind install`), without restarting the process.
+        New accesses get the new class, existing instances keep the old one.
+
+        Args:
+            interval (float): Seconds between two checks when polling.
+            settle (float): Seconds the files must stay unchanged before the minder is reloaded.
+            use_inotify (bool): Use inotify (Linux) instead of polling when available.
+
+        Returns:
+            MinderWatcher: The running watcher (`reloads`, `errors`, `check()`, `stop()`).
+        '''
+        from guardin_mind.mind_utils.hot_reload import MinderWatcher # Imported lazily, starts a thread
+
+        if self._watcher is None:
+            self._watcher = MinderWatcher(self, interval, settle, use_inotify).start()
+        return self._watcher
+
+    def _replace_class(self, name: str, minder_cls: type) -> bool:
+        # Swaps a cached minder class for a new version of it (hot reload), False if it is no longer cached
+        hooked = self._apply_class_hooks(minder_cls)
+        with self._cache_lock:
+            previous = self._dynamic_classes.get(name)
+            if previous is None:
+                # Evicted meanwhile: the next access loads the current version anyway
+                self._forget_hooked(hooked)
+                return False
+            self._dynamic_classes[name] = hooked
+            if previous is not hooked:
+                self._forget_hooked(previous)
+        return True
+
+    def _forget_hooked(self, hooked) -> None:
+        # Drops the hooked version of a class that is no longer cached
+        for original, hooked_cls in list(self._hooked_classes.items()):
+            if hooked_cls is hooked:
+                self._hooked_classes.pop(original, None)
+
+    def load(self, cls: Type[T], mode: str = "instance", **options) -> T:
+        '''
+        Loads a minder class.
+
+        Args:
+            cls (type): The minder class (or a lazy proxy of it, see `lazy()`).
+            mode (str): "instance" creates the minder in this process.
+                "process" instantiates it in a pool of worker processes and proxies method calls
+                (options: workers, warm_start, recycle_after, args, kwargs, mp_context, shared_memory_threshold).
+                "pool" returns the shared instance pool of the minder (options: see `pool()`).
+
+        Returns:
+            The minder instance, a ProcessMinder proxy in "process" mode or a MinderPool in "pool" mode.
+        '''
         if cls is None:
-            raise AttributeError(f"No minder class found for '{name}'")
-        return cls()
+            raise AttributeError("No minder class found")
+        if isinstance(cls, LazyMinderClass):
+            cls = cls.resolve()
+
+        if mode == "pool":
+            return self.pool(cls, **options)
+        if mode == "process":
+            from guardin_mind.mind_utils.process_pool import ProcessMinder # Imported lazily, pulls in multiprocessing and asyncio
+            return ProcessMinder(self, cls, **options)
+        if mode != "instance":
+            raise ValueError(f"Unknown minder load mode: {mode}")
+
+        return self._apply_class_hooks(cls)()
+
+    def pool(self, minder: str | type, size: int = 1, max_size: int | None = None, args: tuple = (), kwargs: dict | None = None) -> "MinderPool":
+        '''
+        Returns the instance pool of a minder, creating it on first use.
+
+        Example:
+            with mind.pool("SomeMinder", size=4).checkout() as minder:
+                minder.ask_sync("Hello")
+
+        Args:
+            minder (str | type): Minder name or class.
+            size (int): Number of pre-constructed instances.
+            max_size (int | None): Upper bound of an elastic pool, `size` by default.
+            args (tuple), kwargs (dict): Arguments of the minder constructor.
+        '''
+        from guardin_mind.mind_utils.instance_pool import MinderPool # Imported lazily, pulls in asyncio
+
+        if isinstance(minder, LazyMinderClass):
+            minder = minder.name
+        name = minder if isinstance(minder, str) else minder.__name__
+
+        pool = self._pools.get(name)
+        if pool is None:
+            minder_cls = getattr(self, name) if isinstance(minder, str) else self._apply_class_hooks(minder)
+            pool = self._pools.setdefault(name, MinderPool(minder_cls, size, max_size, args, kwargs))
+        return pool
+
+    def pool_stats(self) -> dict[str, dict]:
+        '''
+        Returns the statistics of every instance pool, keyed by minder name.
+        '''
+        return {name: pool.stats() for name, pool in list(self._pools.items())}
+
+    def add_class_hook(self, hook) -> None:
+        '''
+        Registers a function applied to every minder class this Mind loads (`hook(cls) -> cls`),
+        e.g. to wrap methods. Classes already loaded are hooked again, existing instances and pools are not changed.
+        '''
+        originals = {hooked: cls for cls, hooked in self._hooked_classes.items()}
+        self._class_hooks.append(hook)
+        self._hooked_classes = {}
+
+        for name, cls in list(self._dynamic_classes.items()):
+            if isinstance(cls, type):
+                self._dynamic_classes[name] = self._apply_class_hooks(originals.get(cls, cls))
+
+    def enable_profiling(
+            self,
+            minders: list[str] | None = None,
+            methods: list[str] | None = None,
+            deterministic: bool = True,
+            sampling_interval: float | None = None
+        ) -> "MinderProfiler":
+        '''
+        Profiles the calls of minders loaded by this Mind.
+
+        Example:
+            profiler = mind.enable_profiling(["SomeMinder"], sampling_interval=0.001)
+            mind.SomeMinder().ask_sync("Hello")
+            profiler.dump_stats("some_minder.pstats")        # cProfile data, merged across threads
+            profiler.write_collapsed("some_minder.collapsed")  # Sampled stacks for flamegraph tools
+            profiler.timings()                               # Wall, CPU and await time per method
+
+        Args:
+            minders (list[str] | None): Minder names to profile, all by default.
+            methods (list[str] | None): Method names to profile, all public methods by default.
+            deterministic (bool): Record every function call with cProfile.
+            sampling_interval (float | None): Seconds between stack samples, None disables sampling.
+        '''
+        from guardin_mind.mind_utils.profiler import MinderProfiler # Imported lazily, pulls in cProfile and pstats
+
+        profiler = MinderProfiler(minders, methods, deterministic, sampling_interval)
+        self.add_class_hook(profiler.instrument_class)
+        return profiler
+
+    def _apply_class_hooks(self, cls: type) -> type:
+        # Runs the class hooks once per original class
+        if not self._class_hooks:
+            return cls
+
+        hooked = self._hooked_classes.get(cls)
+        if hooked is None:
+            hooked = cls
+            for hook in self._class_hooks:
+                hooked = hook(hooked)
+            hooked = self._hooked_classes.setdefault(cls, hooked)
+        return hooked
 
     def get_version_from_file(self, path):
         """
@@ -8,4 +8,35 @@ class PythonVersionError(RuntimeError):
 
 class MindVersionError(RuntimeError):
     """An exception caused if the Python version does not match"""
-    pass
\ No newline at end of file
+    pass
+
+class MinderDependencyError(RuntimeError):
+    """Exception raised when the minder dependency graph cannot be resolved (e.g. a dependency cycle)"""
+    pass
+
+class ArchiveDownloadError(RuntimeError):
+    """Exception raised when a minder archive cannot be downloaded and is not cached"""
+    pass
+
+class LockfileError(RuntimeError):
+    """Exception raised when a lockfile is invalid or a locked archive does not match its hash"""
+    pass
+
+class QueueFullError(RuntimeError):
+    """Exception raised when a request queue reached its maximum depth (back-pressure)"""
+    pass
+
+class DeadlineExceededError(TimeoutError):
+    """Exception raised when a request deadline passed before it could run"""
+    pass
+
+class CallTimeoutError(TimeoutError):
+    """Exception raised when a minder call did not finish within its timeout"""
+    pass
+
+class RateLimitExceededError(RuntimeError):
+    """Exception raised when a call exceeds its rate limit (load shedding)"""
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after # Seconds until the call would be allowed
@@ -0,0 +1,268 @@
+'''
+Hot reload of changed minders
+'''
+
+import os
+import sys
+import threading
+from guardin_mind.mind_utils.module_cache import module_registry
+
+WATCHED_FILES = ("minder.py", "minder_config.toml")
+
+class MinderWatcher:
+    '''
+    Watches the folders of the minders loaded by a Mind and reloads the ones that changed.
+
+    A minder is reloaded when its `minder.py` or `minder_config.toml` changes (content, size or file
+    replaced, e.g. by `mind install`). The module is executed again in the watcher thread and the
+    class cached by the Mind is swapped in one assignment: new `mind.<Minder>` accesses (and lazy
+    proxies) get the new class, while existing instances and in-flight calls keep the old one.
+    Instance pools keep their instances of the old class.
+
+    Changes are detected by comparing the file stats. On Linux inotify wakes the watcher as soon as
+    a file changes, elsewhere (or if inotify is unavailable) the folders are polled every `interval`.
+    A change is applied once the files stayed unchanged for `settle` seconds, so a minder is not
+    imported while it is being written. If the new version fails to import, the old class is kept
+    and the error is stored in `errors`.
+
+    Args:
+        mind (Mind): The Mind whose minders are watched.
+        interval (float): Seconds between two checks when polling (and safety check with inotify).
+        settle (float): Seconds the changed files must stay unchanged before the minder is reloaded.
+        use_inotify (bool): Use inotify when available.
+    '''
+
+    def __init__(self, mind, interval: float = 1.0, settle: float = 0.1, use_inotify: bool = True):
+        self.mind = mind
+        self.interval = interval
+        self.settle = settle
+
+        self.reloads: dict[str, int] = {} # Minder name -> number of reloads
+        self.errors: dict[str, Exception] = {} # Minder name -> error of the last failed reload
+
+        self._lock = threading.Lock()
+        self._check_lock = threading.Lock() # One check at a time (watcher thread and explicit calls)
+        self._tracked: dict[str, tuple[str, tuple]] = {} # Minder name -> (folder, signature of the loaded version)
+        self._stop = threading.Event()
+        self._thread = None
+
+        self._inotify = None
+        if use_inotify and sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify()
+            except OSError:
+                self._inotify = None
+
+        # The minders loaded so far are compared with their current version
+        for name in list(mind._dynamic_classes):
+            self.track(name)
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if self._inotify is not None else "polling"
+
+    def start(self) -> "MinderWatcher":
+        '''
+        Starts the watcher thread.
+        '''
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="mind-hot-reload", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        '''
+        Stops the watcher thread.
+        '''
+        self._stop.set()
+        if self._inotify is not None:
+            self._inotify.interrupt()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def track(self, name: str) -> None:
+        '''
+        Starts watching a loaded minder (called by the Mind when it loads one).
+        '''
+        minder_cls = self.mind._dynamic_classes.get(name)
+        if not isinstance(minder_cls, type):
+            # Remote minders (client mode) live in the server process
+            return
+
+        folder = self.mind.search_minder_locally(name)
+        if folder is None:
+            return
+
+        with self._lock:
+            if name not in self._tracked:
+                self._tracked[name] = (folder, self._signature(folder))
+        if self._inotify is not None:
+            self._inotify.watch(os.path.dirname(folder))
+            self._inotify.watch(folder)
+
+    def untrack(self, name: str) -> None:
+        '''
+        Stops watching a minder (called by the Mind when it evicts one).
+        '''
+        with self._lock:
+            self._tracked.pop(name, None)
+        self.errors.pop(name, None)
+
+    def check(self) -> list[str]:
+        '''
+        Reloads the watched minders whose files changed. Returns the names of the reloaded minders.
+        '''
+        with self._check_lock:
+            return self._check()
+
+    def _check(self) -> list[str]:
+        for name in list(self.mind._dynamic_classes):
+            if name not in self._tracked:
+                self.track(name)
+
+        with self._lock:
+            tracked = dict(self._tracked)
+
+        changed = {}
+        for name, (folder, signature) in tracked.items():
+            current = self._signature(folder)
+            # A missing minder.py means the minder is being reinstalled (or was removed): keep the old class
+            if current != signature and current[0] is not None:
+                changed[name] = current
+
+        if changed and self.settle:
+            # Wait for the writes to finish
+            self._stop.wait(self.settle)
+
+        reloaded = []
+        for name, signature in changed.items():
+            folder = tracked[name][0]
+            if self._signature(folder) != signature:
+                continue # Still changing, picked up by the next check
+            if self.reload(name, folder, signature):
+                reloaded.append(name)
+        return reloaded
+
+    def reload(self, name: str, folder: str | None = None, signature: tuple | None = None) -> bool:
+        '''
+        Imports the minder again and swaps the class cached by the Mind.
+
+        Returns:
+            bool: True if the new version was loaded, False if it failed (the old class is kept).
+        '''
+        folder = folder or self.mind.search_minder_locally(name)
+        if folder is None:
+            return False
+        signature = signature or self._signature(folder)
+
+        minder_file = os.path.join(folder, "minder.py")
+        try:
+            # Executed again even if only the config changed, so the new class reads the new config
+            module_registry.invalidate(minder_file)
+            module = module_registry.load(minder_file)
+            minder_cls = getattr(module, name, None)
+            if minder_cls is None:
+                raise ImportError(f"Minder class '{name}' not found in module at {minder_file}")
+        except Exception as e:
+            self.errors[name] = e
+            failed = True
+        else:
+            if not self.mind._replace_class(name, minder_cls):
+                # Evicted while it was being imported, nothing to swap
+                self.untrack(name)
+                return False
+            self.errors.pop(name, None)
+            self.reloads[name] = self.reloads.get(name, 0) + 1
+            failed = False
+
+        # A failed version is not retried until the files change again
+        with self._lock:
+            self._tracked[name] = (folder, signature)
+        return not failed
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            if self._inotify is not None:
+                self._inotify.wait(self.interval)
+            else:
+                self._stop.wait(self.interval)
+
+            if self._stop.is_set():
+                break
+            self.check()
+
+    @staticmethod
+    def _signature(folder: str) -> tuple:
+        # (inode, mtime, size) of every watched file, None for missing files
+        signature = []
+        for file_name in WATCHED_FILES:
+            try:
+                stat = os.stat(os.path.join(folder, file_name))
+            except OSError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+class _Inotify:
+    '''
+    Minimal inotify binding (Linux), only used to wake the watcher when something changes.
+    '''
+
+    # Changes of files inside a folder and of the folder entries themselves
+    MASK = (
+        0x00000002 # IN_MODIFY
+        | 0x00000004 # IN_ATTRIB
+        | 0x00000008 # IN_CLOSE_WRITE
+        | 0x00000040 # IN_MOVED_FROM
+        | 0x00000080 # IN_MOVED_TO
+        | 0x00000100 # IN_CREATE
+        | 0x00000200 # IN_DELETE
+    )
+
+    def __init__(self):
+        import ctypes # Imported lazily, only the watcher thread needs it
+
+        try:
+            self._libc = ctypes.CDLL(None, use_errno=True)
+            self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError) as e:
+            raise OSError(f"inotify is not available: {e}")
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        # Self-pipe that interrupts wait() when the watcher stops
+        self._wake_read, self._wake_write = os.pipe()
+
+    def watch(self, path: str) -> None:
+        # Adding the same folder again is a no-op, a replaced folder gets a new watch
+        self._libc.inotify_add_watch(self.fd, os.fsencode(path), self.MASK)
+
+    def wait(self, timeout: float) -> bool:
+        '''
+        Waits for events, returns True if something changed.
+        '''
+        import select
+
+        readable, _, _ = select.select([self.fd, self._wake_read], [], [], timeout)
+        if self.fd not in readable:
+            return False
+
+        # Drain the queue, the events themselves are not needed
+        try:
+            while os.read(self.fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def interrupt(self) -> None:
+        os.write(self._wake_write, b"x")
+
+    def close(self) -> None:
+        for fd in (self.fd, self._wake_read, self._wake_write):
+            os.close(fd)
@@ -0,0 +1,159 @@
+'''
+Pools of pre-constructed minder instances
+'''
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from guardin_mind.manager.manager import ConcurrencyLimiter
+
+class MinderPool:
+    '''
+    A fixed or elastic pool of minder instances, checked out for the duration of a call.
+
+    A fixed pool holds `size` instances. An elastic pool (`max_size` > `size`) constructs extra
+    instances on demand, up to `max_size`, and keeps them for later checkouts. When every instance
+    is in use, callers wait in FIFO order (threads and coroutines share the same queue).
+
+    Args:
+        minder_cls (type): The minder class.
+        size (int): Number of instances constructed by `warm_up()`.
+        max_size (int | None): Maximum number of instances, `size` by default.
+        args (tuple), kwargs (dict): Arguments of the minder constructor.
+    '''
+
+    def __init__(self, minder_cls: type, size: int = 1, max_size: int | None = None, args: tuple = (), kwargs: dict | None = None):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self.minder_cls = minder_cls
+        self.size = size
+        self.max_size = max(size, max_size or size)
+        self.args = tuple(args)
+        self.kwargs = dict(kwargs or {})
+
+        self._slots = ConcurrencyLimiter(self.max_size) # One slot per instance that may exist
+        self._lock = threading.Lock()
+        self._idle: list = [] # Instances ready for checkout (LIFO keeps hot instances hot)
+        self._created = 0
+        self._checkouts = 0
+
+    def warm_up(self) -> None:
+        '''
+        Constructs instances until the pool holds `size` of them.
+        '''
+        while True:
+            with self._lock:
+                if self._created >= self.size:
+                    return
+                self._created += 1
+            try:
+                instance = self._construct()
+            except BaseException:
+                with self._lock:
+                    self._created -= 1
+                raise
+            with self._lock:
+                self._idle.append(instance)
+
+    def acquire(self, timeout: float | None = None):
+        '''
+        Checks an instance out, blocking the current thread. Raises TimeoutError if the timeout expired.
+        '''
+        if not self._slots.acquire(timeout):
+            raise TimeoutError(f"No {self.minder_cls.__name__} instance available")
+        try:
+            return self._take(self._construct)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def acquire_async(self, timeout: float | None = None):
+        '''
+        Checks an instance out without blocking the event loop (new instances are constructed in a thread).
+        '''
+        if not await self._slots.acquire_async(timeout):
+            raise TimeoutError(f"No {self.minder_cls.__name__} instance available")
+        instance = self._take(None)
+        if instance is None:
+            try:
+                instance = await asyncio.to_thread(self._construct)
+            except BaseException:
+                with self._lock:
+                    self._created -= 1
+                self._slots.release()
+                raise
+        return instance
+
+    def release(self, instance) -> None:
+        '''
+        Returns a checked out instance to the pool.
+        '''
+        with self._lock:
+            self._idle.append(instance)
+        self._slots.release()
+
+    @contextmanager
+    def checkout(self, timeout: float | None = None):
+        '''
+        Sync context manager: `with pool.checkout() as minder: ...`
+        '''
+        instance = self.acquire(timeout)
+        try:
+            yield instance
+        finally:
+            self.release(instance)
+
+    @asynccontextmanager
+    async def acheckout(self, timeout: float | None = None):
+        '''
+        Async context manager: `async with pool.acheckout() as minder: ...`
+        '''
+        instance = await self.acquire_async(timeout)
+        try:
+            yield instance
+        finally:
+            self.release(instance)
+
+    def stats(self) -> dict:
+        '''
+        Returns pool statistics: instances created, idle and in use, checkouts and wait times (seconds).
+        '''
+        slots = self._slots.stats()
+        with self._lock:
+            return {
+                "minder": self.minder_cls.__name__,
+                "size": self.size,
+                "max_size": self.max_size,
+                "created": self._created,
+                "idle": len(self._idle),
+                "in_use": slots["in_flight"],
+                "waiting": slots["queued"],
+                "checkouts": self._checkouts,
+                "waited": slots["waited"],
+                "wait_time_avg": slots["wait_time_avg"],
+                "wait_time_max": slots["wait_time_max"],
+            }
+
+    def _take(self, construct):
+        # Called with a slot held: reuse an idle instance or construct a new one
+        with self._lock:
+            self._checkouts += 1
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+
+        if construct is None:
+            return None
+        try:
+            return construct()
+        except BaseException:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def _construct(self):
+        return self.minder_cls(*self.args, **self.kwargs)
+
+    def __repr__(self):
+        return f"<MinderPool {self.minder_cls.__name__} size={self.size} max_size={self.max_size}>"
@@ -0,0 +1,677 @@
+'''
+Local IPC server mode: several processes share the minders loaded by one `Mind`.
+
+Wire format (compact binary framing, one frame per message):
+    header - struct "!IQB": body length (uint32), request id (uint64), message kind (uint8)
+    body   - pickle (protocol 5) of the request operation, the result or the exception
+
+Requests on one connection are pipelined: the server handles them concurrently and answers
+in completion order, responses are matched to requests by their id.
+
+Trust model: request bodies are unpickled, so anyone who can connect to the socket can run
+arbitrary code in the server process. The socket is created with mode 0600 (owner only) and its
+folder, when created by the server, with mode 0700. Only share it with processes of the same user.
+'''
+
+import asyncio
+import inspect
+import itertools
+import os
+import pickle
+import socket
+import stat
+import struct
+import threading
+import uuid
+import weakref
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from guardin_mind.mind_utils import shared_buffers
+
+HEADER = struct.Struct("!IQB")
+_PRUNE_DELIVERED = 256 # Segments written to a connection before the attached ones are forgotten
+
+REQUEST = 1
+RESPONSE = 2
+ERROR = 3
+
+def encode_frame(request_id: int, kind: int, obj) -> bytes:
+    '''
+    Builds a frame: header + pickled body.
+    '''
+    try:
+        body = pickle.dumps(obj, protocol=5)
+    except Exception:
+        if kind != ERROR:
+            raise
+        # Unpicklable exception, send its representation
+        body = pickle.dumps(RuntimeError(f"{type(obj).__name__}: {obj}"), protocol=5)
+    return HEADER.pack(len(body), request_id, kind) + body
+
+def decode_response(kind: int, body: bytes):
+    '''
+    Returns the result of a response frame or raises the remote exception.
+    '''
+    obj = pickle.loads(body)
+    if kind == ERROR:
+        raise obj
+    return obj
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            raise ConnectionError("Mind server closed the connection")
+        received += count
+    return bytes(buffer)
+
+def _public_methods(cls: type) -> dict[str, bool]:
+    # Public callables of a minder class -> is the method a coroutine function
+    return {
+        name: inspect.iscoroutinefunction(attr)
+        for name, attr in inspect.getmembers(cls, callable)
+        if not name.startswith("_") and not inspect.isclass(attr)
+    }
+
+class MindServer:
+    '''
+    Hosts a `Mind` and its minders behind a Unix domain socket.
+
+    Minder instances are shared: every client asking for the same minder with the same constructor
+    arguments gets a proxy of one server-side instance. Sync methods run on a thread pool, async
+    methods run on the server event loop. An instance is dropped once every client released its
+    proxies or closed its session connection (preloaded instances are kept).
+
+    Args:
+        socket_path (str): Path of the Unix domain socket.
+        path (str | None): Folder that contains the `minders` folder (see `Mind(path=...)`).
+        preload (list[str] | None): Minders instantiated (without arguments) at start.
+        workers (int | None): Size of the thread pool for sync methods.
+    '''
+
+    def __init__(self, socket_path: str, path: str | None = None, preload: list[str] | None = None, workers: int | None = None):
+        from guardin_mind.mind import Mind
+
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("Mind server requires Unix domain sockets, not available on this platform")
+
+        self.socket_path = os.fspath(socket_path)
+        self.mind = Mind(path=path)
+        self.preload = list(preload or [])
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mind-server")
+        self._instances: dict[int, object] = {} # Instance id -> minder instance
+        self._shared: dict[tuple, asyncio.Future] = {} # (name, arguments) -> future of (instance id, methods)
+        self._keys: dict[int, tuple] = {} # Instance id -> its key in `_shared`
+        self._refs: Counter = Counter() # Instance id -> proxies held by clients
+        self._client_refs: dict[str, Counter] = {} # Client id -> proxies it holds per instance id
+        self._ids = itertools.count(1)
+        self._tasks: set = set()
+
+        self._loop = None
+        self._server = None
+        self._stopped = None
+        self._thread = None
+        self._ready = threading.Event()
+        self._start_error = None
+
+    def serve_forever(self) -> None:
+        '''
+        Runs the server in the current thread until `stop()` is called.
+        '''
+        asyncio.run(self._serve())
+
+    def start(self) -> "MindServer":
+        '''
+        Runs the server in a background thread and returns once it accepts connections.
+        '''
+        self._thread = threading.Thread(target=self._run_in_thread, name="mind-server", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._start_error is not None:
+            self._thread.join()
+            raise self._start_error
+        return self
+
+    def _run_in_thread(self) -> None:
+        try:
+            self.serve_forever()
+        except BaseException as e:
+            # Failed before accepting connections (e.g. another server owns the socket)
+            if not self._ready.is_set():
+                self._start_error = e
+                self._ready.set()
+            else:
+                raise
+
+    def stop(self) -> None:
+        '''
+        Stops the server started with `serve_forever()` or `start()`.
+        '''
+        if self._loop is not None and self._stopped is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+        if self._thread is not None:
+            self._thread.join()
+
+    async def _serve(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+
+        sock = self._bind()
+
+        try:
+            for name in self.preload:
+                instance_id, _ = await self._create(name, (), {})
+                self._refs[instance_id] += 1 # Held by the server itself
+            self._server = await asyncio.start_unix_server(self._handle_connection, sock=sock)
+        except BaseException:
+            sock.close()
+            os.unlink(self.socket_path)
+            raise
+        self._ready.set()
+        try:
+            await self._stopped.wait()
+        finally:
+            self._server.close()
+            await self._server.wait_closed()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def _bind(self) -> socket.socket:
+        # Owner-only folder (when created here) and socket: connecting means being able to run code in the server
+        os.makedirs(os.path.dirname(os.path.abspath(self.socket_path)), mode=0o700, exist_ok=True)
+        self._remove_stale_socket()
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(self.socket_path)
+            # Not listening yet, so nobody can connect before the mode is restricted
+            os.chmod(self.socket_path, 0o600)
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+    def _remove_stale_socket(self) -> None:
+        # A socket left by a crashed server is removed, a live server or any other file is kept
+        try:
+            mode = os.lstat(self.socket_path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise FileExistsError(f"{self.socket_path} exists and is not a socket")
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(self.socket_path)
+            return
+        finally:
+            probe.close()
+        raise RuntimeError(f"Another Mind server is listening on {self.socket_path}")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = _ConnectionState()
+        try:
+            while True:
+                length, request_id, kind = HEADER.unpack(await reader.readexactly(HEADER.size))
+                body = await reader.readexactly(length)
+
+                # Handle requests concurrently (pipelining)
+                task = asyncio.create_task(self._handle_request(writer, request_id, body, connection))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            # Client disconnected or server stopped
+            pass
+        finally:
+            writer.close()
+            # Responses the client never read: nobody else will unlink their segments
+            shared_buffers.remove(connection.delivered)
+            # A closed session means the client is gone with all its proxies
+            if connection.client_id is not None:
+                self._drop_client(connection.client_id)
+
+    async def _handle_request(self, writer: asyncio.StreamWriter, request_id: int, body: bytes, connection: "_ConnectionState") -> None:
+        delivered = connection.delivered
+        created = [] # Segments of the result, owned by the server until the client can attach them
+        try:
+            result = await self._dispatch(pickle.loads(body), created, connection)
+            frame = encode_frame(request_id, RESPONSE, result)
+        except Exception as e:
+            shared_buffers.remove(created)
+            created = []
+            frame = encode_frame(request_id, ERROR, e)
+
+        if writer.is_closing():
+            shared_buffers.remove(created)
+            return
+
+        writer.write(frame)
+        if created:
+            delivered.update(created)
+            if len(delivered) > _PRUNE_DELIVERED:
+                delivered.difference_update([path for path in delivered if not os.path.exists(path)])
+        try:
+            await writer.drain()
+        except ConnectionError:
+            shared_buffers.remove(created)
+
+    async def _dispatch(self, op: tuple, created: list, connection: "_ConnectionState"):
+        if op[0] == "call":
+            _, instance_id, method_name, args, kwargs, shared_memory_threshold = op
+            return await self._call(instance_id, method_name, args, kwargs, shared_memory_threshold, created)
+        if op[0] == "create":
+            _, name, args, kwargs, client_id = op
+            instance_id, methods = await self._create(name, args, kwargs)
+            self._acquire(client_id, instance_id)
+            return instance_id, methods
+        if op[0] == "release":
+            _, client_id, instance_ids = op
+            for instance_id in instance_ids:
+                self._release(client_id, instance_id)
+            return None
+        if op[0] == "session":
+            # The client keeps this connection open while it lives
+            connection.client_id = op[1]
+            self._client_refs.setdefault(op[1], Counter())
+            return None
+        if op[0] == "ping":
+            return os.getpid()
+        raise ValueError(f"Unknown Mind server operation: {op[0]}")
+
+    def _acquire(self, client_id: str, instance_id: int) -> None:
+        self._refs[instance_id] += 1
+        self._client_refs.setdefault(client_id, Counter())[instance_id] += 1
+
+    def _release(self, client_id: str, instance_id: int, count: int = 1) -> None:
+        refs = self._client_refs.get(client_id)
+        if refs is None or refs[instance_id] < count:
+            return # Already dropped with the client session
+        refs[instance_id] -= count
+        if not refs[instance_id]:
+            del refs[instance_id]
+
+        self._refs[instance_id] -= count
+        if self._refs[instance_id] <= 0:
+            # Last proxy gone: the next client asking for it gets a new instance
+            del self._refs[instance_id]
+            self._instances.pop(instance_id, None)
+            self._shared.pop(self._keys.pop(instance_id), None)
+
+    def _drop_client(self, client_id: str) -> None:
+        for instance_id, count in list(self._client_refs.get(client_id, {}).items()):
+            self._release(client_id, instance_id, count)
+        self._client_refs.pop(client_id, None)
+
+    async def _create(self, name: str, args: tuple, kwargs: dict) -> tuple[int, dict[str, bool]]:
+        # One shared instance per minder and constructor arguments, created once (single flight)
+        key = (name, pickle.dumps((args, sorted(kwargs.items()))))
+        future = self._shared.get(key)
+        if future is None:
+            future = self._shared[key] = self._loop.create_future()
+            try:
+                minder_cls = await self._loop.run_in_executor(self._executor, getattr, self.mind, name)
+                instance = await self._loop.run_in_executor(self._executor, partial(minder_cls, *args, **kwargs))
+            except BaseException as e:
+                del self._shared[key]
+                future.set_exception(e)
+                future.exception() # Retrieved, the caller gets it below
+                raise
+            instance_id = next(self._ids)
+            self._instances[instance_id] = instance
+            self._keys[instance_id] = key
+            future.set_result((instance_id, _public_methods(minder_cls)))
+        return await asyncio.shield(future)
+
+    async def _call(self, instance_id: int, method_name: str, args: tuple, kwargs: dict, shared_memory_threshold: int | None, created: list):
+        if method_name.startswith("_"):
+            raise AttributeError(f"Private method '{method_name}' cannot be called remotely")
+
+        method = getattr(self._instances[instance_id], method_name)
+        if inspect.iscoroutinefunction(method):
+            if shared_memory_threshold is not None:
+                args, kwargs = shared_buffers.resolve(args), shared_buffers.resolve(kwargs)
+            result = await method(*args, **kwargs)
+            if shared_memory_threshold is not None:
+                result = shared_buffers.share(result, shared_memory_threshold, created)
+            return result
+
+        result = await self._loop.run_in_executor(self._executor, partial(_run_sync, method, args, kwargs, shared_memory_threshold, created))
+        if inspect.isawaitable(result):
+            result = await result
+            if shared_memory_threshold is not None:
+                result = shared_buffers.share(result, shared_memory_threshold, created)
+        return result
+
+class _ConnectionState:
+    '''
+    Server-side state of one client connection
+    '''
+    __slots__ = ("delivered", "client_id")
+
+    def __init__(self):
+        self.delivered = set() # Result segments written to this connection, the client attaches (unlinks) them
+        self.client_id = None # Set on the session connection of a client
+
+def _run_sync(method, args: tuple, kwargs: dict, shared_memory_threshold: int | None, created: list):
+    # Sync method call on the server thread pool, shared buffers are attached and created off the event loop
+    if shared_memory_threshold is None:
+        return method(*args, **kwargs)
+    result = method(*shared_buffers.resolve(args), **shared_buffers.resolve(kwargs))
+    if inspect.isawaitable(result):
+        return result
+    return shared_buffers.share(result, shared_memory_threshold, created)
+
+class _AsyncConnection:
+    '''
+    One connection per event loop, shared by all coroutines of the loop (requests are pipelined).
+    '''
+
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self.writer = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._connect_lock = asyncio.Lock()
+        self._reader_task = None
+
+    async def request(self, op: tuple):
+        if self.writer is None or self.writer.is_closing():
+            async with self._connect_lock:
+                if self.writer is None or self.writer.is_closing():
+                    reader, self.writer = await asyncio.open_unix_connection(self.socket_path)
+                    self._reader_task = asyncio.get_running_loop().create_task(self._read_loop(reader))
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            self.writer.write(encode_frame(request_id, REQUEST, op))
+            await self.writer.drain()
+            return await future
+        except BaseException:
+            # Cancelled after the response arrived: its result is dropped here
+            if future.done() and not future.cancelled() and future.exception() is None:
+                shared_buffers.release(future.result())
+            raise
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _read_loop(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                length, request_id, kind = HEADER.unpack(await reader.readexactly(HEADER.size))
+                body = await reader.readexactly(length)
+                future = self._pending.get(request_id)
+                if future is None or future.done():
+                    # The caller was cancelled, nobody will resolve the shared buffers of the result
+                    if kind == RESPONSE:
+                        shared_buffers.release(pickle.loads(body))
+                    continue
+                try:
+                    future.set_result(decode_response(kind, body))
+                except Exception as e:
+                    future.set_exception(e)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Mind server connection lost"))
+            if self.writer is not None:
+                self.writer.close()
+
+class MindClient:
+    '''
+    Client of a `MindServer`.
+
+    Sync calls use a pool of blocking connections (one request at a time per connection),
+    async calls use one pipelined connection per event loop. A session connection stays open
+    while the client lives: the server drops the instances of a client once it is closed.
+    Proxies that are garbage collected are released with the next request.
+
+    Args:
+        socket_path (str): Path of the server's Unix domain socket.
+        pool_size (int): Maximum number of idle sync connections kept open.
+        timeout (float | None): Socket timeout of sync calls.
+        shared_memory_threshold (int | None): Arguments and results of at least this many bytes
+            (bytes, bytearray, memoryview, NumPy arrays) are passed through shared memory instead of the socket.
+    '''
+
+    def __init__(self, socket_path: str, pool_size: int = 8, timeout: float | None = None, shared_memory_threshold: int | None = None):
+        self.socket_path = os.fspath(socket_path)
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.shared_memory_threshold = shared_memory_threshold
+
+        self.client_id = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._idle: list[socket.socket] = []
+        self._ids = itertools.count(1)
+        self._async_connections = weakref.WeakKeyDictionary() # Event loop -> _AsyncConnection
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._released: deque[int] = deque() # Instance ids of finalized proxies, sent with the next request
+
+    def call(self, op: tuple):
+        '''
+        Sends a request and blocks until its response.
+        '''
+        return self._call(op, resolve=False)
+
+    def create(self, name: str, args: tuple, kwargs: dict) -> "RemoteMinder":
+        '''
+        Returns a proxy of the shared server-side instance of a minder.
+        '''
+        self._open_session()
+        instance_id, methods = self.call(("create", name, args, kwargs, self.client_id))
+        return RemoteMinder(self, name, instance_id, methods)
+
+    async def acreate(self, name: str, args: tuple, kwargs: dict) -> "RemoteMinder":
+        '''
+        Awaitable variant of `create()`.
+        '''
+        if self._session is None:
+            await asyncio.get_running_loop().run_in_executor(None, self._open_session)
+        instance_id, methods = await self.acall(("create", name, args, kwargs, self.client_id))
+        return RemoteMinder(self, name, instance_id, methods)
+
+    def release(self, instance_id: int) -> None:
+        '''
+        Releases a proxy (called by its finalizer, so it only queues the release: any lock may be held).
+        '''
+        self._released.append(instance_id)
+
+    def _open_session(self) -> None:
+        with self._session_lock:
+            if self._session is None:
+                sock = self._connect()
+                try:
+                    sock.sendall(encode_frame(0, REQUEST, ("session", self.client_id)))
+                    length, _, kind = HEADER.unpack(_recv_exactly(sock, HEADER.size))
+                    decode_response(kind, _recv_exactly(sock, length))
+                except BaseException:
+                    sock.close()
+                    raise
+                self._session = sock
+
+    def _take_released(self) -> list[int]:
+        # popleft() is atomic: ids queued by finalizers meanwhile are never lost
+        released = []
+        while self._released:
+            released.append(self._released.popleft())
+        return released
+
+    def _call(self, op: tuple, resolve: bool):
+        if self._released and op[0] != "release":
+            self._call(("release", self.client_id, self._take_released()), resolve=False)
+
+        sock = self._checkout()
+        try:
+            sock.sendall(encode_frame(next(self._ids), REQUEST, op))
+            length, _, kind = HEADER.unpack(_recv_exactly(sock, HEADER.size))
+            body = _recv_exactly(sock, length)
+            resolve = resolve and kind == RESPONSE
+            if resolve:
+                # Attached before the connection can be closed: the server unlinks the segments of closed connections
+                result = shared_buffers.resolve(pickle.loads(body))
+        except BaseException:
+            # The connection state is unknown, do not reuse it
+            sock.close()
+            raise
+        self._checkin(sock)
+        return result if resolve else decode_response(kind, body)
+
+    async def acall(self, op: tuple):
+        '''
+        Sends a request on the pipelined connection of the running event loop.
+        '''
+        loop = asyncio.get_running_loop()
+        connection = self._async_connections.get(loop)
+        if connection is None:
+            connection = self._async_connections[loop] = _AsyncConnection(self.socket_path)
+        if self._released:
+            await connection.request(("release", self.client_id, self._take_released()))
+        return await connection.request(op)
+
+    def call_method(self, instance_id: int, method_name: str, args: tuple, kwargs: dict):
+        '''
+        Calls a method of a server-side instance, blocking until its result.
+        '''
+        threshold = self.shared_memory_threshold
+        if threshold is None:
+            return self.call(("call", instance_id, method_name, args, kwargs, None))
+
+        created = []
+        try:
+            op = ("call", instance_id, method_name, shared_buffers.share(args, threshold, created), shared_buffers.share(kwargs, threshold, created), threshold)
+            return self._call(op, resolve=True)
+        finally:
+            shared_buffers.remove(created) # Segments of a failed call are never claimed by the server
+
+    async def acall_method(self, instance_id: int, method_name: str, args: tuple, kwargs: dict):
+        '''
+        Awaitable variant of `call_method()`.
+        '''
+        threshold = self.shared_memory_threshold
+        if threshold is None:
+            return await self.acall(("call", instance_id, method_name, args, kwargs, None))
+
+        created = []
+        try:
+            op = ("call", instance_id, method_name, shared_buffers.share(args, threshold, created), shared_buffers.share(kwargs, threshold, created), threshold)
+            return shared_buffers.resolve(await self.acall(op))
+        finally:
+            shared_buffers.remove(created)
+
+    def close(self) -> None:
+        '''
+        Closes the idle sync connections and the session: the server drops the instances of this client.
+        '''
+        with self._lock:
+            idle, self._idle = self._idle, []
+        with self._session_lock:
+            if self._session is not None:
+                idle.append(self._session)
+                self._session = None
+        for sock in idle:
+            sock.close()
+
+    def _checkout(self) -> socket.socket:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._connect()
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+    def _checkin(self, sock: socket.socket) -> None:
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(sock)
+                return
+        sock.close()
+
+class RemoteMethod:
+    '''
+    Proxy of a method of a server-side minder instance.
+
+    Calling it keeps the style of the original method: sync methods return the result,
+    async methods return an awaitable. `acall()` is an awaitable variant for both.
+    '''
+
+    def __init__(self, minder: "RemoteMinder", name: str, is_coroutine: bool):
+        self._minder = minder
+        self.__name__ = name
+        self.is_coroutine = is_coroutine
+
+    def __call__(self, *args, **kwargs):
+        if self.is_coroutine:
+            return self.acall(*args, **kwargs)
+        return self._minder._client.call_method(self._minder._instance_id, self.__name__, args, kwargs)
+
+    async def acall(self, *args, **kwargs):
+        return await self._minder._client.acall_method(self._minder._instance_id, self.__name__, args, kwargs)
+
+    def __repr__(self):
+        return f"<RemoteMethod {self._minder._name}.{self.__name__}>"
+
+class RemoteMinder:
+    '''
+    Proxy of a minder instance hosted by a `MindServer`.
+    '''
+
+    def __init__(self, client: MindClient, name: str, instance_id: int, methods: dict[str, bool]):
+        self._client = client
+        self._name = name
+        self._instance_id = instance_id
+        self._methods = {method: RemoteMethod(self, method, is_coroutine) for method, is_coroutine in methods.items()}
+        weakref.finalize(self, client.release, instance_id)
+
+    def __getattr__(self, name):
+        try:
+            return self._methods[name]
+        except KeyError:
+            raise AttributeError(f"Minder '{self._name}' has no method '{name}'") from None
+
+    def __dir__(self):
+        return list(self._methods)
+
+    def __repr__(self):
+        return f"<RemoteMinder {self._name} #{self._instance_id}>"
+
+class RemoteMinderClass:
+    '''
+    Stands for a minder class in client mode: calling it returns a proxy of the shared server-side instance.
+    '''
+
+    def __init__(self, client: MindClient, name: str):
+        self._client = client
+        self.__name__ = name
+
+    def __call__(self, *args, **kwargs) -> RemoteMinder:
+        return self._client.create(self.__name__, args, kwargs)
+
+    async def acreate(self, *args, **kwargs) -> RemoteMinder:
+        '''
+        Awaitable variant of the constructor call.
+        '''
+        return await self._client.acreate(self.__name__, args, kwargs)
+
+    def __repr__(self):
+        return f"<RemoteMinderClass {self.__name__}>"
@@ -0,0 +1,52 @@
+'''
+Lazy minder proxies
+'''
+
+class LazyMinderClass:
+    '''
+    Stand-in for a minder class that is loaded on first real use.
+
+    Creating the proxy does no discovery or import. Calling it (or reading a class attribute)
+    loads the minder through its Mind and forwards to the real class. The class is looked up
+    in the Mind on every use, so the proxy always follows the class the Mind currently holds.
+
+    Example:
+        SomeMinder = mind.lazy("SomeMinder")  # Nothing is imported yet
+        minder = SomeMinder()                 # Loads the minder, then creates the instance
+        await SomeMinder.aresolve()           # Or loads it without blocking the event loop
+    '''
+
+    __slots__ = ("_mind", "name")
+
+    def __init__(self, mind, name: str):
+        self._mind = mind
+        self.name = name
+
+    @property
+    def loaded(self) -> bool:
+        '''
+        True once the minder class is loaded in the Mind.
+        '''
+        return self.name in self._mind._dynamic_classes
+
+    def resolve(self) -> type:
+        '''
+        Returns the minder class, loading it if needed.
+        '''
+        return getattr(self._mind, self.name)
+
+    async def aresolve(self) -> type:
+        '''
+        Returns the minder class, loading it in a worker thread if needed.
+        '''
+        return await self._mind.aload(self.name)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr):
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<LazyMinderClass {self.name} ({state})>"
@@ -0,0 +1,327 @@
+'''
+Opt-in instrumentation of minder calls and Prometheus text export
+'''
+
+import inspect
+import itertools
+import os
+import sys
+import tempfile
+import threading
+from bisect import bisect_left
+from functools import wraps
+from time import perf_counter
+
+# Upper bounds (seconds) of the latency histogram buckets, the last bucket is +Inf
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_instrumented_ids = itertools.count(1) # Suffixes of the module-level names of instrumented classes
+
+class MethodMetrics:
+    '''
+    Counters, in-flight gauge and latency histogram of one minder method
+    '''
+
+    def __init__(self, minder: str, method: str, limiter=None, rate_limiter=None):
+        self.minder = minder
+        self.method = method
+        self.limiter = limiter # ConcurrencyLimiter of `limit_concurrency` / `schedule`, if any
+        self.rate_limiter = rate_limiter # RateLimiter of `rate_limit`, if any
+
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def start(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def finish(self, duration: float, error: bool) -> None:
+        bucket = bisect_left(LATENCY_BUCKETS, duration)
+        with self._lock:
+            self.in_flight -= 1
+            self.calls += 1
+            if error:
+                self.errors += 1
+            self.latency_sum += duration
+            if duration > self.latency_max:
+                self.latency_max = duration
+            self.buckets[bucket] += 1
+
+    def percentile(self, q: float) -> float:
+        '''
+        Estimates a latency percentile (0 < q <= 1) from the histogram, interpolating inside the bucket.
+        '''
+        with self._lock:
+            buckets, count, latency_max = list(self.buckets), self.calls, self.latency_max
+        return _percentile(buckets, count, latency_max, q)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            buckets, count = list(self.buckets), self.calls
+            result = {
+                "calls": count,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "latency_avg": self.latency_sum / count if count else 0.0,
+                "latency_max": self.latency_max,
+                "latency_sum": self.latency_sum,
+            }
+        result["latency_p50"] = _percentile(buckets, count, result["latency_max"], 0.5)
+        result["latency_p95"] = _percentile(buckets, count, result["latency_max"], 0.95)
+        result["latency_p99"] = _percentile(buckets, count, result["latency_max"], 0.99)
+        result["buckets"] = buckets
+        if self.limiter is not None:
+            result["limiter"] = self.limiter.stats()
+        if self.rate_limiter is not None:
+            result["rate_limiter"] = self.rate_limiter.stats()
+        return result
+
+class MetricsRegistry:
+    '''
+    Collects the metrics of instrumented minders.
+
+    Example:
+        mind = Mind(metrics=True)
+        minder = mind.SomeMinder()
+        ...
+        mind.metrics.snapshot()                       # {"SomeMinder": {"ask_sync": {"calls": ..., "latency_p99": ...}}}
+        mind.metrics.write_prometheus("metrics.prom")  # Prometheus text format (e.g. for the node exporter textfile collector)
+        mind.metrics.serve(9464)                       # http://127.0.0.1:9464/metrics
+    '''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._methods: dict[tuple[str, str], MethodMetrics] = {}
+
+    def instrument_class(self, cls: type) -> type:
+        '''
+        Returns a subclass of a minder class whose public methods record their calls.
+        Instrumented classes keep the name, module and behaviour of the original class. They are
+        registered in that module under their own qualified name, so their instances pickle as
+        instrumented instances.
+        '''
+        if cls.__dict__.get("__minder_metrics__") is self:
+            return cls
+
+        qualname = f"{cls.__name__}__metered_{next(_instrumented_ids)}"
+        namespace = {
+            "__module__": cls.__module__,
+            "__qualname__": qualname,
+            "__doc__": cls.__doc__,
+            "__minder_metrics__": self,
+        }
+        for name in dir(cls):
+            if name.startswith("_"):
+                continue
+            func = inspect.getattr_static(cls, name)
+            if inspect.isfunction(func):
+                metrics = self.method_metrics(cls.__name__, name, getattr(func, "limiter", None), getattr(func, "rate_limiter", None))
+                namespace[name] = self._wrap(func, metrics)
+
+        instrumented = type(cls)(cls.__name__, (cls,), namespace)
+        module = sys.modules.get(cls.__module__)
+        if module is not None:
+            setattr(module, qualname, instrumented)
+        return instrumented
+
+    def method_metrics(self, minder: str, method: str, limiter=None, rate_limiter=None) -> MethodMetrics:
+        '''
+        Returns the metrics of a minder method, creating them on first use.
+        '''
+        key = (minder, method)
+        with self._lock:
+            metrics = self._methods.get(key)
+            if metrics is None:
+                metrics = self._methods[key] = MethodMetrics(minder, method, limiter, rate_limiter)
+            else:
+                if limiter is not None:
+                    metrics.limiter = limiter
+                if rate_limiter is not None:
+                    metrics.rate_limiter = rate_limiter
+            return metrics
+
+    def snapshot(self) -> dict[str, dict[str, dict]]:
+        '''
+        Returns the current metrics, keyed by minder and method name.
+        '''
+        with self._lock:
+            methods = list(self._methods.values())
+
+        result = {}
+        for metrics in methods:
+            result.setdefault(metrics.minder, {})[metrics.method] = metrics.snapshot()
+        return result
+
+    def reset(self) -> None:
+        '''
+        Forgets every recorded call (instrumented classes keep recording into fresh metrics).
+        '''
+        with self._lock:
+            for metrics in self._methods.values():
+                with metrics._lock:
+                    metrics.calls = metrics.errors = 0
+                    metrics.latency_sum = metrics.latency_max = 0.0
+                    metrics.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def to_prometheus(self) -> str:
+        '''
+        Renders the metrics in the Prometheus text exposition format.
+        '''
+        with self._lock:
+            methods = sorted(self._methods.values(), key=lambda m: (m.minder, m.method))
+        snapshots = [(_labels(m.minder, m.method), m.snapshot()) for m in methods]
+
+        lines = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        family("guardin_mind_calls_total", "counter", "Minder method calls.")
+        lines.extend(f"guardin_mind_calls_total{{{labels}}} {s['calls']}" for labels, s in snapshots)
+
+        family("guardin_mind_errors_total", "counter", "Minder method calls that raised an exception.")
+        lines.extend(f"guardin_mind_errors_total{{{labels}}} {s['errors']}" for labels, s in snapshots)
+
+        family("guardin_mind_in_flight", "gauge", "Minder method calls in progress.")
+        lines.extend(f"guardin_mind_in_flight{{{labels}}} {s['in_flight']}" for labels, s in snapshots)
+
+        family("guardin_mind_call_duration_seconds", "histogram", "Minder method call latency.")
+        for labels, s in snapshots:
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), s["buckets"]):
+                cumulative += count
+                lines.append(f'guardin_mind_call_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"guardin_mind_call_duration_seconds_sum{{{labels}}} {s['latency_sum']!r}")
+            lines.append(f"guardin_mind_call_duration_seconds_count{{{labels}}} {s['calls']}")
+
+        limited = [(labels, s["limiter"]) for labels, s in snapshots if "limiter" in s]
+        if limited:
+            family("guardin_mind_limiter_wait_seconds_total", "counter", "Time spent waiting for a concurrency slot.")
+            lines.extend(f"guardin_mind_limiter_wait_seconds_total{{{labels}}} {stats['wait_time_total']!r}" for labels, stats in limited)
+            family("guardin_mind_limiter_waited_total", "counter", "Calls that waited for a concurrency slot.")
+            lines.extend(f"guardin_mind_limiter_waited_total{{{labels}}} {stats['waited']}" for labels, stats in limited)
+            family("guardin_mind_limiter_queued", "gauge", "Calls waiting for a concurrency slot.")
+            lines.extend(f"guardin_mind_limiter_queued{{{labels}}} {stats['queued']}" for labels, stats in limited)
+            family("guardin_mind_limiter_timed_out_total", "counter", "Calls that timed out waiting for or holding a concurrency slot.")
+            lines.extend(f"guardin_mind_limiter_timed_out_total{{{labels}}} {stats['timed_out']}" for labels, stats in limited)
+            family("guardin_mind_limiter_timed_out_unstarted_total", "counter", "Calls that timed out before they started running.")
+            lines.extend(f"guardin_mind_limiter_timed_out_unstarted_total{{{labels}}} {stats['timed_out_unstarted']}" for labels, stats in limited)
+            family("guardin_mind_limiter_abandoned", "gauge", "Timed-out sync calls still running in their threads.")
+            lines.extend(f"guardin_mind_limiter_abandoned{{{labels}}} {stats['abandoned']}" for labels, stats in limited)
+            family("guardin_mind_limiter_limit", "gauge", "Current concurrency limit.")
+            lines.extend(f"guardin_mind_limiter_limit{{{labels}}} {stats['max_concurrent']}" for labels, stats in limited)
+
+        rate_limited = [(labels, s["rate_limiter"]) for labels, s in snapshots if "rate_limiter" in s]
+        if rate_limited:
+            family("guardin_mind_rate_limit_waited_total", "counter", "Calls that waited for a rate limit token.")
+            lines.extend(f"guardin_mind_rate_limit_waited_total{{{labels}}} {stats['waited']}" for labels, stats in rate_limited)
+            family("guardin_mind_rate_limit_wait_seconds_total", "counter", "Time spent waiting for rate limit tokens.")
+            lines.extend(f"guardin_mind_rate_limit_wait_seconds_total{{{labels}}} {stats['wait_time_total']!r}" for labels, stats in rate_limited)
+            family("guardin_mind_rate_limit_rejected_total", "counter", "Calls rejected by a rate limit (including fallbacks).")
+            lines.extend(f"guardin_mind_rate_limit_rejected_total{{{labels}}} {stats['rejected']}" for labels, stats in rate_limited)
+            family("guardin_mind_rate_limit_fallbacks_total", "counter", "Rejected calls answered by a fallback.")
+            lines.extend(f"guardin_mind_rate_limit_fallbacks_total{{{labels}}} {stats['fallbacks']}" for labels, stats in rate_limited)
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        '''
+        Writes the Prometheus text export to a file atomically.
+        '''
+        folder = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.to_prometheus())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def serve(self, port: int = 9464, host: str = "127.0.0.1"):
+        '''
+        Serves the Prometheus text export over HTTP from a daemon thread.
+        Returns the HTTP server (`server.server_address`, `server.shutdown()`).
+        '''
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer # Imported lazily, only the exporter needs it
+
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = registry.to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass # Scrapes are not logged
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="mind-metrics", daemon=True).start()
+        return server
+
+    @staticmethod
+    def _wrap(func, metrics: MethodMetrics):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                metrics.start()
+                error = False
+                start = perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                except Exception:
+                    error = True
+                    raise
+                finally:
+                    metrics.finish(perf_counter() - start, error)
+
+            return async_wrapper
+
+        @wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            metrics.start()
+            error = False
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                error = True
+                raise
+            finally:
+                metrics.finish(perf_counter() - start, error)
+
+        return sync_wrapper
+
+def _percentile(buckets: list[int], count: int, latency_max: float, q: float) -> float:
+    if count == 0:
+        return 0.0
+
+    rank = q * count
+    cumulative = 0
+    lower = 0.0
+    for index, bucket_count in enumerate(buckets):
+        if bucket_count and cumulative + bucket_count >= rank:
+            upper = LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else latency_max
+            upper = min(upper, latency_max)
+            # Linear interpolation inside the bucket
+            return lower + (upper - lower) * (rank - cumulative) / bucket_count
+        cumulative += bucket_count
+        if index < len(LATENCY_BUCKETS):
+            lower = LATENCY_BUCKETS[index]
+    return latency_max
+
+def _labels(minder: str, method: str) -> str:
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'minder="{escape(minder)}",method="{escape(method)}"'
@@ -0,0 +1,226 @@
+'''
+Persistent on-disk index of installed minders
+'''
+
+import json
+import os
+import threading
+
+INDEX_FOLDER_NAME = ".index" # Hidden folder inside the minders folder, skipped when listing minders
+INDEX_FILE_NAME = "minders_index.json"
+INDEX_VERSION = 2
+
+class MinderIndex:
+    '''
+    Persistent index of the minders installed in a minders folder.
+
+    Maps a minder name to its folder path, config hash and config mtime.
+    The index is kept in memory (one instance per minders folder for the whole process)
+    and mirrored to `<minders_folder>/.index/minders_index.json`, so a lookup costs a `stat` of the
+    minders folder and one of the minder config plus a dict lookup instead of listing the whole folder.
+    The file lives in its own subfolder, so rewriting it does not change the minders folder mtime.
+
+    When the minders folder mtime changes (a minder was added, removed or renamed), the
+    index is refreshed incrementally: new entries and entries whose config mtime changed
+    (reinstalled or edited minders) are described, vanished ones are dropped.
+    The package manager keeps the index up to date through `update()` and `remove()`.
+    '''
+
+    _instances: dict[str, "MinderIndex"] = {} # Process-wide indexes, keyed by minders folder
+    _instances_lock = threading.Lock()
+
+    def __init__(self, minders_folder: str):
+        self.minders_folder = os.path.abspath(os.fspath(minders_folder))
+        self.index_path = os.path.join(self.minders_folder, INDEX_FOLDER_NAME, INDEX_FILE_NAME)
+
+        self._lock = threading.RLock()
+        self._entries: dict[str, dict] = {}
+        self._folder_mtime: int | None = None # mtime (ns) of the minders folder the entries match
+        self._loaded = False
+
+    @classmethod
+    def for_folder(cls, minders_folder: str) -> "MinderIndex":
+        '''
+        Returns the shared index for the given minders folder, creating it on first use.
+        '''
+        key = os.path.abspath(os.fspath(minders_folder))
+        index = cls._instances.get(key)
+        if index is None:
+            with cls._instances_lock:
+                index = cls._instances.setdefault(key, cls(key))
+        return index
+
+    def lookup(self, minder_name: str) -> dict | None:
+        '''
+        Returns the index entry of an installed minder.
+
+        Args:
+            minder_name (str): The exact (case-sensitive) name of the minder folder.
+
+        Returns:
+            dict | None: Entry with `path`, `config_hash` and `mtime` keys, or None if not installed.
+        '''
+        with self._lock:
+            self._ensure_fresh()
+            entry = self._entries.get(minder_name)
+
+            if entry is not None and self._is_stale(entry):
+                # Config edited in place, the folder mtime did not change
+                entry = self._entries[minder_name] = self._describe(minder_name)
+                self._save()
+
+            if entry is None and self._folder_mtime is not None:
+                # The folder mtime may have a coarse resolution, so a minder created in the same tick
+                # as the last refresh would be missed. Checking the single expected path is still O(1)
+                if self._is_minder_dir(minder_name) and os.path.isdir(os.path.join(self.minders_folder, minder_name)):
+                    entry = self._describe(minder_name)
+                    self._entries[minder_name] = entry
+                    self._save()
+
+            return entry
+
+    def entries(self) -> dict[str, dict]:
+        '''
+        Returns a copy of all index entries, keyed by minder name.
+        '''
+        with self._lock:
+            self._ensure_fresh()
+            return dict(self._entries)
+
+    def update(self, minder_name: str) -> dict | None:
+        '''
+        (Re)describes a single minder after it has been installed or changed.
+        '''
+        with self._lock:
+            self._ensure_fresh()
+            entry = None
+            if os.path.isdir(os.path.join(self.minders_folder, minder_name)):
+                entry = self._entries[minder_name] = self._describe(minder_name)
+            else:
+                self._entries.pop(minder_name, None)
+            self._folder_mtime = self._stat_folder()
+            self._save()
+            return entry
+
+    def remove(self, minder_name: str) -> None:
+        '''
+        Drops a minder from the index after it has been uninstalled.
+        '''
+        with self._lock:
+            self._ensure_fresh()
+            self._entries.pop(minder_name, None)
+            self._folder_mtime = self._stat_folder()
+            self._save()
+
+    def _ensure_fresh(self) -> None:
+        # Load the persisted index once per process
+        if not self._loaded:
+            self._load()
+            self._loaded = True
+
+        folder_mtime = self._stat_folder()
+        if folder_mtime is None:
+            # No minders folder, nothing is installed
+            self._entries.clear()
+            self._folder_mtime = None
+        elif folder_mtime != self._folder_mtime:
+            self._refresh(folder_mtime)
+
+    def _refresh(self, folder_mtime: int) -> None:
+        # Incremental refresh: describe only the minders that are not indexed yet
+        try:
+            with os.scandir(self.minders_folder) as it:
+                names = {entry.name for entry in it if self._is_minder_dir(entry.name) and entry.is_dir()}
+        except OSError:
+            names = set()
+
+        # Known minders whose config changed (reinstalled or edited in place) are described again
+        entries = {name: entry for name, entry in self._entries.items() if name in names and not self._is_stale(entry)}
+        for name in names - entries.keys():
+            entries[name] = self._describe(name)
+
+        self._entries = entries
+        self._folder_mtime = folder_mtime
+        self._save()
+
+    def _describe(self, minder_name: str) -> dict:
+        # Imported lazily, describing minders is off the hot lookup path
+        import hashlib
+
+        path = os.path.join(self.minders_folder, minder_name)
+        config_path = os.path.join(path, "minder_config.toml")
+
+        config_hash = None
+        mtime = None
+
+        try:
+            with open(config_path, "rb") as f:
+                data = f.read()
+                mtime = os.fstat(f.fileno()).st_mtime_ns
+            config_hash = hashlib.sha256(data).hexdigest()
+        except OSError:
+            # Minders without a config are still indexed by their folder
+            pass
+
+        return {
+            "path": path.replace("\\", "/"),
+            "config_hash": config_hash,
+            "mtime": mtime,
+        }
+
+    def _is_stale(self, entry: dict) -> bool:
+        # One stat of the config file, compared with the mtime recorded by _describe
+        try:
+            mtime = os.stat(os.path.join(entry["path"], "minder_config.toml")).st_mtime_ns
+        except OSError:
+            mtime = None
+        return mtime != entry.get("mtime")
+
+    def _stat_folder(self) -> int | None:
+        try:
+            return os.stat(self.minders_folder).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _is_minder_dir(name: str) -> bool:
+        # Skip hidden and service folders (temporary extraction, staging, locks)
+        return not name.startswith((".", "__"))
+
+    def _load(self) -> None:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get("version") != INDEX_VERSION or data.get("minders_folder") != self.minders_folder:
+            return
+
+        self._entries = data.get("entries", {})
+        self._folder_mtime = data.get("folder_mtime")
+
+    def _save(self) -> None:
+        data = {
+            "version": INDEX_VERSION,
+            "minders_folder": self.minders_folder,
+            "folder_mtime": self._folder_mtime,
+            "entries": self._entries,
+        }
+
+        # Write atomically so that concurrent readers never see a partial file
+        tmp_path = f"{self.index_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            try:
+                os.mkdir(os.path.dirname(self.index_path))
+            except FileExistsError:
+                pass
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            # The index is only an optimisation, a read-only mind folder must keep working
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
@@ -0,0 +1,130 @@
+'''
+Process-wide registry of loaded minder modules
+'''
+
+import importlib.util
+import os
+import sys
+import threading
+from types import ModuleType
+
+class ModuleRegistry:
+    '''
+    Thread-safe registry of the minder modules loaded in this process.
+
+    Modules are keyed by the resolved file path and the file mtime/size, so repeated loads of an
+    unchanged `minder.py` (from any number of `Mind` instances) are a dict lookup, while a changed
+    file is executed again. Concurrent first loads of the same file execute it exactly once.
+
+    Every module gets a unique namespaced name (`guardin_mind_minders.<Folder>_<hash>`) and is
+    registered in `sys.modules`, so two minders never collide on the `minder` module name.
+    '''
+
+    MODULE_PREFIX = "guardin_mind_minders"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._modules: dict[tuple, ModuleType] = {} # (path, mtime, size) -> module
+        self._loading: dict[tuple, threading.Lock] = {} # Per-key locks for single-flight loading
+
+    def load(self, minder_path: str) -> ModuleType:
+        '''
+        Returns the module for the given minder file, executing it only if it was not loaded yet.
+
+        Args:
+            minder_path (str): Path to the minder's Python (.py) file.
+
+        Returns:
+            ModuleType: The loaded module.
+
+        Raises:
+            ImportError: If the module spec cannot be created.
+            Exception: Any exception raised while executing the module.
+        '''
+        path = os.path.realpath(minder_path)
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+
+        # Fast path, no locking
+        module = self._modules.get(key)
+        if module is not None:
+            return module
+
+        with self._lock:
+            module = self._modules.get(key)
+            if module is not None:
+                return module
+            key_lock = self._loading.setdefault(key, threading.Lock())
+
+        try:
+            with key_lock:
+                # Another thread may have loaded the module while we were waiting
+                module = self._modules.get(key)
+                if module is None:
+                    module = self._exec_module(path)
+                    with self._lock:
+                        # Forget older versions of the same file
+                        for old_key in [k for k in self._modules if k[0] == path]:
+                            del self._modules[old_key]
+                        self._modules[key] = module
+        finally:
+            with self._lock:
+                if self._loading.get(key) is key_lock:
+                    del self._loading[key]
+
+        return module
+
+    def invalidate(self, minder_path: str) -> None:
+        '''
+        Forgets every loaded version of the given minder file, the next load executes it again.
+        '''
+        path = os.path.realpath(minder_path)
+        with self._lock:
+            for key in [k for k in self._modules if k[0] == path]:
+                del self._modules[key]
+
+    def module_name(self, path: str) -> str:
+        '''
+        Builds the unique module name for a minder file.
+        '''
+        import hashlib # Only needed on the (cold) module execution path
+
+        folder = os.path.basename(os.path.dirname(path)) or "minder"
+        folder = "".join(c if c.isalnum() else "_" for c in folder)
+        digest = hashlib.sha1(path.encode("utf-8")).hexdigest()[:10]
+        return f"{self.MODULE_PREFIX}.{folder}_{digest}"
+
+    def _exec_module(self, path: str) -> ModuleType:
+        module_name = self.module_name(path)
+        self._ensure_package()
+
+        # Create a module specification from the file location
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot create module spec for minder at path: {path}")
+
+        # Register the module before executing it, like the regular import system does
+        module = importlib.util.module_from_spec(spec)
+        previous = sys.modules.get(module_name)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            # Restore the previous version (if any) on failure
+            if previous is not None:
+                sys.modules[module_name] = previous
+            else:
+                sys.modules.pop(module_name, None)
+            raise
+
+        return module
+
+    def _ensure_package(self) -> None:
+        # The parent package must be importable, otherwise pickle cannot find minder-defined classes
+        if self.MODULE_PREFIX not in sys.modules:
+            package = ModuleType(self.MODULE_PREFIX, "Namespace of the loaded minder modules")
+            package.__path__ = []
+            sys.modules.setdefault(self.MODULE_PREFIX, package)
+
+# Registry shared by every MinderSearch in the process
+module_registry = ModuleRegistry()
@@ -0,0 +1,237 @@
+'''
+Process-pool execution mode for CPU-bound minders
+'''
+
+import asyncio
+import inspect
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from functools import partial
+from guardin_mind.mind_utils import shared_buffers
+
+# Minder instance of the current worker process
+_worker_instance = None
+
+def _init_worker(minders_dir: str, minder_path: str | None, minder_name: str, minder_cls: type | None, args: tuple, kwargs: dict) -> None:
+    '''
+    Worker initializer: discovers the minder the same way `Mind` does and instantiates it once per process.
+    '''
+    global _worker_instance
+
+    if minder_cls is None:
+        from guardin_mind.mind import MinderSearch
+
+        search = MinderSearch(minders_dir=minders_dir)
+        search.minder_path = minder_path
+        minder_cls = search.get_minder(minder_name)
+
+    _worker_instance = minder_cls(*args, **kwargs)
+
+def _ping_worker() -> int:
+    # Warm-up task: the initializer constructed the minder before it runs
+    return os.getpid()
+
+def _call_worker(method_name: str, args: tuple, kwargs: dict, shared_memory_threshold: int | None = None):
+    # Runs a minder method in the worker process, async methods get their own event loop
+    if shared_memory_threshold is not None:
+        args, kwargs = shared_buffers.resolve(args), shared_buffers.resolve(kwargs)
+
+    result = getattr(_worker_instance, method_name)(*args, **kwargs)
+    if inspect.isawaitable(result):
+        result = asyncio.run(result)
+
+    if shared_memory_threshold is not None:
+        result = shared_buffers.share(result, shared_memory_threshold)
+    return result
+
+class ProcessMethod:
+    '''
+    Proxy of a minder method executed in the process pool.
+
+    Calling it keeps the signature style of the original method: sync methods return the result,
+    async methods return an awaitable. `submit()` and `acall()` are available for both.
+    '''
+
+    def __init__(self, owner: "ProcessMinder", name: str, is_coroutine: bool):
+        self._owner = owner
+        self.__name__ = name
+        self.is_coroutine = is_coroutine
+
+    def submit(self, *args, **kwargs) -> Future:
+        '''
+        Schedules the call and returns a `concurrent.futures.Future`.
+        '''
+        threshold = self._owner.shared_memory_threshold
+        if threshold is None:
+            return self._owner._submit(_call_worker, self.__name__, args, kwargs)
+
+        # Large buffers travel through shared memory, only segment references are pickled
+        created = []
+        args, kwargs = shared_buffers.share(args, threshold, created), shared_buffers.share(kwargs, threshold, created)
+        future = self._owner._submit(_call_worker, self.__name__, args, kwargs, threshold)
+
+        result = Future()
+
+        def done(call: Future) -> None:
+            shared_buffers.remove(created) # Segments of a failed call are never claimed by the worker
+            try:
+                result.set_result(shared_buffers.resolve(call.result()))
+            except BaseException as e:
+                result.set_exception(e)
+
+        future.add_done_callback(done)
+        return result
+
+    async def acall(self, *args, **kwargs):
+        '''
+        Awaitable variant of the call, does not block the event loop.
+        '''
+        return await asyncio.wrap_future(self.submit(*args, **kwargs))
+
+    def __call__(self, *args, **kwargs):
+        if self.is_coroutine:
+            return self.acall(*args, **kwargs)
+        return self.submit(*args, **kwargs).result()
+
+    def __repr__(self):
+        return f"<ProcessMethod {self._owner.minder_name}.{self.__name__}>"
+
+class _Worker:
+    '''
+    One worker process: a single-process executor and the calls routed to it
+    '''
+    __slots__ = ("executor", "calls", "pending")
+
+    def __init__(self, executor: ProcessPoolExecutor):
+        self.executor = executor
+        self.calls = 0 # Calls handled by the current process, warm-up pings excluded
+        self.pending = 0 # Calls not finished yet
+
+class ProcessMinder:
+    '''
+    A minder loaded in "process" mode: the class is instantiated in a pool of worker processes
+    and public method calls are proxied transparently.
+
+    Args:
+        mind (Mind): Mind used to discover the minder.
+        minder_cls (type): The minder class (loaded in this process for introspection only).
+        workers (int | None): Pool size, `os.cpu_count()` by default.
+        warm_start (bool): Start every worker and construct its minder instance immediately.
+        recycle_after (int | None): Replace a worker process after it handled this many calls.
+        args (tuple), kwargs (dict): Arguments of the minder constructor.
+        mp_context: multiprocessing context, "spawn" by default.
+        shared_memory_threshold (int | None): Arguments and results of at least this many bytes
+            (bytes, bytearray, memoryview, NumPy arrays) are passed through shared memory instead of the pipe.
+    '''
+
+    def __init__(
+            self,
+            mind,
+            minder_cls: type,
+            workers: int | None = None,
+            warm_start: bool = True,
+            recycle_after: int | None = None,
+            args: tuple = (),
+            kwargs: dict | None = None,
+            mp_context=None,
+            shared_memory_threshold: int | None = None
+        ):
+        self.minder_name = minder_cls.__name__
+        self.minder_cls = minder_cls
+        self.workers = workers or os.cpu_count() or 1
+        self.recycle_after = recycle_after
+        self.shared_memory_threshold = shared_memory_threshold
+
+        # Workers discover minders from their folder, other classes are passed by reference
+        minder_file = inspect.getfile(minder_cls)
+        if os.path.basename(minder_file) == "minder.py":
+            minder_path, pickled_cls = os.path.dirname(minder_file), None
+        else:
+            minder_path, pickled_cls = None, minder_cls
+
+        # One single-process executor per worker: calls are counted here, so warm-up pings are not calls
+        self._new_executor = partial(
+            ProcessPoolExecutor,
+            max_workers=1,
+            mp_context=mp_context or multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(os.fspath(mind.minders_dir), minder_path, self.minder_name, pickled_cls, tuple(args), dict(kwargs or {})),
+        )
+        self._lock = threading.Lock()
+        self._workers = [_Worker(self._new_executor()) for _ in range(self.workers)]
+        self._closed = False
+        self._methods: dict[str, ProcessMethod] = {}
+
+        if warm_start:
+            self.warm_up()
+
+    def warm_up(self, timeout: float | None = None) -> list[int]:
+        '''
+        Starts every worker process and constructs its minder instance. Returns the worker PIDs.
+
+        Warm-up pings do not count against `recycle_after`. A worker that fails to construct
+        its minder raises `BrokenProcessPool`.
+        '''
+        with self._lock:
+            pings = [worker.executor.submit(_ping_worker) for worker in self._workers]
+
+        _, not_done = wait(pings, timeout)
+        if not_done:
+            raise TimeoutError(f"Workers of {self.minder_name} did not start in {timeout} seconds")
+        return [ping.result() for ping in pings]
+
+    def shutdown(self, wait: bool = True) -> None:
+        '''
+        Stops the worker processes.
+        '''
+        with self._lock:
+            self._closed = True
+            executors = [worker.executor for worker in self._workers]
+        for executor in executors:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _submit(self, fn, *args) -> Future:
+        # Routes a call to the least busy worker and replaces the workers that reached `recycle_after`
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"ProcessMinder {self.minder_name} is shut down")
+
+            worker = min(self._workers, key=lambda worker: worker.pending)
+            future = worker.executor.submit(fn, *args)
+            worker.pending += 1
+            worker.calls += 1
+
+            if self.recycle_after is not None and worker.calls >= self.recycle_after:
+                retired, worker.executor, worker.calls = worker.executor, self._new_executor(), 0
+                retired.shutdown(wait=False) # The process exits once its queued calls are done
+                worker.executor.submit(_ping_worker) # The replacement starts right away, without using a call
+
+        future.add_done_callback(partial(self._call_done, worker))
+        return future
+
+    def _call_done(self, worker: _Worker, future: Future) -> None:
+        with self._lock:
+            worker.pending -= 1
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        method = self._methods.get(name)
+        if method is None:
+            attr = getattr(self.minder_cls, name, None)
+            if not callable(attr):
+                raise AttributeError(f"Minder '{self.minder_name}' has no method '{name}'")
+            method = self._methods[name] = ProcessMethod(self, name, inspect.iscoroutinefunction(attr))
+        return method
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+    def __repr__(self):
+        return f"<ProcessMinder {self.minder_name} workers={self.workers}>"
@@ -0,0 +1,297 @@
+'''
+Profiling hooks for minder methods: deterministic (cProfile) and sampling (collapsed stacks)
+'''
+
+import cProfile
+import inspect
+import os
+import pstats
+import sys
+import tempfile
+import threading
+from collections import Counter
+from functools import wraps
+from time import perf_counter, thread_time
+
+class MinderProfiler:
+    '''
+    Profiles the calls of selected minders and methods, aggregated across calls and threads.
+
+    Deterministic profiling uses one cProfile profiler per thread, merged by `stats()`.
+    Sampling records the stacks of threads running a profiled call every `sampling_interval` seconds
+    and writes them in the collapsed format used by flamegraph tools.
+
+    Async methods are driven step by step: the profilers only run while the coroutine executes,
+    so time spent awaiting is reported separately (`await_time`) and not attributed to functions.
+
+    Args:
+        minders (list[str] | None): Minder names to profile, all by default.
+        methods (list[str] | None): Method names to profile, all public methods by default.
+        deterministic (bool): Record every function call with cProfile.
+        sampling_interval (float | None): Seconds between stack samples, None disables sampling.
+    '''
+
+    def __init__(self, minders: list[str] | None = None, methods: list[str] | None = None, deterministic: bool = True, sampling_interval: float | None = None):
+        self.minders = set(minders) if minders is not None else None
+        self.methods = set(methods) if methods is not None else None
+        self.deterministic = deterministic
+        self.sampling_interval = sampling_interval
+        self.enabled = True
+
+        self._lock = threading.Lock()
+        self._local = threading.local() # Per thread: profile, depth of profiled calls
+        self._profiles: list[cProfile.Profile] = []
+        self._timings: dict[tuple[str, str], dict] = {}
+
+        # Sampling
+        self._active: set[int] = set() # Threads running a profiled call
+        self._samples: Counter = Counter()
+        self._sampler = None
+        self._sampler_stop = threading.Event()
+        if sampling_interval is not None:
+            self._start_sampler()
+
+    def instrument_class(self, cls: type) -> type:
+        '''
+        Returns a subclass of a minder class whose selected methods are profiled (a `Mind` class hook).
+        '''
+        if self.minders is not None and cls.__name__ not in self.minders:
+            return cls
+        if cls.__dict__.get("__minder_profiler__") is self:
+            return cls
+
+        namespace = {
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "__doc__": cls.__doc__,
+            "__minder_profiler__": self,
+        }
+        for name in dir(cls):
+            if name.startswith("_") or (self.methods is not None and name not in self.methods):
+                continue
+            func = inspect.getattr_static(cls, name)
+            if inspect.isfunction(func):
+                namespace[name] = self._wrap(func, (cls.__name__, name))
+
+        return type(cls)(cls.__name__, (cls,), namespace)
+
+    def stop(self) -> None:
+        '''
+        Stops profiling (wrapped methods call through) and the sampling thread.
+        '''
+        self.enabled = False
+        self._sampler_stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def start(self) -> None:
+        '''
+        Resumes profiling after `stop()`.
+        '''
+        self.enabled = True
+        if self.sampling_interval is not None and self._sampler is None:
+            self._sampler_stop.clear()
+            self._start_sampler()
+
+    def timings(self) -> dict[str, dict[str, dict]]:
+        '''
+        Returns per-method timings (seconds), keyed by minder and method name:
+        calls, errors, wall_time, cpu_time and await_time (async methods only).
+        '''
+        result = {}
+        with self._lock:
+            for (minder, method), timing in self._timings.items():
+                result.setdefault(minder, {})[method] = dict(timing)
+        return result
+
+    def stats(self) -> pstats.Stats:
+        '''
+        Returns the deterministic profile merged across threads.
+        Call it once the profiled calls have finished.
+        '''
+        stats = pstats.Stats()
+        with self._lock:
+            profiles = list(self._profiles)
+        for profile in profiles:
+            stats.add(_ProfileSnapshot(profile))
+        return stats
+
+    def dump_stats(self, path: str) -> None:
+        '''
+        Writes the merged profile in the pstats format (`python -m pstats`, snakeviz, ...).
+        '''
+        self.stats().dump_stats(path)
+
+    def collapsed_stacks(self) -> str:
+        '''
+        Returns the sampled stacks in the collapsed format (`frame;frame;frame count` per line).
+        '''
+        with self._lock:
+            samples = sorted(self._samples.items())
+        return "".join(f"{stack} {count}\n" for stack, count in samples)
+
+    def write_collapsed(self, path: str) -> None:
+        '''
+        Writes the sampled stacks for flamegraph.pl, speedscope or inferno.
+        '''
+        folder = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.collapsed_stacks())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _enter(self) -> bool:
+        # Starts the profilers for the outermost profiled call of the thread
+        local = self._local
+        depth = getattr(local, "depth", 0)
+        local.depth = depth + 1
+        if depth:
+            return False
+
+        if self.deterministic:
+            profile = getattr(local, "profile", None)
+            if profile is None:
+                profile = local.profile = cProfile.Profile()
+                with self._lock:
+                    self._profiles.append(profile)
+            profile.enable()
+        if self.sampling_interval is not None:
+            self._active.add(threading.get_ident())
+        return True
+
+    def _exit(self, outermost: bool) -> None:
+        self._local.depth -= 1
+        if outermost:
+            if self.deterministic:
+                self._local.profile.disable()
+            self._active.discard(threading.get_ident())
+
+    def _record(self, key: tuple[str, str], wall_time: float, cpu_time: float, await_time: float, error: bool) -> None:
+        with self._lock:
+            timing = self._timings.get(key)
+            if timing is None:
+                timing = self._timings[key] = {"calls": 0, "errors": 0, "wall_time": 0.0, "cpu_time": 0.0, "await_time": 0.0}
+            timing["calls"] += 1
+            timing["errors"] += error
+            timing["wall_time"] += wall_time
+            timing["cpu_time"] += cpu_time
+            timing["await_time"] += await_time
+
+    def _wrap(self, func, key: tuple[str, str]):
+        profiler = self
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not profiler.enabled:
+                    return await func(*args, **kwargs)
+                return await _ProfiledCoroutine(profiler, key, func(*args, **kwargs))
+
+            return async_wrapper
+
+        @wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+
+            error = False
+            wall, cpu = perf_counter(), thread_time()
+            outermost = profiler._enter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                error = True
+                raise
+            finally:
+                profiler._exit(outermost)
+                profiler._record(key, perf_counter() - wall, thread_time() - cpu, 0.0, error)
+
+        return sync_wrapper
+
+    def _start_sampler(self) -> None:
+        self._sampler = threading.Thread(target=self._sample_loop, name="mind-profiler", daemon=True)
+        self._sampler.start()
+
+    def _sample_loop(self) -> None:
+        while not self._sampler_stop.wait(self.sampling_interval):
+            active = list(self._active)
+            if not active:
+                continue
+            frames = sys._current_frames()
+            stacks = []
+            for thread_id in active:
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    stacks.append(_collapse(frame))
+            with self._lock:
+                self._samples.update(stacks)
+
+class _ProfiledCoroutine:
+    '''
+    Drives a coroutine step by step with the profilers running only inside the steps.
+    '''
+
+    def __init__(self, profiler: MinderProfiler, key: tuple[str, str], coro):
+        self.profiler = profiler
+        self.key = key
+        self.coro = coro
+
+    def __await__(self):
+        profiler, coro = self.profiler, self.coro
+        start = perf_counter()
+        run_time = cpu_time = 0.0
+        value, exception = None, None
+
+        while True:
+            step, step_cpu = perf_counter(), thread_time()
+            outermost = profiler._enter()
+            try:
+                yielded = coro.send(value) if exception is None else coro.throw(exception)
+            except StopIteration as stop:
+                done, result, error = True, stop.value, None
+            except BaseException as e:
+                done, result, error = True, None, e
+            else:
+                done = False
+            finally:
+                profiler._exit(outermost)
+                run_time += perf_counter() - step
+                cpu_time += thread_time() - step_cpu
+
+            if done:
+                wall_time = perf_counter() - start
+                profiler._record(self.key, wall_time, cpu_time, wall_time - run_time, isinstance(error, Exception))
+                if error is not None:
+                    raise error
+                return result
+
+            # Awaiting (outside the profilers)
+            try:
+                value, exception = (yield yielded), None
+            except BaseException as e:
+                value, exception = None, e
+
+class _ProfileSnapshot:
+    '''
+    Stats of a profiler that may still be enabled in its thread (pstats would disable it from this thread).
+    '''
+
+    def __init__(self, profile: cProfile.Profile):
+        profile.snapshot_stats()
+        self.stats = profile.stats
+
+    def create_stats(self) -> None:
+        pass
+
+def _collapse(frame) -> str:
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(stack))
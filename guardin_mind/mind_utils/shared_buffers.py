@@ -0,0 +1,180 @@
+'''
+Shared-memory transport of large buffers between processes.
+
+Large `bytes`, `bytearray`, `memoryview` and NumPy array values are written once into a memory-mapped
+segment file (under /dev/shm when available, otherwise under the mind folder) and only a small
+`SharedSegment` reference travels through the pipe or socket. The receiver maps the segment and
+unlinks its file right away: the mapping lives as long as any view of it is referenced, so the
+segment is freed by reference counting. A value that is dropped without being resolved (cancelled
+call, closed connection) must be passed to `release()` instead, or its segment files stay behind.
+
+Received values:
+    bytes, bytearray - copied once out of the segment (they own their memory)
+    memoryview, numpy.ndarray - zero-copy views of the segment
+
+Only top-level arguments and results, and the items of top-level lists, tuples and dicts, are shared.
+'''
+
+import itertools
+import mmap
+import os
+import secrets
+import sys
+from guardin_mind.configs import _default_mind_folder
+
+# Folder of the segment files: tmpfs on Linux, a folder of the mind folder elsewhere
+SEGMENT_FOLDER = "/dev/shm" if os.path.isdir("/dev/shm") else os.path.join(_default_mind_folder, "shm")
+
+_MAX_DEPTH = 2 # Containers are walked down to their items (arguments tuple -> list argument -> items)
+_counter = itertools.count()
+
+class SharedSegment:
+    '''
+    Reference to a segment file, pickled in place of the buffer it holds.
+    '''
+    __slots__ = ("path", "size", "kind", "dtype", "shape")
+
+    def __init__(self, path: str, size: int, kind: str, dtype=None, shape: tuple | None = None):
+        self.path = path
+        self.size = size
+        self.kind = kind # "bytes", "bytearray", "memoryview" or "ndarray"
+        self.dtype = dtype # memoryview format or NumPy dtype
+        self.shape = shape
+
+    def __reduce__(self):
+        return (SharedSegment, (self.path, self.size, self.kind, self.dtype, self.shape))
+
+    def __repr__(self):
+        return f"<SharedSegment {self.kind} {self.size} bytes>"
+
+def share(obj, threshold: int, created: list | None = None, _depth: int = 0):
+    '''
+    Replaces buffers of at least `threshold` bytes with `SharedSegment` references.
+
+    Args:
+        obj: Value to send (usually the arguments tuple, the keyword arguments dict or a result).
+        threshold (int): Minimum buffer size in bytes.
+        created (list | None): Receives the paths of the created segments, so the sender can
+            remove the ones a failed call never claimed (see `remove()`).
+    '''
+    segment = _share_buffer(obj, max(threshold, 1))
+    if segment is not None:
+        if created is not None:
+            created.append(segment.path)
+        return segment
+
+    if _depth < _MAX_DEPTH:
+        obj_type = type(obj)
+        if obj_type is tuple or obj_type is list:
+            return obj_type(share(item, threshold, created, _depth + 1) for item in obj)
+        if obj_type is dict:
+            return {key: share(value, threshold, created, _depth + 1) for key, value in obj.items()}
+    return obj
+
+def resolve(obj, _depth: int = 0):
+    '''
+    Replaces `SharedSegment` references with the buffers they hold (inverse of `share()`).
+    '''
+    obj_type = type(obj)
+    if obj_type is SharedSegment:
+        return attach(obj)
+
+    if _depth < _MAX_DEPTH:
+        if obj_type is tuple or obj_type is list:
+            return obj_type(resolve(item, _depth + 1) for item in obj)
+        if obj_type is dict:
+            return {key: resolve(value, _depth + 1) for key, value in obj.items()}
+    return obj
+
+def release(obj, _depth: int = 0) -> None:
+    '''
+    Unlinks the segments referenced by a value that will never be resolved.
+    '''
+    obj_type = type(obj)
+    if obj_type is SharedSegment:
+        remove([obj.path])
+    elif _depth < _MAX_DEPTH:
+        if obj_type is tuple or obj_type is list:
+            for item in obj:
+                release(item, _depth + 1)
+        elif obj_type is dict:
+            for value in obj.values():
+                release(value, _depth + 1)
+
+def attach(segment: SharedSegment):
+    '''
+    Maps a segment and takes its ownership (the segment file is unlinked).
+    '''
+    fd = os.open(segment.path, os.O_RDWR)
+    try:
+        mapping = mmap.mmap(fd, segment.size)
+    finally:
+        os.close(fd)
+
+    # The mapping stays valid after the unlink, it is released with its last view
+    try:
+        os.unlink(segment.path)
+    except OSError:
+        pass
+
+    if segment.kind == "bytes":
+        data = mapping[:]
+        mapping.close()
+        return data
+    if segment.kind == "bytearray":
+        data = bytearray(mapping)
+        mapping.close()
+        return data
+    if segment.kind == "ndarray":
+        import numpy
+        return numpy.frombuffer(mapping, dtype=segment.dtype).reshape(segment.shape)
+
+    view = memoryview(mapping)
+    if segment.dtype != "B" or len(segment.shape) != 1:
+        view = view.cast(segment.dtype, segment.shape)
+    return view
+
+def remove(paths: list[str]) -> None:
+    '''
+    Removes segments that were never attached by a receiver.
+    '''
+    for path in paths:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+def _share_buffer(obj, threshold: int) -> SharedSegment | None:
+    obj_type = type(obj)
+    if obj_type is bytes or obj_type is bytearray:
+        if len(obj) < threshold:
+            return None
+        return SharedSegment(_write_segment(obj), len(obj), obj_type.__name__)
+
+    if obj_type is memoryview:
+        if obj.nbytes < threshold or obj.ndim == 0 or not obj.c_contiguous:
+            return None
+        return SharedSegment(_write_segment(obj.cast("B") if obj.ndim == 1 else obj.tobytes()), obj.nbytes, "memoryview", obj.format, obj.shape)
+
+    # NumPy is never imported here: a NumPy array can only exist if NumPy was imported by the caller
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and obj_type is numpy.ndarray:
+        if obj.nbytes < threshold or obj.dtype.hasobject:
+            return None
+        data = numpy.ascontiguousarray(obj).reshape(-1).view(numpy.uint8)
+        return SharedSegment(_write_segment(data), obj.nbytes, "ndarray", obj.dtype, obj.shape)
+
+    return None
+
+def _write_segment(data) -> str:
+    os.makedirs(SEGMENT_FOLDER, exist_ok=True)
+    path = os.path.join(SEGMENT_FOLDER, f"guardin_mind-{os.getpid()}-{next(_counter)}-{secrets.token_hex(4)}")
+
+    fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    try:
+        with open(fd, "wb") as f:
+            f.write(data)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
@@ -1 +1,2 @@
-from .package_manager import install_minder, uninstall_minder
\ No newline at end of file
+from .package_manager import install_minder, install_minders, uninstall_minder
+from .lockfile import lock_minders, install_locked
\ No newline at end of file
@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import requests
+from guardin_mind.configs import _default_cache_folder, _archive_url_template
+from guardin_mind.mind_utils.exceptions import ArchiveDownloadError
+
+DEFAULT_REF = "refs/heads/main" # Git ref downloaded when no other ref is given
+CHUNK_SIZE = 1024 * 1024 # Download chunk size (1 MiB)
+REQUEST_TIMEOUT = 30 # Seconds to wait for the server to respond
+
+class ArchiveCache:
+    """
+    Streaming, content-addressed cache of minder archives.
+
+    Layout of the cache folder:
+        blobs/<sha256>.zip   - archives, named by the hash of their content
+        refs/<key>.json      - repo + ref -> sha256 and ETag of the last downloaded archive
+
+    Archives are streamed to disk in chunks (never held in memory). A cached archive is
+    revalidated with a conditional request (If-None-Match), so a repeated install costs
+    one round trip, and none when the ref is an immutable commit SHA or the network is down.
+    """
+
+    def __init__(self, cache_folder: str | None = None, url_template: str | None = None):
+        self.cache_folder = os.path.join(cache_folder or _default_cache_folder, "archives")
+        self.url_template = url_template or _archive_url_template
+
+    def archive_url(self, repo: str, ref: str = DEFAULT_REF) -> str:
+        """
+        Builds the download URL of a repo archive
+        """
+        return self.url_template.format(repo=repo, ref=ref)
+
+    def blob_path(self, sha256: str) -> str:
+        """
+        Path of the cached archive with the given content hash
+        """
+        return os.path.join(self.cache_folder, "blobs", f"{sha256}.zip")
+
+    def cached(self, repo: str, ref: str = DEFAULT_REF) -> dict | None:
+        """
+        Returns the cache metadata (url, sha256, etag) of a repo + ref if its archive is cached
+        """
+        try:
+            with open(self._ref_path(repo, ref), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not os.path.isfile(self.blob_path(meta.get("sha256", ""))):
+            return None
+        return meta
+
+    def fetch(self, repo: str, ref: str = DEFAULT_REF, offline: bool = False, sha256: str | None = None) -> str:
+        """
+        Returns the path of the cached archive of a repo + ref, downloading it if needed.
+
+        Args:
+            repo (str): GitHub repo in the `author/Minder` format.
+            ref (str): Git ref (branch ref or commit SHA).
+            offline (bool): Never access the network, use the cached archive only.
+            sha256 (str | None): Expected archive hash. A cached blob with this hash is used as is.
+
+        Raises:
+            ArchiveDownloadError: If the archive cannot be downloaded and is not cached.
+        """
+
+        # Content-addressed lookup of an archive with a known hash
+        if sha256 is not None and os.path.isfile(self.blob_path(sha256)):
+            return self.blob_path(sha256)
+
+        meta = self.cached(repo, ref)
+
+        # Archives of commit SHAs never change, no need to revalidate them
+        if meta is not None and (offline or re.fullmatch(r"[0-9a-f]{40}", ref)):
+            return self.blob_path(meta["sha256"])
+        if offline:
+            raise ArchiveDownloadError(f"Archive of {repo}@{ref} is not cached")
+
+        url = self.archive_url(repo, ref)
+        headers = {}
+        if meta is not None and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+
+        try:
+            with requests.get(url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT) as response:
+                if response.status_code == 304 and meta is not None:
+                    # Not modified, use the cached archive
+                    return self.blob_path(meta["sha256"])
+
+                if response.status_code != 200:
+                    raise ArchiveDownloadError(f"Error code: {response.status_code} for {url}")
+
+                digest = self._store(response)
+                self._write_ref(repo, ref, {"url": url, "sha256": digest, "etag": response.headers.get("ETag")})
+                return self.blob_path(digest)
+
+        except requests.RequestException as e:
+            # Offline: fall back to the last downloaded archive
+            if meta is not None:
+                return self.blob_path(meta["sha256"])
+            raise ArchiveDownloadError(f"Cannot download {url}: {e}") from e
+
+    def _store(self, response) -> str:
+        # Stream the response to a temporary file while hashing it, then move it to its content address
+        blobs_folder = os.path.join(self.cache_folder, "blobs")
+        os.makedirs(blobs_folder, exist_ok=True)
+
+        digest = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=blobs_folder, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    f.write(chunk)
+                    digest.update(chunk)
+            os.replace(tmp_path, self.blob_path(digest.hexdigest()))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return digest.hexdigest()
+
+    def _ref_path(self, repo: str, ref: str) -> str:
+        key = hashlib.sha256(f"{repo}@{ref}".encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_folder, "refs", f"{key}.json")
+
+    def _write_ref(self, repo: str, ref: str, meta: dict) -> None:
+        ref_path = self._ref_path(repo, ref)
+        os.makedirs(os.path.dirname(ref_path), exist_ok=True)
+
+        # Write atomically, several installs may share the cache
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(ref_path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"repo": repo, "ref": ref, **meta}, f)
+        os.replace(tmp_path, ref_path)
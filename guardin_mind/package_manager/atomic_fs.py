@@ -0,0 +1,188 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+LOCKS_FOLDER_NAME = ".locks" # Inside the minders folder, hidden from the minders index
+STAGING_PREFIX = ".staging-" # Unique extraction folders of installs in progress
+TRASH_PREFIX = ".trash-" # Replaced and uninstalled minders waiting for deletion
+
+class FileLock:
+    """
+    Exclusive inter-process lock on a file (flock on POSIX, msvcrt on Windows).
+
+    Two processes, or two threads of one process, holding a FileLock on the same path
+    never run their critical sections at the same time. The lock is released by the OS
+    if the process dies, so a crashed install never blocks the next one.
+    """
+
+    def __init__(self, path: str, timeout: float | None = None):
+        self.path = path
+        self.timeout = timeout
+        self._fd = None
+
+    def acquire(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        try:
+            while not self._try_lock(fd, blocking=deadline is None):
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for the lock {self.path}")
+                time.sleep(0.05)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            self._unlock(self._fd)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+    @staticmethod
+    def _try_lock(fd: int, blocking: bool) -> bool:
+        try:
+            import fcntl
+        except ImportError:
+            import msvcrt
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                    return True
+                except OSError:
+                    if not blocking:
+                        return False
+                    time.sleep(0.05)
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+
+    @staticmethod
+    def _unlock(fd: int) -> None:
+        try:
+            import fcntl
+        except ImportError:
+            import msvcrt
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+def minder_lock(install_path: str, minder: str, timeout: float | None = None) -> FileLock:
+    """
+    Lock serializing the installs and uninstalls of one minder in one minders folder.
+    Different minders are installed into the same folder in parallel.
+    """
+    return FileLock(os.path.join(install_path, LOCKS_FOLDER_NAME, f"{minder}.lock"), timeout)
+
+def make_staging_folder(install_path: str, minder: str) -> str:
+    """
+    Creates a unique staging folder inside the minders folder (same filesystem, so it can be
+    published with a rename). The caller deletes it with `discard_folder()`.
+    """
+    os.makedirs(install_path, exist_ok=True)
+    return tempfile.mkdtemp(prefix=f"{STAGING_PREFIX}{minder}-", dir=install_path)
+
+@contextmanager
+def staging_folder(install_path: str, minder: str):
+    """
+    Staging folder (see `make_staging_folder()`) whose leftovers are deleted afterwards.
+    """
+    path = make_staging_folder(install_path, minder)
+    try:
+        yield path
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+def publish_folder(source: str, destination: str) -> None:
+    """
+    Moves a fully prepared folder to its final path. Readers see either the old folder or the
+    new one, never a missing or partial one: an existing folder is swapped with renameat2
+    (RENAME_EXCHANGE) where available, otherwise it is moved aside right before the new one
+    is renamed into place. The old folder is deleted afterwards.
+    """
+    if not os.path.exists(destination):
+        os.rename(source, destination)
+        return
+
+    if _exchange(source, destination):
+        # `source` now holds the old folder
+        discard_folder(source)
+        return
+
+    trash = _trash_path(destination)
+    os.rename(destination, trash)
+    try:
+        os.rename(source, destination)
+    except BaseException:
+        os.rename(trash, destination) # Put the old version back
+        raise
+    discard_folder(trash)
+
+def remove_folder(path: str) -> None:
+    """
+    Removes a folder so that it disappears at once (one rename), then deletes its content.
+    """
+    trash = _trash_path(path)
+    os.rename(path, trash)
+    discard_folder(trash)
+
+def discard_folder(path: str) -> None:
+    # The deletion is not visible to readers any more, a failure only leaves a hidden folder behind
+    shutil.rmtree(path, ignore_errors=True)
+
+def _trash_path(path: str) -> str:
+    folder, name = os.path.split(os.path.abspath(path))
+    return os.path.join(folder, f"{TRASH_PREFIX}{name}-{uuid.uuid4().hex}")
+
+_renameat2 = None
+_renameat2_lock = threading.Lock()
+
+def _exchange(first: str, second: str) -> bool:
+    """
+    Atomically swaps two paths with renameat2(RENAME_EXCHANGE) (Linux 3.15+, glibc 2.28+).
+    Returns False if the system does not support it.
+    """
+    global _renameat2
+
+    with _renameat2_lock:
+        if _renameat2 is None:
+            _renameat2 = False
+            try:
+                import ctypes # Imported lazily, only installs over an existing minder need it
+                libc = ctypes.CDLL(None, use_errno=True)
+                _renameat2 = (ctypes, libc.renameat2)
+            except (OSError, AttributeError):
+                pass
+
+    if not _renameat2:
+        return False
+
+    ctypes, renameat2 = _renameat2
+    AT_FDCWD = -100
+    RENAME_EXCHANGE = 2
+    if renameat2(AT_FDCWD, os.fsencode(first), AT_FDCWD, os.fsencode(second), RENAME_EXCHANGE) == 0:
+        return True
+
+    errno = ctypes.get_errno()
+    if errno in (22, 38, 95): # EINVAL, ENOSYS, EOPNOTSUPP: not supported by the kernel or filesystem
+        return False
+    raise OSError(errno, os.strerror(errno), second)
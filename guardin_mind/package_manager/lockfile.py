@@ -0,0 +1,324 @@
+from colorama import Fore, Style, init
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import tomllib
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+import requests
+from pydantic import validate_arguments
+from guardin_mind import ArchiveDownloadError, LockfileError
+from guardin_mind.configs import _default_minders_folder, _commit_url_template, ensure_minders_folder
+from guardin_mind.mind_utils.minder_index import MinderIndex
+from guardin_mind.package_manager.archive_cache import ArchiveCache, REQUEST_TIMEOUT
+from guardin_mind.package_manager.atomic_fs import minder_lock
+from guardin_mind.package_manager.package_manager import (
+    DEFAULT_MAX_WORKERS, init_install_uninstall, check_minder_versions, extract_repo_zip, _walk_graph, _topological_order
+)
+
+LOCK_VERSION = 1
+DEFAULT_LOCK_FILE = "mind.lock" # Created in the current folder by `mind lock`
+DEFAULT_BRANCH = "main" # Branch locked by `mind lock`
+SOURCE_FILE_NAME = ".minder_source.json" # Written into every minder installed from a lockfile
+
+@dataclass
+class LockedMinder:
+    """
+    A minder pinned to an exact commit and archive
+    """
+    author_minder: str
+    minder: str
+    repo: str
+    commit: str
+    sha256: str # Hash of the commit archive
+    version: str
+    requires: list[str] = field(default_factory=list) # Names of the required minders
+    install_requires: list[str] = field(default_factory=list) # Python requirements of the minder
+
+def resolve_commit(repo: str, branch: str = DEFAULT_BRANCH, url_template: str | None = None) -> str:
+    """
+    Returns the SHA of the latest commit of a minder repo branch
+    """
+    url = (url_template or _commit_url_template).format(repo=repo, branch=branch)
+    try:
+        response = requests.get(url, headers={"Accept": "application/vnd.github+json"}, timeout=REQUEST_TIMEOUT)
+    except requests.RequestException as e:
+        raise ArchiveDownloadError(f"Cannot resolve {repo}@{branch}: {e}") from e
+
+    if response.status_code != 200:
+        raise ArchiveDownloadError(f"Error code: {response.status_code} for {url}")
+    try:
+        return response.json()["sha"]
+    except (ValueError, KeyError, TypeError):
+        raise ArchiveDownloadError(f"No commit SHA in the response of {url}")
+
+def read_archive_config(archive_path: str) -> dict:
+    """
+    Reads minder_config.toml from a repository archive without extracting it
+    """
+    with zipfile.ZipFile(archive_path) as z:
+        # Expecting a single top-level folder inside the archive (e.g., HelloWorld-<sha>)
+        top_folders = {name.split("/", 1)[0] for name in z.namelist()}
+        if len(top_folders) != 1:
+            raise LockfileError(f"Unexpected archive structure: {archive_path}")
+        try:
+            data = z.read(f"{top_folders.pop()}/minder_config.toml")
+        except KeyError:
+            raise LockfileError(f"No minder_config.toml in {archive_path}")
+
+    config = tomllib.loads(data.decode("utf-8"))
+    if "name" not in config.get("minder", {}) or "version" not in config.get("minder", {}):
+        raise LockfileError(f"minder_config.toml of {archive_path} requires the name and version fields")
+    return config
+
+def file_sha256(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+def resolve_python_requirements(requirements: list[str]) -> list[dict]:
+    """
+    Resolves Python requirements to exact versions and artifact hashes with `pip install --dry-run --report`.
+    Returns one entry (name, version, sha256) per package of the resolved set.
+    """
+    requirements = list(dict.fromkeys(requirements))
+    if not requirements:
+        return []
+
+    with tempfile.TemporaryDirectory() as folder:
+        report_path = os.path.join(folder, "report.json")
+        subprocess.check_call([
+            sys.executable, "-m", "pip", "install", "--dry-run", "--quiet", "--ignore-installed",
+            "--report", report_path, *requirements
+        ])
+        with open(report_path, "r", encoding="utf-8") as f:
+            report = json.load(f)
+
+    packages = []
+    for item in report.get("install", []):
+        archive_info = item.get("download_info", {}).get("archive_info", {})
+        sha256 = archive_info.get("hashes", {}).get("sha256")
+        if sha256 is None and archive_info.get("hash", "").startswith("sha256="):
+            sha256 = archive_info["hash"].split("=", 1)[1]
+        packages.append({"name": item["metadata"]["name"], "version": item["metadata"]["version"], "sha256": sha256})
+    return sorted(packages, key=lambda package: package["name"].lower())
+
+def install_python_locked(packages: list[dict], offline: bool = False, wheel_folder: str | None = None) -> None:
+    """
+    Installs the locked Python packages with one pip call, verifying every package hash.
+    Offline, pip does not use the package index: packages come from `wheel_folder` (see `download_python_locked()`).
+    """
+    if not packages:
+        return
+
+    options = ["--find-links", wheel_folder] if wheel_folder else []
+    if offline:
+        options.insert(0, "--no-index")
+    _pip_locked(["install", "--no-deps", *options], packages)
+
+def download_python_locked(packages: list[dict], wheel_folder: str) -> None:
+    """
+    Downloads the locked Python packages into a folder, for offline installs with `install_python_locked()`
+    """
+    if packages:
+        os.makedirs(wheel_folder, exist_ok=True)
+        _pip_locked(["download", "--no-deps", "--dest", wheel_folder], packages)
+
+def _pip_locked(command: list[str], packages: list[dict]) -> None:
+    # Runs pip with a requirements file pinning every package to its version and hash
+    unhashed = [package["name"] for package in packages if not package.get("sha256")]
+    if unhashed:
+        raise LockfileError(f"No sha256 hash locked for {', '.join(unhashed)}")
+
+    lines = [f"{package['name']}=={package['version']} --hash=sha256:{package['sha256']}" for package in packages]
+
+    with tempfile.TemporaryDirectory() as folder:
+        requirements_path = os.path.join(folder, "requirements.txt")
+        with open(requirements_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+        subprocess.check_call([sys.executable, "-m", "pip", *command, "--require-hashes", "-r", requirements_path])
+
+def write_lockfile(path: str, roots: list[str], minders: list[LockedMinder], python: list[dict]) -> None:
+    """
+    Writes a lockfile atomically
+    """
+    data = {
+        "version": LOCK_VERSION,
+        "roots": roots,
+        "minders": {node.author_minder: {key: value for key, value in asdict(node).items() if key != "author_minder"} for node in minders},
+        "python": python,
+    }
+
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+def read_lockfile(path: str) -> tuple[list[str], dict[str, LockedMinder], list[dict]]:
+    """
+    Reads a lockfile. Returns the root minders, the locked minders keyed by `author_minder` and the Python packages.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise LockfileError(f"Cannot read lockfile {path}: {e}")
+
+    if data.get("version") != LOCK_VERSION:
+        raise LockfileError(f"Unsupported lockfile version: {data.get('version')} (expected {LOCK_VERSION})")
+
+    try:
+        minders = {name: LockedMinder(author_minder=name, **entry) for name, entry in data["minders"].items()}
+    except (KeyError, TypeError) as e:
+        raise LockfileError(f"Invalid lockfile {path}: {e}")
+
+    # Every required minder must be locked too
+    for node in minders.values():
+        for dependency in node.requires:
+            if dependency not in minders:
+                raise LockfileError(f"Minder {dependency} required by {node.author_minder} is not locked")
+
+    return data.get("roots", []), minders, data.get("python", [])
+
+@validate_arguments
+def lock_minders(
+        author_minders: list[str],
+        lock_path: str = DEFAULT_LOCK_FILE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        branch: str = DEFAULT_BRANCH,
+        cache_folder: str | None = None,
+        wheel_folder: str | None = None
+    ) -> list[LockedMinder]:
+    """
+    Resolves the minders, their required minders and their Python requirements to exact commits,
+    archive hashes and package versions, and writes them to a lockfile.
+    The archives are stored in the local archive cache and, with `wheel_folder`, the Python packages
+    are downloaded into that folder, so the lockfile can then be installed offline.
+    """
+
+    init() # Initialize colorama for colored terminal output
+
+    cache = ArchiveCache(cache_folder)
+
+    def fetch(author_minder: str) -> LockedMinder:
+        author, minder, _ = init_install_uninstall(author_minder, os.getcwd()) # Only validates the name
+        repo = f"{author}/{minder}"
+
+        print(Fore.WHITE + f"Locking {author_minder}" + Style.RESET_ALL)
+        commit = resolve_commit(repo, branch)
+        archive_path = cache.fetch(repo, commit)
+        config = read_archive_config(archive_path)["minder"]
+
+        return LockedMinder(
+            author_minder=author_minder,
+            minder=minder,
+            repo=repo,
+            commit=commit,
+            sha256=file_sha256(archive_path),
+            version=config["version"],
+            requires=list(config.get("requires-minders", [])),
+            install_requires=list(config.get("install-requires", [])),
+        )
+
+    nodes = _walk_graph(author_minders, fetch, max_workers)
+    order = _topological_order(nodes, author_minders)
+
+    python = resolve_python_requirements([lib for node in order for lib in node.install_requires])
+
+    # Locked packages are always installed with --require-hashes
+    unhashed = [f"{package['name']}=={package['version']}" for package in python if not package.get("sha256")]
+    if unhashed:
+        print(Fore.RED + f"    ERROR: No sha256 hash for {', '.join(unhashed)} (not installed from an archive)" + Style.RESET_ALL)
+        raise LockfileError(f"No sha256 hash for {', '.join(unhashed)}, the lockfile cannot verify them")
+
+    if wheel_folder is not None:
+        download_python_locked(python, wheel_folder)
+    write_lockfile(lock_path, author_minders, order, python)
+
+    print(Fore.LIGHTGREEN_EX + f"Locked {len(order)} minder(s) and {len(python)} Python package(s) in {lock_path}" + Style.RESET_ALL)
+    return order
+
+def installed_commit(install_path: str, minder: str) -> str | None:
+    """
+    Returns the commit of a minder installed from a lockfile
+    """
+    try:
+        with open(os.path.join(install_path, minder, SOURCE_FILE_NAME), "r", encoding="utf-8") as f:
+            return json.load(f).get("commit")
+    except (OSError, ValueError):
+        return None
+
+@validate_arguments
+def install_locked(
+        lock_path: str = DEFAULT_LOCK_FILE,
+        minders_install_path: str | None = None,
+        author_minders: list[str] | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        offline: bool = False,
+        cache_folder: str | None = None,
+        wheel_folder: str | None = None
+    ) -> bool | None:
+    """
+    Installs the minders of a lockfile (all its roots, or `author_minders` and their dependencies)
+    at the locked commits, verifying every archive against its locked hash.
+
+    Archives already in the local archive cache (e.g. a cache folder shared by a fleet of machines)
+    are used without any network access. Minders already installed at the locked commit are skipped.
+    Offline, Python packages are installed without the package index, from `wheel_folder`
+    (filled by `lock_minders(wheel_folder=...)`) or already installed.
+    """
+
+    init() # Initialize colorama for colored terminal output
+
+    roots, nodes, python = read_lockfile(lock_path)
+    for author_minder in author_minders or []:
+        if author_minder not in nodes:
+            raise LockfileError(f"Minder {author_minder} is not in the lockfile {lock_path}")
+
+    install_path = minders_install_path or ensure_minders_folder(_default_minders_folder)
+    order = _topological_order(nodes, author_minders or roots)
+    cache = ArchiveCache(cache_folder)
+
+    def fetch(node: LockedMinder) -> str | None:
+        if installed_commit(install_path, node.minder) == node.commit:
+            print(Fore.LIGHTGREEN_EX + f"Requirement already satisfied: {node.author_minder}@{node.commit[:12]} in {install_path}" + Style.RESET_ALL)
+            return None
+
+        print(Fore.WHITE + f"Collecting {node.author_minder}@{node.commit[:12]}" + Style.RESET_ALL)
+        archive_path = cache.fetch(node.repo, node.commit, offline=offline, sha256=node.sha256)
+
+        # Never install an archive that differs from the locked one
+        digest = file_sha256(archive_path)
+        if digest != node.sha256:
+            print(Fore.RED + f"    ERROR: Hash mismatch for {node.author_minder}: expected {node.sha256}, got {digest}" + Style.RESET_ALL)
+            raise LockfileError(f"Hash mismatch for {node.author_minder}: expected {node.sha256}, got {digest}")
+        return archive_path
+
+    # Fetch and verify every archive before anything is installed
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        archives = list(pool.map(fetch, order))
+
+    new_minders = [(node, archive_path) for node, archive_path in zip(order, archives) if archive_path is not None]
+    for node, archive_path in new_minders:
+        check_minder_versions(node.author_minder, read_archive_config(archive_path))
+
+    install_python_locked(python, offline, wheel_folder)
+
+    for node, archive_path in new_minders:
+        with minder_lock(install_path, node.minder):
+            # A concurrent install may have installed the locked commit in the meantime
+            if installed_commit(install_path, node.minder) != node.commit:
+                source = json.dumps({"repo": node.repo, "commit": node.commit, "sha256": node.sha256})
+                if not extract_repo_zip(archive_path, node.minder, install_path, {SOURCE_FILE_NAME: source}):
+                    raise LockfileError(f"Cannot extract the archive of {node.author_minder}")
+
+        MinderIndex.for_folder(install_path).update(node.minder) # Register the minder in the minders index
+        print(Fore.LIGHTGREEN_EX + f"Successfully installed {node.author_minder}@{node.commit[:12]}" + Style.RESET_ALL)
+
+    return True
@@ -1,20 +1,22 @@
 from colorama import Fore, Style, init
-import io
-import requests
 import zipfile
-import platform
 import re
 import sys
 import importlib.util
-from guardin_mind import PythonVersionError, MindVersionError
-from guardin_mind.configs import _default_minders_folder
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from guardin_mind import PythonVersionError, MindVersionError, MinderDependencyError, ArchiveDownloadError
+from guardin_mind.configs import _default_minders_folder, ensure_minders_folder
+from guardin_mind.mind_utils.minder_index import MinderIndex
+from guardin_mind.package_manager.archive_cache import ArchiveCache
+from guardin_mind.package_manager.atomic_fs import minder_lock, staging_folder, make_staging_folder, publish_folder, remove_folder, discard_folder
 import os
 from pathlib import Path
 import subprocess
-import shutil
 import tomllib
 from pydantic import validate_arguments
 from packaging.specifiers import SpecifierSet
+from packaging.requirements import Requirement, InvalidRequirement
 
 def init_install_uninstall(author_minder: str, default_install_path: str | None) -> tuple[str, str, str]:
     """
@@ -38,7 +40,7 @@ def init_install_uninstall(author_minder: str, default_install_path: str | None)
     if default_install_path:
         install_path = default_install_path
     else:
-        install_path = _default_minders_folder
+        install_path = ensure_minders_folder(_default_minders_folder)
 
     return author, minder, install_path
 
@@ -49,63 +51,68 @@ def check_minder_installed(install_path: str, minder_name: str) -> bool:
     path = Path(install_path) / minder_name
     return path.is_dir()
 
-@validate_arguments
-def install_minder(author_minder: str, minders_install_path: str | None) -> bool | None:
+DEFAULT_MAX_WORKERS = 8 # Maximum number of minders downloaded concurrently
+
+@dataclass
+class ResolvedMinder:
     """
-    Accepts arguments for installing the minder, and installs it
+    A node of the minder dependency graph
     """
-        
-    # Init
-    author, minder, install_path = init_install_uninstall(author_minder, minders_install_path)
-    
-    # Check if the minder is already installed
-    if check_minder_installed(install_path, minder):
-        print(Fore.LIGHTGREEN_EX + f"Requirement already satisfied: {author_minder} in {install_path}" + Style.RESET_ALL)
-        return True
-
-    def download_repo_zip(user_repo, destination_folder):
-        """
-        Downloads the GitHub repository as a zip and extracts it into the destination folder
-        """
-        zip_url = f"https://github.com/{user_repo}/archive/refs/heads/main.zip"
-
-        print(Fore.WHITE + f"    Downloading {author_minder}" + Style.RESET_ALL)
-        response = requests.get(zip_url)
+    author_minder: str
+    minder: str
+    path: str
+    config: dict
+    requires: list[str] = field(default_factory=list) # Names of the required minders
+    downloaded: bool = False # False if the minder was already installed
+    staged: str | None = None # Extracted minder folder waiting to be published to `path`
+
+def download_repo_zip(user_repo: str, minder: str, destination_folder: str, cache: ArchiveCache | None = None) -> bool:
+    """
+    Downloads the GitHub repository as a zip (through the local archive cache) and extracts it into the destination folder
+    """
+    cache = cache or ArchiveCache()
 
-        if response.status_code == 200:
-            with zipfile.ZipFile(io.BytesIO(response.content)) as z:
-                # Temporary folder for extraction
-                temp_extract_path = Path(destination_folder) / "__temp_extract"
-                temp_extract_path.mkdir(parents=True, exist_ok=True)
+    print(Fore.WHITE + f"    Downloading {user_repo.replace('/', '_')}" + Style.RESET_ALL)
+    try:
+        archive_path = cache.fetch(user_repo)
+    except ArchiveDownloadError as e:
+        print(Fore.RED + f"    ERROR: Error when downloading the minder from GitHub. {e}" + Style.RESET_ALL)
+        return False
 
-                z.extractall(temp_extract_path)
+    return extract_repo_zip(archive_path, minder, destination_folder)
 
-                # Expecting a single top-level folder inside the archive (e.g., HelloWorld-main)
-                extracted_dirs = [d for d in temp_extract_path.iterdir() if d.is_dir()]
-                if len(extracted_dirs) != 1:
-                    print(Fore.RED + "    ERROR: Unexpected archive structure" + Style.RESET_ALL)
-                    return
+def extract_repo_zip(archive_path: str, minder: str, destination_folder: str, extra_files: dict[str, str] | None = None) -> bool:
+    """
+    Extracts a cached repository archive into the destination folder.
 
-                extracted_dir = extracted_dirs[0]
-                final_path = Path(destination_folder) / minder
+    The archive is extracted into a unique staging folder and published with an atomic rename,
+    so readers never see a partially extracted minder. `extra_files` (name -> text) are written
+    into the minder folder before it is published. The caller holds the minder lock.
+    """
 
-                # If target directory already exists, delete it
-                if final_path.exists():
-                    shutil.rmtree(final_path)
+    with zipfile.ZipFile(archive_path) as z, staging_folder(destination_folder, minder) as temp_extract_path:
+        temp_extract_path = Path(temp_extract_path)
+        z.extractall(temp_extract_path)
 
-                # Move extracted content to the final directory
-                extracted_dir.rename(final_path)
+        # Expecting a single top-level folder inside the archive (e.g., HelloWorld-main)
+        extracted_dirs = [d for d in temp_extract_path.iterdir() if d.is_dir()]
+        if len(extracted_dirs) != 1:
+            print(Fore.RED + "    ERROR: Unexpected archive structure" + Style.RESET_ALL)
+            return False
 
-                # Delete temporary folder
-                shutil.rmtree(temp_extract_path)
+        extracted_dir = extracted_dirs[0]
+        for name, content in (extra_files or {}).items():
+            (extracted_dir / name).write_text(content, encoding="utf-8")
 
-        else:
-            print(Fore.RED + f"    ERROR: Error when downloading the minder from GitHub. Error code: {response.status_code} for {zip_url}" + Style.RESET_ALL)
+        # Replace the installed version (if any) in one step
+        publish_folder(str(extracted_dir), str(Path(destination_folder) / minder))
 
-    print(Fore.WHITE + f"Collecting {author_minder}" + Style.RESET_ALL)
-    download_repo_zip(f"{author}/{minder}", install_path)  # Download minder from GitHub to minders folder
+    return True
 
-    minder_folder_path = f"{install_path}/{minder}"
+def read_minder_config(author_minder: str, minder_folder_path: str) -> dict:
+    """
+    Reads minder_config.toml of a minder and checks the required fields
+    """
 
     # Open and parse the TOML config file inside the minder directory
     with open(f"{minder_folder_path}/minder_config.toml", "rb") as f:
@@ -113,91 +120,262 @@ def install_minder(author_minder: str, minders_install_path: str | None) -> bool
 
     try:
         # Check for required parameters in config
-        name = config["minder"]["name"]
-        version = config["minder"]["version"]
-
-        # Clean up variables
-        del name
-        del version
+        config["minder"]["name"]
+        config["minder"]["version"]
     except KeyError as e:
         print(Fore.RED + f"    ERROR: Minder '{author_minder}' requires a {e} field in minder_config.toml")
         raise ValueError(f"ERROR: Minder '{author_minder}' requires a {e} field in minder_config.toml")
 
+    return config
+
+def check_minder_versions(author_minder: str, config: dict) -> None:
+    """
+    Checks the Python and Mind versions required by a minder
+    """
+
     # Check for required Python version
-    try:
-        condition = config["minder"]["python"]
+    condition = config["minder"].get("python")
+    if condition is not None:
         current_version = ".".join(map(str, sys.version_info[:3]))  # Get current Python version
 
-        spec = SpecifierSet(condition)
-
-        if not current_version in spec:
+        if not current_version in SpecifierSet(condition):
             print(Fore.RED + f"    ERROR: Minder '{author_minder}' requires a different Python: {current_version} not in '{condition}'" + Style.RESET_ALL)
             raise PythonVersionError(f"ERROR: Minder '{author_minder}' requires a different Python: {current_version} not in '{condition}'")
-        
-        del condition
-        del current_version
-    except KeyError:
-        # No Python version requirement specified
-        pass
 
     # Check for required Mind version
-    try:
-        condition = config["minder"]["mind"]
+    condition = config["minder"].get("mind")
+    if condition is not None:
         from guardin_mind import __version__ as current_version  # Get installed Mind version
 
-        spec = SpecifierSet(condition)
-
-        if not current_version in spec:
+        if not current_version in SpecifierSet(condition):
             print(Fore.RED + f"    ERROR: Minder '{author_minder}' requires a different Mind: {current_version} not in '{condition}'" + Style.RESET_ALL)
             raise MindVersionError(f"ERROR: Minder '{author_minder}' requires a different Mind: {current_version} not in '{condition}'")
-        
-        del condition
-        del current_version
-    except KeyError:
-        # No Mind version requirement specified
-        pass
-
-    # Install Python package dependencies listed in the config
-    try:
-        dependencies = config["minder"]["install-requires"]
-
-        for lib in dependencies:
-            spec = importlib.util.find_spec(lib)
-            if spec is None:
-                subprocess.check_call([sys.executable, "-m", "pip", "install", lib])
-                spec = importlib.util.find_spec(lib)  # Update spec after installation
-                continue
-
-            # Show where the package is already installed
-            if spec is not None and spec.origin is not None:
-                if spec.origin.endswith('__init__.py'):
-                    lib_path = os.path.abspath(os.path.dirname(spec.origin))
-                else:
-                    lib_path = os.path.abspath(spec.origin)
-                print(Fore.LIGHTGREEN_EX + f"Requirement already satisfied: {lib} in {lib_path}" + Style.RESET_ALL)
+
+def install_python_requirements(requirements: list[str]) -> list[str]:
+    """
+    Installs all missing Python libraries in a single batched pip invocation.
+    Returns the list of requirements passed to pip.
+    """
+    missing = []
+
+    for lib in dict.fromkeys(requirements): # Deduplicate, keeping the order
+        try:
+            module_name = Requirement(lib).name
+        except InvalidRequirement:
+            module_name = lib
+
+        spec = importlib.util.find_spec(module_name)
+        if spec is None:
+            missing.append(lib)
+            continue
+
+        # Show where the package is already installed
+        if spec.origin is not None:
+            if spec.origin.endswith('__init__.py'):
+                lib_path = os.path.abspath(os.path.dirname(spec.origin))
             else:
-                print(Fore.YELLOW + f"Requirement already satisfied: {lib}" + Style.RESET_ALL)
-    except KeyError:
-        # No Python dependencies specified
-        pass
+                lib_path = os.path.abspath(spec.origin)
+            print(Fore.LIGHTGREEN_EX + f"Requirement already satisfied: {lib} in {lib_path}" + Style.RESET_ALL)
+        else:
+            print(Fore.YELLOW + f"Requirement already satisfied: {lib}" + Style.RESET_ALL)
 
-    # Install required minders listed in the config
-    try:
-        dependencies = config["minder"]["requires-minders"]  # Read required minders
+    if missing:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
 
-        for lib in dependencies:
-            if not check_minder_installed(install_path, lib):  # Check if the minder is already installed
-                install_minder(lib, install_path)  # Recursively install the required minder
+    return missing
+
+def resolve_minders(author_minders: list[str], install_path: str, max_workers: int = DEFAULT_MAX_WORKERS) -> list[ResolvedMinder]:
+    """
+    Builds the full minder dependency graph from the minder_config.toml files.
+
+    Missing minders are downloaded concurrently with a bounded worker pool as soon as
+    the minder requiring them is resolved, every minder is fetched only once, and
+    dependency cycles are reported. Returns the minders in install order (dependencies first).
+
+    Downloaded minders are only extracted into staging folders (`ResolvedMinder.staged`):
+    `publish_minders()` makes them visible, `discard_staged()` deletes what was not published.
+    """
+    staging_folders = []
+
+    def fetch(author_minder: str) -> ResolvedMinder:
+        author, minder, _ = init_install_uninstall(author_minder, install_path)
+        minder_folder_path = f"{install_path}/{minder}"
+        staged = None
+
+        # Another process installing the same minder finishes first, then it is already installed
+        with minder_lock(install_path, minder):
+            if check_minder_installed(install_path, minder):
+                print(Fore.LIGHTGREEN_EX + f"Requirement already satisfied: {author_minder} in {install_path}" + Style.RESET_ALL)
+                downloaded = False
+
+                # Installed minders only contribute their dependencies, a broken config is not fatal here
+                try:
+                    with open(f"{minder_folder_path}/minder_config.toml", "rb") as f:
+                        config = tomllib.load(f)
+                except (OSError, tomllib.TOMLDecodeError):
+                    config = {}
+                config.setdefault("minder", {})
             else:
-                print(Fore.LIGHTGREEN_EX + f"Requirement already satisfied: {lib} in {install_path}" + Style.RESET_ALL)
-    except KeyError:
-        # No dependent minders specified
-        pass
+                print(Fore.WHITE + f"Collecting {author_minder}" + Style.RESET_ALL)
+                staging = make_staging_folder(install_path, minder)
+                staging_folders.append(staging)
+                if not download_repo_zip(f"{author}/{minder}", minder, staging):  # Download minder from GitHub to its staging folder
+                    raise FileNotFoundError(f"ERROR: Minder {author_minder} could not be downloaded")
+                downloaded = True
+                staged = f"{staging}/{minder}"
+
+                config = read_minder_config(author_minder, staged)
+
+        return ResolvedMinder(
+            author_minder=author_minder,
+            minder=minder,
+            path=minder_folder_path,
+            config=config,
+            requires=list(config["minder"].get("requires-minders", [])),
+            downloaded=downloaded,
+            staged=staged,
+        )
+
+    try:
+        nodes = _walk_graph(author_minders, fetch, max_workers)
+        return _topological_order(nodes, author_minders)
+    except BaseException:
+        for staging in staging_folders:
+            discard_folder(staging)
+        raise
+
+def publish_minders(resolved: list[ResolvedMinder], install_path: str) -> None:
+    """
+    Moves the staged minders to the minders folder, dependencies first
+    """
+    for node in resolved:
+        if node.staged is None:
+            continue
+        with minder_lock(install_path, node.minder):
+            publish_folder(node.staged, node.path) # Replaces a copy installed concurrently in one step
+        MinderIndex.for_folder(install_path).update(node.minder) # Register the minder in the minders index
+
+def discard_staged(resolved: list[ResolvedMinder]) -> None:
+    """
+    Deletes the staging folders of resolved minders (empty once published)
+    """
+    for node in resolved:
+        if node.staged is not None:
+            discard_folder(os.path.dirname(node.staged))
 
-    print(Fore.LIGHTGREEN_EX + f"Successfully installed {author_minder}" + Style.RESET_ALL)
+def _walk_graph(roots: list[str], fetch, max_workers: int) -> dict:
+    """
+    Fetches the nodes of a minder dependency graph with a bounded worker pool.
+
+    `fetch(author_minder)` returns a node with `author_minder` and `requires` attributes. The required
+    minders are fetched as soon as the minder requiring them is, every minder only once.
+    Returns the nodes keyed by `author_minder`.
+    """
+    nodes = {}
+    scheduled: set[str] = set()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        pending = set()
+
+        def schedule(author_minder: str) -> None:
+            if author_minder not in scheduled:
+                scheduled.add(author_minder)
+                pending.add(pool.submit(fetch, author_minder))
+
+        for author_minder in roots:
+            schedule(author_minder)
+
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    node = future.result()
+                    nodes[node.author_minder] = node
+
+                    # Fetch the required minders in parallel with the rest of the graph
+                    for dependency in node.requires:
+                        schedule(dependency)
+        finally:
+            # Do not start new downloads after a failure
+            for future in pending:
+                future.cancel()
+
+    return nodes
+
+def _topological_order(nodes: dict, roots: list[str]) -> list:
+    """
+    Orders the dependency graph (dependencies first) and detects cycles
+    """
+    order: list[ResolvedMinder] = []
+    state: dict[str, int] = {} # 1 - in progress, 2 - done
+    stack: list[str] = []
+
+    def visit(author_minder: str) -> None:
+        if state.get(author_minder) == 2:
+            return
+        if state.get(author_minder) == 1:
+            cycle = stack[stack.index(author_minder):] + [author_minder]
+            print(Fore.RED + f"    ERROR: Dependency cycle detected: {' -> '.join(cycle)}" + Style.RESET_ALL)
+            raise MinderDependencyError(f"ERROR: Dependency cycle detected: {' -> '.join(cycle)}")
+
+        state[author_minder] = 1
+        stack.append(author_minder)
+        for dependency in nodes[author_minder].requires:
+            visit(dependency)
+        stack.pop()
+        state[author_minder] = 2
+        order.append(nodes[author_minder])
+
+    for author_minder in roots:
+        visit(author_minder)
+
+    return order
+
+@validate_arguments
+def install_minders(author_minders: list[str], minders_install_path: str | None, max_workers: int = DEFAULT_MAX_WORKERS) -> bool | None:
+    """
+    Installs several minders with one shared dependency resolution pass
+    """
+
+    init() # Initialize colorama for colored terminal output
+
+    # Validate the names and determine the install path
+    install_path = None
+    for author_minder in author_minders:
+        _, _, install_path = init_install_uninstall(author_minder, minders_install_path)
+    if install_path is None:
+        return True
+
+    # Resolve and fetch the whole dependency graph into staging folders
+    resolved = resolve_minders(author_minders, install_path, max_workers)
+    try:
+        # Check the required Python and Mind versions of the whole graph, installed minders included
+        for node in resolved:
+            check_minder_versions(node.author_minder, node.config)
+
+        # Install Python package dependencies of the whole graph at once
+        requirements = [lib for node in resolved for lib in node.config["minder"].get("install-requires", [])]
+        install_python_requirements(requirements)
+
+        # Nothing is visible in the minders folder before every check passed
+        publish_minders(resolved, install_path)
+    finally:
+        discard_staged(resolved)
+
+    for node in resolved:
+        if node.downloaded:
+            print(Fore.LIGHTGREEN_EX + f"Successfully installed {node.author_minder}" + Style.RESET_ALL)
 
     return True
 
+@validate_arguments
+def install_minder(author_minder: str, minders_install_path: str | None) -> bool | None:
+    """
+    Accepts arguments for installing the minder, and installs it
+    """
+    return install_minders([author_minder], minders_install_path)
+
 @validate_arguments
 def uninstall_minder(author_minder: str, minders_install_path: str | None, confirm: bool = False) -> bool | None:
     """
@@ -221,10 +399,12 @@ def uninstall_minder(author_minder: str, minders_install_path: str | None, confi
     
     folder_path = Path(install_path) / minder # Build minder install path
 
-    # # Check if the folder exists and is indeed a directory
-    if folder_path.exists() and folder_path.is_dir():
-        shutil.rmtree(folder_path)
-        print(Fore.LIGHTGREEN_EX + f"    Successfully uninstalled {author_minder}" + Style.RESET_ALL)
-    else:
-        print(Fore.RED + f"    ERROR: Minder {author_minder} not found in {install_path}." + Style.RESET_ALL)
-        raise FileNotFoundError(f"ERROR: Minder {author_minder} not found in {install_path}.")
\ No newline at end of file
+    with minder_lock(install_path, minder):
+        # # Check if the folder exists and is indeed a directory
+        if folder_path.exists() and folder_path.is_dir():
+            remove_folder(str(folder_path)) # The minder disappears at once, then its files are deleted
+            MinderIndex.for_folder(install_path).remove(minder) # Drop the minder from the minders index
+            print(Fore.LIGHTGREEN_EX + f"    Successfully uninstalled {author_minder}" + Style.RESET_ALL)
+        else:
+            print(Fore.RED + f"    ERROR: Minder {author_minder} not found in {install_path}." + Style.RESET_ALL)
+            raise FileNotFoundError(f"ERROR: Minder {author_minder} not found in {install_path}.")
\ No newline at end of file
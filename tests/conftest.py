@@ -0,0 +1,71 @@
+import hashlib
+import io
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+
+def make_repo_zip(minder_name, files):
+    # Build a GitHub-like archive: a single top-level `<Minder>-main` folder
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as z:
+        for name, content in files.items():
+            z.writestr(f"{minder_name}-main/{name}", content)
+    return buffer.getvalue()
+
+class ArchiveServer:
+    '''
+    Local stand-in for GitHub archive downloads.
+    `archives` maps a URL path (e.g. `/author/Minder/archive/refs/heads/main.zip`) to the archive bytes.
+    '''
+
+    def __init__(self):
+        self.archives = {}
+        self.json = {} # URL path -> JSON body, for API stand-ins
+        self.requests = [] # (method, path, status) of every served request
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path in server.json:
+                    body = server.json[self.path].encode("utf-8")
+                    return self._reply(200, body, {"Content-Type": "application/json"})
+
+                body = server.archives.get(self.path)
+                if body is None:
+                    return self._reply(404, b"")
+
+                etag = f'"{hashlib.sha256(body).hexdigest()}"'
+                if self.headers.get("If-None-Match") == etag:
+                    return self._reply(304, b"", {"ETag": etag})
+                self._reply(200, body, {"ETag": etag, "Content-Type": "application/zip"})
+
+            def _reply(self, status, body, headers=None):
+                server.requests.append(("GET", self.path, status))
+                self.send_response(status)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.url_template = self.url + "/{repo}/archive/{ref}.zip"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def add_minder(self, repo, files, ref="refs/heads/main"):
+        body = make_repo_zip(repo.split("/")[-1], files)
+        self.archives[f"/{repo}/archive/{ref}.zip"] = body
+        return body
+
+@pytest.fixture
+def archive_server():
+    server = ArchiveServer()
+    server.thread.start()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
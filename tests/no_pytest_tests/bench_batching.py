@@ -0,0 +1,48 @@
+'''
+Throughput of a NumPy-backed minder called one item at a time, with different batch windows
+'''
+from guardin_mind.manager import batch
+import asyncio
+import time
+import numpy as np
+
+DIM = 1024
+CALLS = 5_000
+CONCURRENCY = 512
+
+class VectorMinder:
+    def __init__(self):
+        self.weights = np.random.default_rng(0).standard_normal((DIM, DIM)).astype(np.float32)
+
+    async def project_one(self, vector):
+        # Unbatched: one matrix-vector product per call
+        return vector @ self.weights
+
+    async def project_batch(self, vectors):
+        # Batched: one matrix-matrix product per batch
+        return list(np.stack(vectors) @ self.weights)
+
+async def run(call):
+    vector = np.ones(DIM, dtype=np.float32)
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one():
+        async with semaphore:
+            return await call(vector)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(CALLS)))
+    return CALLS / (time.perf_counter() - start)
+
+def main():
+    minder = VectorMinder()
+    print(f"no batching            : {asyncio.run(run(minder.project_one)):10.0f} calls/s")
+
+    for max_wait in (0.0, 0.0005, 0.001, 0.005, 0.02):
+        batched = batch(max_size=256, max_wait=max_wait)(VectorMinder.project_batch)
+        calls_per_second = asyncio.run(run(lambda v: batched(minder, v)))
+        print(f"batch window {max_wait * 1000:5.1f} ms: {calls_per_second:10.0f} calls/s "
+              f"(avg batch {batched.batcher.stats()['avg_batch_size']:.1f})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+'''
+Minder instantiation cost: ConfigRead before (inspect.stack + parse on every instance) and after (frame lookup + cached config)
+'''
+from guardin_mind.manager import ConfigRead
+import inspect
+import os
+import tempfile
+import timeit
+import tomllib
+
+class LegacyConfigRead:
+    # The previous implementation, kept here for comparison
+    def __init__(self, target):
+        import_dir = os.path.dirname(inspect.stack()[1].filename).replace("\\", "/")
+        with open(f'{import_dir}/minder_config.toml', 'rb') as f:
+            config = tomllib.load(f)
+        for field in ConfigRead.required_fields + ConfigRead.optional_fields:
+            if field in config['minder']:
+                setattr(target, field.replace('-', '_'), config['minder'][field])
+
+MINDER_CODE = '''
+from guardin_mind.manager import ConfigRead
+from bench_config_read import LegacyConfigRead
+
+class LegacyMinder:
+    def __init__(self):
+        LegacyConfigRead(self)
+
+class CachedMinder:
+    def __init__(self):
+        ConfigRead(self)
+'''
+
+CONFIG = '''[minder]
+name = "BenchMinder"
+version = "0.1.0"
+description = "Benchmark minder"
+authors = [{ name = "First Author", email = "email@example.org" }]
+install-requires = ["requests"]
+'''
+
+def main(number=2000):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with open(os.path.join(tmpdir, "minder_config.toml"), "w", encoding="utf-8") as f:
+            f.write(CONFIG)
+        with open(os.path.join(tmpdir, "minder.py"), "w", encoding="utf-8") as f:
+            f.write(MINDER_CODE)
+
+        namespace = {}
+        exec(compile(MINDER_CODE, os.path.join(tmpdir, "minder.py"), "exec"), namespace)
+
+        for name in ("LegacyMinder", "CachedMinder"):
+            cls = namespace[name]
+            seconds = timeit.timeit(cls, number=number)
+            print(f"{name:13s}: {seconds / number * 1e6:8.1f} us per instance")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+'''
+Throughput of a CPU-bound minder: "instance" mode with threads vs "process" mode with 1..N workers
+'''
+from guardin_mind import Mind
+from concurrent.futures import ThreadPoolExecutor
+import os
+import tempfile
+import time
+
+MINDER_CODE = '''
+class CpuMinder:
+    def work(self, n):
+        # Pure Python CPU-bound loop, holds the GIL
+        total = 0
+        for i in range(n):
+            total += i * i % 7
+        return total
+'''
+
+CALLS = 64
+N = 300_000
+
+def run(call, concurrency):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(lambda _: call(N), range(CALLS)))
+    return CALLS / (time.perf_counter() - start)
+
+def main():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        minder_dir = os.path.join(tmpdir, "minders", "CpuMinder")
+        os.makedirs(minder_dir)
+        with open(os.path.join(minder_dir, "minder.py"), "w", encoding="utf-8") as f:
+            f.write(MINDER_CODE)
+
+        mind = Mind(path=tmpdir)
+        cpus = os.cpu_count() or 1
+
+        minder = mind.load(mind.CpuMinder)
+        print(f"instance mode, {cpus} threads: {run(minder.work, cpus):8.1f} calls/s")
+
+        workers = 1
+        while workers <= cpus:
+            with mind.load(mind.CpuMinder, mode="process", workers=workers) as minder:
+                print(f"process mode, {workers:2d} workers: {run(minder.work, workers * 2):8.1f} calls/s")
+            workers *= 2
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+'''
+Round-trip latency of large payloads: pickled through the pipe/socket vs passed through shared memory.
+
+Usage: python bench_shared_memory.py [max size in MiB, 256 by default, 1024 for the full 1 KB - 1 GB range]
+'''
+from guardin_mind import Mind
+from guardin_mind.mind_utils.ipc import MindServer
+import numpy as np
+import os
+import sys
+import tempfile
+import time
+
+MINDER_CODE = '''
+class EchoMinder:
+    def echo(self, data):
+        # Touch the payload so it is really transferred, return it unchanged
+        data[0]
+        return data
+'''
+
+THRESHOLD = 64 * 1024
+
+def sizes(max_size: int) -> list[int]:
+    size = 1024
+    result = []
+    while size <= max_size:
+        result.append(size)
+        size *= 16 if size < 1024 * 1024 else 4
+    return result
+
+def measure(call, payload) -> float:
+    # Best of a few repetitions, fewer for huge payloads
+    repeats = max(2, min(50, (64 * 1024 * 1024) // payload.nbytes))
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        call(payload)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    max_size = int(sys.argv[1]) * 1024 * 1024 if len(sys.argv) > 1 else 256 * 1024 * 1024
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        minder_dir = os.path.join(tmpdir, "minders", "EchoMinder")
+        os.makedirs(minder_dir)
+        with open(os.path.join(minder_dir, "minder.py"), "w", encoding="utf-8") as f:
+            f.write(MINDER_CODE)
+
+        mind = Mind(path=tmpdir)
+        server = MindServer(os.path.join(tmpdir, "m.sock"), path=tmpdir).start()
+
+        pipe = mind.load(mind.EchoMinder, mode="process", workers=1)
+        shared = mind.load(mind.EchoMinder, mode="process", workers=1, shared_memory_threshold=THRESHOLD)
+        socket_minder = Mind(server=server.socket_path).EchoMinder()
+        shared_socket_minder = Mind(server=server.socket_path, shared_memory_threshold=THRESHOLD).EchoMinder()
+
+        print(f"{'size':>10} | {'process pipe':>13} {'process shm':>12} | {'serve socket':>13} {'serve shm':>10}")
+        for size in sizes(max_size):
+            payload = np.ones(size, dtype=np.uint8)
+            timings = [
+                measure(pipe.echo, payload),
+                measure(shared.echo, payload),
+                measure(socket_minder.echo, payload),
+                measure(shared_socket_minder.echo, payload),
+            ]
+            label = f"{size // 1024} KiB" if size < 1024 * 1024 else f"{size // (1024 * 1024)} MiB"
+            print(f"{label:>10} | {timings[0] * 1000:10.2f} ms {timings[1] * 1000:9.2f} ms | {timings[2] * 1000:10.2f} ms {timings[3] * 1000:7.2f} ms")
+
+        pipe.shutdown()
+        shared.shutdown()
+        server.stop()
+
+if __name__ == "__main__":
+    main()
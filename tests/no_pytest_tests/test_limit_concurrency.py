@@ -1,7 +1,9 @@
 from guardin_mind import Mind
 from guardin_mind.minders.HelloWorld.minder import HelloWorld
+from guardin_mind.manager import limit_concurrency
 import asyncio
 import threading
+import time
 
 mind = Mind(debug=True)
 io = mind.load(HelloWorld)
@@ -30,6 +32,61 @@ def thread_test():
         t.join()
     print("Threading All done")
 
+def stress_test(max_concurrent=8, threads_count=16, loops_count=4, calls=200, work=0.001):
+    # Threads and several event loops share one concurrency budget
+    lock = threading.Lock()
+    active = {"now": 0, "max": 0}
+
+    def enter():
+        with lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+
+    def leave():
+        with lock:
+            active["now"] -= 1
+
+    limit = limit_concurrency(max_concurrent)
+
+    @limit
+    def sync_call():
+        enter()
+        time.sleep(work)
+        leave()
+
+    @limit
+    async def async_call():
+        enter()
+        await asyncio.sleep(work)
+        leave()
+
+    def thread_worker():
+        for _ in range(calls):
+            sync_call()
+
+    def loop_worker():
+        async def run():
+            await asyncio.gather(*(async_call() for _ in range(calls)))
+        asyncio.run(run())
+
+    workers = [threading.Thread(target=thread_worker) for _ in range(threads_count)]
+    workers += [threading.Thread(target=loop_worker) for _ in range(loops_count)]
+
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    total = (threads_count + loops_count) * calls
+    stats = sync_call.limiter.stats()
+    print(f"Stress: {total} calls in {elapsed:.2f}s ({total / elapsed:.0f} calls/s)")
+    print(f"    max observed concurrency: {active['max']} (limit {max_concurrent})")
+    print(f"    waited: {stats['waited']}, avg wait: {stats['wait_time_avg'] * 1000:.2f} ms, max wait: {stats['wait_time_max'] * 1000:.2f} ms")
+    assert active["max"] <= max_concurrent
+
 if __name__ == "__main__":
     asyncio.run(main())
-    thread_test()
\ No newline at end of file
+    thread_test()
+    stress_test()
\ No newline at end of file
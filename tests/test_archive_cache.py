@@ -0,0 +1,51 @@
+import hashlib
+import pytest
+from guardin_mind import ArchiveDownloadError
+from guardin_mind.package_manager.archive_cache import ArchiveCache
+from guardin_mind.package_manager import package_manager as pm
+
+MINDER_FILES = {
+    "minder.py": "class Cached:\n    pass\n",
+    "minder_config.toml": '[minder]\nname = "Cached"\nversion = "0.1.0"\n',
+}
+
+def test_fetch_is_content_addressed_and_revalidated(tmp_path, archive_server):
+    body = archive_server.add_minder("test/Cached", MINDER_FILES)
+    cache = ArchiveCache(cache_folder=str(tmp_path / "cache"), url_template=archive_server.url_template)
+
+    path = cache.fetch("test/Cached")
+    assert path == cache.blob_path(hashlib.sha256(body).hexdigest())
+    with open(path, "rb") as f:
+        assert f.read() == body
+
+    # A repeated fetch is one conditional request answered with 304
+    assert cache.fetch("test/Cached") == path
+    assert [status for _, _, status in archive_server.requests] == [200, 304]
+
+def test_fetch_falls_back_to_cache_when_offline(tmp_path, archive_server):
+    archive_server.add_minder("test/Cached", MINDER_FILES)
+    cache = ArchiveCache(cache_folder=str(tmp_path / "cache"), url_template=archive_server.url_template)
+    path = cache.fetch("test/Cached")
+
+    # Explicit offline mode does not access the network at all
+    assert cache.fetch("test/Cached", offline=True) == path
+    assert len(archive_server.requests) == 1
+
+    # Unreachable server: the cached archive is used
+    offline_cache = ArchiveCache(cache_folder=str(tmp_path / "cache"), url_template="http://127.0.0.1:9/{repo}/{ref}.zip")
+    assert offline_cache.fetch("test/Cached") == path
+
+    with pytest.raises(ArchiveDownloadError):
+        offline_cache.fetch("test/Unknown")
+
+def test_download_repo_zip_extracts_from_cache(tmp_path, archive_server):
+    archive_server.add_minder("test/Cached", MINDER_FILES)
+    cache = ArchiveCache(cache_folder=str(tmp_path / "cache"), url_template=archive_server.url_template)
+    install_path = tmp_path / "minders"
+
+    assert pm.download_repo_zip("test/Cached", "Cached", str(install_path), cache=cache)
+    assert (install_path / "Cached" / "minder.py").read_text() == MINDER_FILES["minder.py"]
+    assert [p.name for p in install_path.iterdir()] == ["Cached"]
+
+    # Missing repository
+    assert not pm.download_repo_zip("test/Missing", "Missing", str(install_path), cache=cache)
@@ -0,0 +1,85 @@
+import asyncio
+import gc
+import threading
+import pytest
+from guardin_mind.manager import batch
+
+class BatchMinder:
+    def __init__(self):
+        self.batches = []
+
+    @batch(max_size=4, max_wait=0.02)
+    async def double(self, items):
+        self.batches.append(list(items))
+        return [item * 2 for item in items]
+
+    @batch(max_size=100, max_wait=0.02)
+    def triple(self, items):
+        self.batches.append(list(items))
+        return [item * 3 for item in items]
+
+    @batch(max_size=10, max_wait=0.01)
+    async def broken(self, items):
+        return items[:-1] # Wrong number of results
+
+def test_async_batching_by_size_and_window():
+    minder = BatchMinder()
+
+    async def main():
+        return await asyncio.gather(*(minder.double(i) for i in range(6)))
+
+    assert asyncio.run(main()) == [0, 2, 4, 6, 8, 10]
+    # One full batch of 4 items, then the rest after the time window
+    assert minder.batches == [[0, 1, 2, 3], [4, 5]]
+    assert BatchMinder.double.batcher.stats()["avg_batch_size"] == 3
+
+def test_running_batches_are_referenced():
+    running = []
+
+    @batch(max_size=2, max_wait=0.01)
+    async def slow(items):
+        running.append(len(slow.batcher._tasks))
+        gc.collect() # The flush task must survive a collection while it runs
+        await asyncio.sleep(0.01)
+        return items
+
+    async def main():
+        return await asyncio.gather(*(slow(i) for i in range(3)))
+
+    assert asyncio.run(main()) == [0, 1, 2]
+    assert len(running) == 2 and all(running)
+    assert not slow.batcher._tasks
+
+def test_batches_are_not_mixed_between_instances():
+    first, second = BatchMinder(), BatchMinder()
+
+    async def main():
+        return await asyncio.gather(first.double(1), second.double(2))
+
+    assert asyncio.run(main()) == [2, 4]
+    assert first.batches == [[1]] and second.batches == [[2]]
+
+def test_sync_batching_from_threads():
+    minder = BatchMinder()
+    results = {}
+
+    def worker(i):
+        results[i] = minder.triple(i)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == {i: i * 3 for i in range(8)}
+    assert sum(len(b) for b in minder.batches) == 8
+    assert len(minder.batches) < 8
+
+def test_batch_errors_reach_every_caller():
+    minder = BatchMinder()
+
+    async def main():
+        return await asyncio.gather(minder.broken(1), minder.broken(2), return_exceptions=True)
+
+    assert all(isinstance(r, ValueError) for r in asyncio.run(main()))
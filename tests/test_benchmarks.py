@@ -0,0 +1,19 @@
+from benchmarks import harness, suite
+
+def test_suite_runs():
+    # One quick sample per benchmark keeps the suite from rotting
+    results = harness.run(repeat=1, min_time=0)
+    assert set(results) == {bench.name for bench in harness.REGISTRY}
+    assert all(result["min"] > 0 for result in results.values())
+
+def test_compare_flags_regressions(tmp_path):
+    path = tmp_path / "baseline.json"
+    harness.save({"fast": {"min": 1.0, "median": 1.0}, "slow": {"min": 1.0, "median": 1.0}}, path)
+    baseline = harness.load(path)["results"]
+
+    rows = harness.compare({"fast": {"min": 0.5}, "slow": {"min": 1.3}, "added": {"min": 1.0}}, baseline, threshold=0.25)
+    assert {row["name"]: row["status"] for row in rows} == {"fast": "improved", "slow": "regression", "added": "new"}
+
+    # On a machine twice as slow (calibration scale 2), only slowdowns beyond that are regressions
+    rows = harness.compare({"fast": {"min": 1.0}, "slow": {"min": 2.6}}, baseline, threshold=0.25, scale=2.0)
+    assert {row["name"]: row["status"] for row in rows} == {"fast": "improved", "slow": "regression"}
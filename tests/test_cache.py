@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+from guardin_mind.manager import memoize
+
+def test_memoize_sync_lru_and_ttl():
+    calls = []
+
+    @memoize(maxsize=2, ttl=0.05)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert [square(2), square(2), square(3)] == [4, 4, 9]
+    assert calls == [2, 3]
+
+    square(4) # Evicts 2, the least recently used
+    square(2)
+    assert calls == [2, 3, 4, 2]
+
+    time.sleep(0.06) # Expired
+    square(2)
+    assert calls == [2, 3, 4, 2, 2]
+
+    stats = square.cache.stats()
+    assert stats["hits"] == 1 and stats["evictions"] >= 1 and stats["expirations"] == 1
+
+def test_memoize_deduplicates_concurrent_calls():
+    calls = []
+
+    @memoize()
+    def slow_sync(x):
+        calls.append(x)
+        time.sleep(0.05)
+        return x
+
+    @memoize(key=lambda self, x: x)
+    async def slow_async(self, x):
+        calls.append(x)
+        await asyncio.sleep(0.05)
+        return x
+
+    threads = [threading.Thread(target=slow_sync, args=(1,)) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    async def main():
+        return await asyncio.gather(*(slow_async(object(), 2) for _ in range(5)))
+
+    assert asyncio.run(main()) == [2] * 5
+    assert calls == [1, 2]
+    assert slow_sync.cache.stats()["shared"] == 4
+    assert slow_async.cache.stats()["shared"] == 4
+
+def test_memoize_disk_tier_survives_restart(tmp_path):
+    calls = []
+
+    def make():
+        class Minder:
+            @memoize(disk=True, disk_folder=str(tmp_path), disk_namespace="Minder.lookup")
+            def lookup(self, x):
+                calls.append(x)
+                return {"value": x}
+        return Minder
+
+    assert make()().lookup(5) == {"value": 5}
+
+    # A fresh cache (e.g. after a restart) reads the disk tier, `self` is not part of the key
+    second = make()
+    assert second().lookup(5) == {"value": 5}
+    assert calls == [5]
+    assert second.lookup.cache.stats()["disk_hits"] == 1
+
+def test_memoize_keys_keep_args_and_kwargs_apart():
+    @memoize()
+    def echo(*args, **kwargs):
+        return args, kwargs
+
+    assert echo(1, k=2) == ((1,), {"k": 2})
+    assert echo((1,), (("k", 2),)) == (((1,), (("k", 2),)), {})
+
+def test_memoize_does_not_keep_instances_alive():
+    import gc
+    import weakref
+
+    class Minder:
+        def __init__(self, value):
+            self.value = value
+
+        @memoize()
+        def get(self):
+            return self.value
+
+    first, second = Minder(1), Minder(2)
+    assert (first.get(), second.get()) == (1, 2) # Keyed by instance
+
+    ref = weakref.ref(first)
+    del first
+    gc.collect()
+    assert ref() is None
+    assert Minder.get.cache.stats()["size"] == 1
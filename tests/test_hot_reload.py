@@ -0,0 +1,108 @@
+import os
+import shutil
+import time
+import pytest
+from guardin_mind import Mind
+from guardin_mind.mind_utils.hot_reload import MinderWatcher
+
+CONFIG = '[minder]\nname = "ReloadMinder"\nversion = "{version}"\n'
+
+MINDER_CODE = '''from guardin_mind.manager import ConfigRead
+
+class ReloadMinder:
+    def __init__(self):
+        ConfigRead(self)
+
+    def ask_sync(self, text):
+        return "{answer}: " + text
+'''
+
+def write_minder(folder, answer="v1", version="0.1.0"):
+    folder.mkdir(parents=True, exist_ok=True)
+    (folder / "minder.py").write_text(MINDER_CODE.format(answer=answer))
+    (folder / "minder_config.toml").write_text(CONFIG.format(version=version))
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+@pytest.fixture
+def minder_folder(tmp_path):
+    folder = tmp_path / "minders" / "ReloadMinder"
+    write_minder(folder)
+    return folder
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_changed_minder_is_swapped(tmp_path, minder_folder, use_inotify):
+    mind = Mind(path=tmp_path)
+    old = mind.ReloadMinder()
+    watcher = mind.enable_hot_reload(interval=0.05, settle=0.02, use_inotify=use_inotify)
+    try:
+        write_minder(minder_folder, answer="v2")
+        assert wait_for(lambda: watcher.reloads.get("ReloadMinder") == 1)
+
+        assert mind.ReloadMinder().ask_sync("hi") == "v2: hi"
+        assert mind.lazy("ReloadMinder")().ask_sync("hi") == "v2: hi"
+        assert old.ask_sync("hi") == "v1: hi" # Existing instances keep the old version
+    finally:
+        watcher.stop()
+
+def test_config_change_and_reinstall(tmp_path, minder_folder):
+    mind = Mind(path=tmp_path)
+    assert mind.ReloadMinder().version == "0.1.0"
+    watcher = MinderWatcher(mind, settle=0) # Not started, checked explicitly
+    try:
+        (minder_folder / "minder_config.toml").write_text(CONFIG.format(version="0.2.0"))
+        assert watcher.check() == ["ReloadMinder"]
+        assert mind.ReloadMinder().version == "0.2.0"
+
+        # Reinstall: the folder is removed, then replaced
+        shutil.rmtree(minder_folder)
+        assert watcher.check() == []
+        write_minder(minder_folder, answer="v3", version="0.3.0")
+        assert watcher.check() == ["ReloadMinder"]
+        assert mind.ReloadMinder().ask_sync("hi") == "v3: hi"
+        assert watcher.check() == [] # Nothing changed since
+    finally:
+        watcher.stop()
+
+def test_broken_version_keeps_old_class(tmp_path, minder_folder):
+    mind = Mind(path=tmp_path, hot_reload=True)
+    current = mind.ReloadMinder
+    mind._watcher.stop()
+    watcher = MinderWatcher(mind, settle=0)
+
+    (minder_folder / "minder.py").write_text("raise RuntimeError('broken')\n")
+    assert watcher.check() == []
+    assert mind.ReloadMinder is current
+    assert isinstance(watcher.errors["ReloadMinder"], RuntimeError)
+    assert watcher.check() == [] # Not retried until the files change again
+
+    write_minder(minder_folder, answer="fixed")
+    assert watcher.check() == ["ReloadMinder"]
+    assert mind.ReloadMinder().ask_sync("hi") == "fixed: hi"
+    assert "ReloadMinder" not in watcher.errors
+
+def test_evicted_minder_is_not_reloaded(tmp_path, minder_folder):
+    mind = Mind(path=tmp_path, hot_reload=True)
+    mind._watcher.stop()
+    watcher = mind._watcher = MinderWatcher(mind, settle=0)
+    mind.ReloadMinder
+
+    mind.evict("ReloadMinder")
+    write_minder(minder_folder, answer="v2")
+    assert watcher.check() == []
+    assert "ReloadMinder" not in mind._dynamic_classes
+
+    # Explicit reloads do not bring it back either
+    assert watcher.reload("ReloadMinder") is False
+    assert "ReloadMinder" not in mind._dynamic_classes
+
+    # Loaded again: current version, tracked again
+    assert mind.ReloadMinder().ask_sync("hi") == "v2: hi"
+    write_minder(minder_folder, answer="v3", version="0.3.0")
+    assert watcher.check() == ["ReloadMinder"]
@@ -0,0 +1,70 @@
+import asyncio
+import threading
+import time
+import pytest
+from guardin_mind import Mind
+
+MINDER_CODE = '''import itertools
+
+_ids = itertools.count()
+
+class PooledMinder:
+    constructed = 0
+
+    def __init__(self):
+        PooledMinder.constructed += 1
+        self.id = next(_ids)
+'''
+
+@pytest.fixture
+def mind(tmp_path):
+    minder_dir = tmp_path / "minders" / "PooledMinder"
+    minder_dir.mkdir(parents=True)
+    (minder_dir / "minder.py").write_text(MINDER_CODE)
+    return Mind(path=tmp_path)
+
+def test_pool_warm_up_and_reuse(mind):
+    pool = mind.pool("PooledMinder", size=2)
+    pool.warm_up()
+    assert mind.PooledMinder.constructed == 2
+
+    with pool.checkout() as first:
+        pass
+    with pool.checkout() as second:
+        assert second is first # Instances are reused
+
+    assert mind.PooledMinder.constructed == 2
+    assert mind.load(mind.PooledMinder, mode="pool") is pool
+    assert mind.pool_stats()["PooledMinder"]["checkouts"] == 2
+
+def test_pool_warm_up_at_mind_creation(mind):
+    warm_mind = Mind(path=mind.minders_dir, warm_up=["PooledMinder"], pool_size=3)
+    stats = warm_mind.pool_stats()["PooledMinder"]
+    assert stats["created"] == 3 and stats["idle"] == 3
+
+def test_fixed_pool_blocks_until_return(mind):
+    pool = mind.pool("PooledMinder", size=1)
+    instance = pool.acquire()
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.01)
+
+    threading.Timer(0.02, pool.release, args=(instance,)).start()
+    assert pool.acquire(timeout=1) is instance
+    pool.release(instance)
+
+def test_elastic_pool_async(mind):
+    pool = mind.pool("PooledMinder", size=1, max_size=3)
+
+    async def call():
+        async with pool.acheckout() as minder:
+            await asyncio.sleep(0.01)
+            return minder.id
+
+    async def main():
+        return await asyncio.gather(*(call() for _ in range(6)))
+
+    ids = asyncio.run(main())
+    stats = pool.stats()
+    assert len(set(ids)) == 3 # Grew to max_size and reused the instances
+    assert stats["created"] == 3 and stats["in_use"] == 0 and stats["checkouts"] == 6
@@ -0,0 +1,167 @@
+import asyncio
+import glob
+import os
+import threading
+import time
+import pytest
+from guardin_mind import Mind
+from guardin_mind.mind_utils.ipc import MindServer
+
+MINDER_CODE = '''import asyncio
+import os
+import threading
+
+class SharedMinder:
+    instances = 0
+
+    def __init__(self, base=0):
+        SharedMinder.instances += 1
+        self.base = base
+        self.lock = threading.Lock()
+        self.calls = 0
+
+    def add(self, value):
+        with self.lock:
+            self.calls += 1
+        return self.base + value
+
+    def pid(self):
+        return os.getpid()
+
+    def created(self):
+        return SharedMinder.instances
+
+    def fail(self):
+        raise KeyError("boom")
+
+    async def slow_echo(self, value, delay):
+        await asyncio.sleep(delay)
+        return value
+
+    async def slow_blob(self, size, delay):
+        await asyncio.sleep(delay)
+        return b"x" * size
+'''
+
+@pytest.fixture
+def server(tmp_path):
+    minder_dir = tmp_path / "minders" / "SharedMinder"
+    minder_dir.mkdir(parents=True)
+    (minder_dir / "minder.py").write_text(MINDER_CODE)
+
+    server = MindServer(tmp_path / "m.sock", path=tmp_path, preload=["SharedMinder"]).start()
+    yield server
+    server.stop()
+
+def test_client_mode_shares_instances(server):
+    mind = Mind(server=server.socket_path)
+    minder = mind.SharedMinder()
+
+    # Same API as a local minder, executed by the server
+    assert minder.add(2) == 2
+    assert minder.pid() == os.getpid() # The test server runs in this process
+    assert mind.SharedMinder().created() == 1 # Preloaded instance is shared
+
+    # Other constructor arguments create another shared instance
+    assert mind.SharedMinder(base=10).add(1) == 11
+    assert Mind(server=server.socket_path).SharedMinder(base=10).created() == 2
+
+    # Remote exceptions are raised in the client
+    with pytest.raises(KeyError):
+        minder.fail()
+    with pytest.raises(AttributeError):
+        minder.missing
+
+    # Many threads use pooled connections
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(minder.add(1))) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [1] * 16
+
+def test_async_calls_are_pipelined(server):
+    minder = Mind(server=server.socket_path).SharedMinder()
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        # Concurrent calls share one connection and are answered out of order
+        results = await asyncio.gather(*(minder.slow_echo(i, 0.2 - i * 0.02) for i in range(10)))
+        elapsed = loop.time() - start
+        assert await minder.add.acall(5) == 5
+        return results, elapsed
+
+    results, elapsed = asyncio.run(main())
+    assert results == list(range(10))
+    assert elapsed < 1.0
+
+def test_socket_is_private_and_not_stolen(server, tmp_path):
+    import socket
+    import stat
+
+    assert stat.S_IMODE(os.stat(server.socket_path).st_mode) == 0o600
+
+    # A live server keeps its socket
+    with pytest.raises(RuntimeError):
+        MindServer(server.socket_path, path=tmp_path).start()
+    assert Mind(server=server.socket_path).SharedMinder().add(1) == 1
+
+    # A stale socket (no server listening) is replaced, other files are never removed
+    stale = tmp_path / "stale.sock"
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(stale))
+    sock.close()
+    MindServer(stale, path=tmp_path).start().stop()
+
+    regular = tmp_path / "file.sock"
+    regular.write_text("data")
+    with pytest.raises(FileExistsError):
+        MindServer(regular, path=tmp_path).start()
+    assert regular.read_text() == "data"
+
+def test_dropped_results_release_shared_memory(server):
+    from guardin_mind.mind_utils import shared_buffers
+    segments = lambda: glob.glob(os.path.join(shared_buffers.SEGMENT_FOLDER, f"guardin_mind-{os.getpid()}-*"))
+    minder = Mind(server=server.socket_path, shared_memory_threshold=1024).SharedMinder()
+
+    async def cancelled_call(wait_for_response):
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(minder.slow_blob(100_000, 0.2), 0.05)
+        if wait_for_response:
+            await asyncio.sleep(0.4) # The response arrives after its caller was cancelled
+
+    asyncio.run(cancelled_call(True))
+    assert segments() == []
+
+    # The connection is closed before the server answers
+    asyncio.run(cancelled_call(False))
+    time.sleep(0.4)
+    assert segments() == []
+
+    assert asyncio.run(minder.slow_blob(100_000, 0)) == b"x" * 100_000
+    assert segments() == []
+
+def test_released_proxies_free_server_instances(server):
+    import gc
+    mind = Mind(server=server.socket_path)
+    preloaded = set(server._instances)
+
+    # A proxy released by the garbage collector frees its instance with the next request
+    assert mind.SharedMinder(base=1).add(1) == 2
+    assert len(server._instances) == len(preloaded) + 1
+    gc.collect()
+    assert mind.SharedMinder().add(1) == 1 # The preloaded instance is kept
+    assert set(server._instances) == preloaded
+
+    # A client that goes away releases everything it held
+    other = Mind(server=server.socket_path)
+    kept = [other.SharedMinder(base=value) for value in range(3)]
+    assert len(server._instances) == len(preloaded) + 3
+    other._client.close()
+    deadline = time.monotonic() + 5
+    while len(server._instances) != len(preloaded) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert set(server._instances) == preloaded
+    del kept
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+import time
+import pytest
+from guardin_mind import Mind
+
+def make_minder(base_dir, name, body="    pass\n", prelude=""):
+    minder_dir = base_dir / "minders" / name
+    minder_dir.mkdir(parents=True)
+    (minder_dir / "minder.py").write_text(f"{prelude}class {name}:\n{body}")
+
+def test_lazy_proxy_defers_import(tmp_path):
+    counter = tmp_path / "executions.txt"
+    make_minder(tmp_path, "LazyMinder", body="    kind = 'lazy'\n    def ask_sync(self, text):\n        return text\n",
+        prelude=f"with open({str(counter)!r}, 'a') as f:\n    f.write('x')\n")
+
+    mind = Mind(path=tmp_path)
+    proxy = mind.lazy("LazyMinder")
+    assert not proxy.loaded and not counter.exists()
+
+    assert proxy().ask_sync("hi") == "hi"
+    assert proxy.loaded and proxy.kind == "lazy"
+    assert proxy.resolve() is mind.LazyMinder
+    assert mind.load(proxy).__class__ is mind.LazyMinder
+    assert counter.read_text() == "x"
+
+def test_lazy_proxy_of_missing_minder_fails_on_use(tmp_path):
+    proxy = Mind(path=tmp_path).lazy("NoSuchMinder")
+    with pytest.raises(ValueError):
+        proxy()
+
+def test_aload_does_not_block_the_event_loop(tmp_path):
+    make_minder(tmp_path, "SlowMinder", prelude="import time\ntime.sleep(0.2)\n")
+    mind = Mind(path=tmp_path)
+
+    async def main():
+        ticks = 0
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        first, second = await asyncio.gather(mind.aload("SlowMinder"), mind.aload("SlowMinder"))
+        task.cancel()
+        return first, second, ticks
+
+    first, second, ticks = asyncio.run(main())
+    assert first is second is mind.SlowMinder
+    assert ticks >= 5 # The loop kept running during the import
+
+def test_preload_imports_concurrently_in_background(tmp_path):
+    for i in range(4):
+        make_minder(tmp_path, f"Preloaded{i}", prelude="import time\ntime.sleep(0.2)\n")
+    mind = Mind(path=tmp_path)
+
+    start = time.perf_counter()
+    futures = mind.preload([f"Preloaded{i}" for i in range(4)] + ["NoSuchMinder"])
+    assert time.perf_counter() - start < 0.1 # Returns at once
+
+    # Access waits for the running background load
+    assert mind.Preloaded0.__name__ == "Preloaded0"
+    classes = [futures[f"Preloaded{i}"].result() for i in range(4)]
+    assert time.perf_counter() - start < 0.6 # Not 4 x 0.2 s
+    assert classes == [getattr(mind, f"Preloaded{i}") for i in range(4)]
+    assert isinstance(futures["NoSuchMinder"].exception(), ValueError)
+    assert not mind._loading
+
+def test_preload_at_mind_creation(tmp_path):
+    make_minder(tmp_path, "StartupMinder")
+    mind = Mind(path=tmp_path, preload=["StartupMinder"])
+    assert mind.StartupMinder.__name__ == "StartupMinder"
+    assert mind.lazy("StartupMinder").loaded
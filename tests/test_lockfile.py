@@ -0,0 +1,133 @@
+import json
+import sys
+import pytest
+from guardin_mind import ArchiveDownloadError, LockfileError
+from guardin_mind.package_manager import archive_cache, lockfile
+
+COMMITS = {"Root": "a" * 40, "Shared": "b" * 40}
+
+def minder_files(name, requires=(), libs=()):
+    return {
+        "minder.py": f"class {name}:\n    pass\n",
+        "minder_config.toml": (
+            f'[minder]\nname = "{name}"\nversion = "0.1.0"\n'
+            f'requires-minders = {list(requires)!r}\ninstall-requires = {list(libs)!r}\n'
+        ).replace("'", '"'),
+    }
+
+@pytest.fixture
+def locked_repos(archive_server, monkeypatch, tmp_path):
+    # Branch heads of the stand-in GitHub API, and the archives of those commits
+    for name, requires, libs in [("Root", ["test_Shared"], ["first_lib"]), ("Shared", [], ["second_lib"])]:
+        archive_server.json[f"/repos/test/{name}/commits/main"] = json.dumps({"sha": COMMITS[name]})
+        archive_server.add_minder(f"test/{name}", minder_files(name, requires, libs), ref=COMMITS[name])
+
+    monkeypatch.setattr(lockfile, "_commit_url_template", archive_server.url + "/repos/{repo}/commits/{branch}")
+    monkeypatch.setattr(archive_cache, "_archive_url_template", archive_server.url_template)
+
+    # Stand-in pip resolution and installation
+    pip_calls = []
+    monkeypatch.setattr(lockfile, "resolve_python_requirements", lambda reqs: [
+        {"name": lib, "version": "1.0", "sha256": "c" * 64} for lib in sorted(set(reqs))
+    ])
+    monkeypatch.setattr(lockfile, "install_python_locked", lambda packages, *options: pip_calls.append(packages))
+
+    lock_path = str(tmp_path / "mind.lock")
+    lockfile.lock_minders(["test_Root"], lock_path, cache_folder=str(tmp_path / "cache"))
+    return lock_path, pip_calls
+
+def test_lock_pins_commits_and_hashes(archive_server, locked_repos):
+    lock_path, _ = locked_repos
+    roots, minders, python = lockfile.read_lockfile(lock_path)
+
+    assert roots == ["test_Root"]
+    assert {name: node.commit for name, node in minders.items()} == {"test_Root": COMMITS["Root"], "test_Shared": COMMITS["Shared"]}
+    assert minders["test_Root"].requires == ["test_Shared"]
+    assert [package["name"] for package in python] == ["first_lib", "second_lib"]
+
+    # The locked hash is the hash of the served archive
+    body = archive_server.archives[f"/test/Shared/archive/{COMMITS['Shared']}.zip"]
+    assert minders["test_Shared"].sha256 == lockfile.hashlib.sha256(body).hexdigest()
+
+def test_install_locked_offline_from_cache(archive_server, locked_repos, tmp_path):
+    lock_path, pip_calls = locked_repos
+    install_path = tmp_path / "minders"
+    install_path.mkdir()
+    archive_server.requests.clear()
+
+    assert lockfile.install_locked(lock_path, str(install_path), offline=True, cache_folder=str(tmp_path / "cache"))
+
+    assert archive_server.requests == [] # Installed from the archive cache only
+    assert (install_path / "Root" / "minder.py").is_file()
+    assert lockfile.installed_commit(str(install_path), "Shared") == COMMITS["Shared"]
+    assert len(pip_calls) == 1 and len(pip_calls[0]) == 2
+
+    # Minders already installed at the locked commit are skipped
+    (install_path / "Root" / "minder.py").write_text("# local change\n")
+    lockfile.install_locked(lock_path, str(install_path), offline=True, cache_folder=str(tmp_path / "cache"))
+    assert (install_path / "Root" / "minder.py").read_text() == "# local change\n"
+
+def test_install_locked_rejects_changed_archive(archive_server, locked_repos, tmp_path):
+    lock_path, _ = locked_repos
+
+    # The lockfile was written against another archive: nothing may be installed
+    data = json.loads(open(lock_path).read())
+    data["minders"]["test_Shared"]["sha256"] = "0" * 64
+    with open(lock_path, "w") as f:
+        json.dump(data, f)
+
+    install_path = tmp_path / "minders"
+    install_path.mkdir()
+    with pytest.raises(LockfileError):
+        lockfile.install_locked(lock_path, str(install_path), cache_folder=str(tmp_path / "cache"))
+    assert list(install_path.iterdir()) == []
+
+def test_install_locked_offline_without_cache(locked_repos, tmp_path):
+    lock_path, _ = locked_repos
+    with pytest.raises(ArchiveDownloadError):
+        lockfile.install_locked(lock_path, str(tmp_path / "minders"), offline=True, cache_folder=str(tmp_path / "empty"))
+
+def test_lockfile_version_is_checked(tmp_path):
+    lock_path = tmp_path / "mind.lock"
+    lock_path.write_text(json.dumps({"version": 99, "minders": {}}))
+    with pytest.raises(LockfileError):
+        lockfile.read_lockfile(str(lock_path))
+
+def test_lock_requires_python_hashes(archive_server, locked_repos, monkeypatch, tmp_path):
+    monkeypatch.setattr(lockfile, "resolve_python_requirements", lambda reqs: [{"name": "first_lib", "version": "1.0", "sha256": None}])
+    with pytest.raises(LockfileError):
+        lockfile.lock_minders(["test_Root"], str(tmp_path / "unhashed.lock"), cache_folder=str(tmp_path / "cache"))
+    assert not (tmp_path / "unhashed.lock").exists()
+
+def test_install_python_locked_requires_hashes(monkeypatch):
+    commands = []
+    monkeypatch.setattr(lockfile.subprocess, "check_call", lambda cmd: commands.append((cmd, open(cmd[-1]).read())))
+
+    lockfile.install_python_locked([{"name": "first_lib", "version": "1.0", "sha256": "c" * 64}])
+    command, requirements = commands[0]
+    assert "--require-hashes" in command
+    assert requirements == f"first_lib==1.0 --hash=sha256:{'c' * 64}\n"
+
+    with pytest.raises(LockfileError):
+        lockfile.install_python_locked([{"name": "first_lib", "version": "1.0", "sha256": None}])
+
+def test_offline_python_packages_never_use_the_index(monkeypatch, tmp_path):
+    commands = []
+    monkeypatch.setattr(lockfile.subprocess, "check_call", lambda cmd: commands.append(cmd))
+    packages = [{"name": "first_lib", "version": "1.0", "sha256": "c" * 64}]
+
+    # Downloaded at lock time, installed from the folder without the index
+    lockfile.download_python_locked(packages, str(tmp_path / "wheels"))
+    lockfile.install_python_locked(packages, offline=True, wheel_folder=str(tmp_path / "wheels"))
+
+    download, install = commands
+    assert download[3:7] == ["download", "--no-deps", "--dest", str(tmp_path / "wheels")] and "--require-hashes" in download
+    assert install[3:8] == ["install", "--no-deps", "--no-index", "--find-links", str(tmp_path / "wheels")]
+
+def test_install_without_minders_is_an_error(monkeypatch, capsys):
+    from guardin_mind import cli
+    monkeypatch.setattr(sys, "argv", ["mind", "install"])
+    with pytest.raises(SystemExit) as error:
+        cli.main()
+    assert error.value.code == 2
+    assert "--locked" in capsys.readouterr().err
@@ -0,0 +1,511 @@
+import asyncio
+import threading
+import time
+import pytest
+from guardin_mind.manager import ConcurrencyLimiter, limit_concurrency
+
+class ConcurrencyProbe:
+    # Tracks the maximum number of simultaneous calls
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.current = 0
+        self.max = 0
+
+    def __enter__(self):
+        with self.lock:
+            self.current += 1
+            self.max = max(self.max, self.current)
+
+    def __exit__(self, *args):
+        with self.lock:
+            self.current -= 1
+
+def test_limit_shared_by_threads_and_loops():
+    probe = ConcurrencyProbe()
+    limit = limit_concurrency(3)
+
+    @limit
+    def sync_call():
+        with probe:
+            time.sleep(0.01)
+
+    @limit
+    async def async_call():
+        with probe:
+            await asyncio.sleep(0.01)
+
+    async def run_loop():
+        await asyncio.gather(*(async_call() for _ in range(10)))
+
+    threads = [threading.Thread(target=sync_call) for _ in range(10)]
+    threads += [threading.Thread(target=asyncio.run, args=(run_loop(),)) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # One budget for sync callers and every event loop
+    assert probe.max == 3
+    stats = sync_call.limiter.stats()
+    assert stats["acquired"] == 40
+    assert stats["in_flight"] == 0 and stats["queued"] == 0
+    assert stats["waited"] > 0 and stats["wait_time_max"] > 0
+
+def test_limiter_is_fifo():
+    limiter = ConcurrencyLimiter(1)
+    order = []
+    limiter.acquire()
+
+    def worker(i):
+        with limiter:
+            order.append(i)
+
+    threads = []
+    for i in range(5):
+        t = threading.Thread(target=worker, args=(i,))
+        t.start()
+        threads.append(t)
+        while limiter.queued < i + 1: # Enqueue the threads in a known order
+            time.sleep(0.001)
+
+    limiter.release()
+    for t in threads:
+        t.join()
+    assert order == [0, 1, 2, 3, 4]
+
+def test_limiter_timeout_and_cancellation():
+    limiter = ConcurrencyLimiter(1)
+    assert limiter.acquire()
+    assert not limiter.acquire(timeout=0.01)
+
+    async def main():
+        assert not await limiter.acquire_async(timeout=0.01)
+
+        # A cancelled waiter does not leak its slot
+        task = asyncio.create_task(limiter.acquire_async())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        limiter.release()
+        assert await limiter.acquire_async(timeout=1)
+        limiter.release()
+
+    asyncio.run(main())
+    assert limiter.stats()["in_flight"] == 0
+    assert limiter.stats()["queued"] == 0
+
+def test_scheduler_runs_by_priority():
+    from guardin_mind.manager import schedule
+    order = []
+    gate = threading.Event()
+
+    @schedule(1)
+    def call(i):
+        gate.wait()
+        order.append(i)
+
+    blocker = threading.Thread(target=call, args=("blocker",))
+    blocker.start()
+    while call.limiter.in_flight < 1:
+        time.sleep(0.001)
+
+    threads = []
+    for i, priority in enumerate([5, 1, 3, 1]):
+        t = threading.Thread(target=call, args=(i,), kwargs={"_priority": priority})
+        t.start()
+        threads.append(t)
+        while call.limiter.queued < i + 1:
+            time.sleep(0.001)
+
+    gate.set()
+    for t in [blocker] + threads:
+        t.join()
+    assert order == ["blocker", 1, 3, 2, 0]
+
+def test_scheduler_deadlines_and_back_pressure():
+    from guardin_mind import DeadlineExceededError, QueueFullError
+    from guardin_mind.manager import schedule
+
+    @schedule(1, max_queue=1)
+    async def call(delay):
+        await asyncio.sleep(delay)
+        return delay
+
+    async def main():
+        # Already late requests are rejected before they are queued
+        with pytest.raises(DeadlineExceededError):
+            await call(0, _deadline=time.monotonic() - 1)
+
+        running = asyncio.create_task(call(0.1))
+        await asyncio.sleep(0.01)
+
+        # The queued request expires before it can run
+        late = asyncio.create_task(call(0, _deadline=time.monotonic() + 0.02))
+        await asyncio.sleep(0.001)
+
+        # The queue is full
+        with pytest.raises(QueueFullError):
+            await call(0)
+
+        with pytest.raises(DeadlineExceededError):
+            await late
+        assert await running == 0.1
+
+    asyncio.run(main())
+    stats = call.limiter.stats()
+    assert stats["expired"] == 2 and stats["rejected"] == 1
+    assert stats["in_flight"] == 0 and stats["queued"] == 0
+
+CONFIG_MINDER_CODE = '''from guardin_mind.manager import ConfigRead
+
+class ConfigMinder:
+    def __init__(self):
+        ConfigRead(self)
+'''
+
+def write_config(minder_dir, version, extra=""):
+    (minder_dir / "minder_config.toml").write_text(
+        f'[minder]\nname = "ConfigMinder"\nversion = "{version}"\n{extra}', encoding="utf-8")
+
+def test_config_read_is_cached_and_shared(tmp_path, monkeypatch):
+    from guardin_mind import Mind
+    from guardin_mind.manager import ConfigRead
+
+    minder_dir = tmp_path / "minders" / "ConfigMinder"
+    minder_dir.mkdir(parents=True)
+    (minder_dir / "minder.py").write_text(CONFIG_MINDER_CODE)
+    write_config(minder_dir, "0.1.0", 'authors = [{ name = "Author" }]\ninstall-requires = ["requests"]\n')
+
+    # The config location is found without walking the stack
+    import inspect
+    monkeypatch.setattr(inspect, "stack", lambda *args: pytest.fail("inspect.stack() must not be used"))
+
+    parsed = []
+    original_parse = ConfigRead._parse
+    monkeypatch.setattr(ConfigRead, "_parse", classmethod(lambda cls, path: parsed.append(path) or original_parse.__func__(cls, path)))
+
+    cls = Mind(path=tmp_path).ConfigMinder
+    first, second = cls(), cls()
+    assert first.name == "ConfigMinder" and first.version == "0.1.0"
+    assert first.install_requires == ["requests"]
+    assert first.authors[0]["name"] == "Author"
+    assert first.__minder_config__ is second.__minder_config__
+    assert len(parsed) == 1
+
+    # Constructing an instance copies no field, only the shared config is referenced
+    assert set(cls().__dict__) == {"__minder_config__"}
+
+    # Fields keep their TOML types, and every instance gets its own copy
+    first.install_requires.append("numpy")
+    first.authors[0]["name"] = "Changed"
+    assert first.install_requires == ["requests", "numpy"]
+    assert second.install_requires == ["requests"] and second.authors[0]["name"] == "Author"
+    assert first.__minder_config__.install_requires == ("requests",)
+
+    # A changed config is parsed again
+    write_config(minder_dir, "0.2.0-changed")
+    assert cls().version == "0.2.0-changed"
+    assert not hasattr(cls(), "install_requires")
+    assert len(parsed) == 2
+
+def test_config_read_explicit_path(tmp_path):
+    from guardin_mind.manager import ConfigRead
+    write_config(tmp_path, "1.0.0")
+
+    class Target:
+        pass
+
+    reader = ConfigRead(Target(), path=str(tmp_path))
+    assert reader.config.version == "1.0.0"
+    assert reader.target.name == "ConfigMinder"
+    assert not hasattr(Target(), "name") # Values are not stored on the class
+
+    with pytest.raises(FileNotFoundError):
+        ConfigRead(Target(), path=str(tmp_path / "missing"))
+
+def test_adaptive_limiter_aimd_rules():
+    from guardin_mind.manager import AdaptiveLimiter
+    limiter = AdaptiveLimiter(4, min_limit=2, max_limit=6, latency_target=0.1)
+    for _ in range(4):
+        limiter.acquire()
+
+    # Fast calls while busy: additive increase up to max_limit
+    for _ in range(50):
+        limiter.record(0.01)
+    assert limiter.max_concurrent == 6
+
+    # Slow call: multiplicative decrease, once per window of `limit` calls
+    limiter.record(0.5)
+    assert limiter.max_concurrent == 5
+    limiter.record(0.5, error=True)
+    assert limiter.max_concurrent == 5
+
+    for _ in range(100):
+        limiter.record(0.01, error=True)
+    assert limiter.max_concurrent == 2
+    assert limiter.stats()["errors"] == 101
+
+    # Drops count the decreases of the limit only, not the errors at min_limit
+    assert limiter.stats()["drops"] == 4
+
+    for _ in range(4):
+        limiter.release()
+
+def test_adaptive_limiter_increase_wakes_waiters():
+    from guardin_mind.manager import AdaptiveLimiter
+    limiter = AdaptiveLimiter(1, max_limit=4)
+    limiter.acquire()
+
+    acquired = threading.Event()
+    threading.Thread(target=lambda: limiter.acquire() and acquired.set()).start()
+    while limiter.queued < 1:
+        time.sleep(0.001)
+
+    limiter.record(0.01) # 1 + 1/1 -> limit 2
+    assert acquired.wait(1)
+    assert limiter.in_flight == 2
+
+@pytest.mark.parametrize("algorithm, options", [("aimd", {"latency_target": 0.008}), ("aimd", {}), ("gradient", {})])
+def test_adaptive_limit_tracks_degrading_minder(algorithm, options):
+    from guardin_mind.manager import adaptive_limit
+    capacity = 8
+    in_flight = 0
+
+    # Simulated minder: latency grows quadratically once more than `capacity` calls run at once
+    @adaptive_limit(2, max_limit=64, algorithm=algorithm, **options)
+    async def call():
+        nonlocal in_flight
+        in_flight += 1
+        try:
+            await asyncio.sleep(0.005 * max(1.0, in_flight / capacity) ** 2)
+        finally:
+            in_flight -= 1
+
+    limits = []
+    async def main():
+        start = time.monotonic()
+        stop = start + 0.8
+        async def worker():
+            while time.monotonic() < stop:
+                await call()
+        async def sampler():
+            # The limit oscillates around the capacity, sample it once converged
+            await asyncio.sleep(0.4)
+            while time.monotonic() < stop:
+                limits.append(call.limiter.max_concurrent)
+                await asyncio.sleep(0.005)
+        await asyncio.gather(sampler(), *(worker() for _ in range(64)))
+
+    asyncio.run(main())
+    import statistics
+    assert 4 <= statistics.median(limits) <= 20, limits
+    assert call.limiter.stats()["drops"] > 0
+
+def test_adaptive_limit_backs_off_on_errors_sync():
+    from guardin_mind.manager import adaptive_limit
+    probe = ConcurrencyProbe()
+
+    @adaptive_limit(32, max_limit=64)
+    def call():
+        with probe:
+            if probe.current > 6:
+                time.sleep(0.001)
+                raise RuntimeError("overloaded")
+            time.sleep(0.001)
+
+    def worker():
+        stop = time.monotonic() + 0.5
+        while time.monotonic() < stop:
+            try:
+                call()
+            except RuntimeError:
+                pass
+
+    threads = [threading.Thread(target=worker) for _ in range(32)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stats = call.limiter.stats()
+    assert stats["max_concurrent"] <= 16, stats
+    assert stats["errors"] > 0 and stats["in_flight"] == 0
+
+def test_token_bucket_reservations():
+    from guardin_mind.manager import TokenBucket
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0 and bucket.reserve() == 0
+
+    # Exhausted: the next callers queue behind each other
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+    assert bucket.reserve(max_wait=0.1) is None
+    bucket.refund()
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+def test_rate_limit_shared_by_threads_and_loops():
+    from guardin_mind.manager import rate_limit, RateLimiter
+    limiter = RateLimiter(rate=50, burst=5)
+
+    @rate_limit(limiter)
+    def sync_call():
+        return time.monotonic()
+
+    @rate_limit(limiter)
+    async def async_call():
+        return time.monotonic()
+
+    start = time.monotonic()
+    times = []
+    threads = [threading.Thread(target=lambda: times.extend(sync_call() for _ in range(5))) for _ in range(2)]
+    for t in threads:
+        t.start()
+    async def main():
+        return await asyncio.gather(*(async_call() for _ in range(10)))
+    times.extend(asyncio.run(main()))
+    for t in threads:
+        t.join()
+
+    # 20 calls: 5 from the burst, 15 at 50 per second
+    assert time.monotonic() - start >= 0.28
+    stats = limiter.stats()
+    assert stats["allowed"] == 20 and stats["waited"] == 15 and stats["rejected"] == 0
+
+def test_rate_limit_shedding_and_keys():
+    from guardin_mind import RateLimitExceededError
+    from guardin_mind.manager import rate_limit
+
+    @rate_limit(1, burst=2, mode="shed", key=lambda user: user)
+    def call(user):
+        return user
+
+    assert call("a") == "a" and call("a") == "a"
+    with pytest.raises(RateLimitExceededError) as error:
+        call("a")
+    assert 0 < error.value.retry_after <= 1
+    assert call("b") == "b" # Separate bucket per key
+
+    stats = call.rate_limiter.stats()
+    assert stats["keys"] == 2 and stats["rejected"] == 1
+
+def test_rate_limit_async_fallback():
+    from guardin_mind.manager import rate_limit
+
+    async def degraded(text):
+        return f"cached {text}"
+
+    @rate_limit(1, mode="fallback", fallback=degraded)
+    async def call(text):
+        return text
+
+    async def main():
+        return [await call("a"), await call("b")]
+
+    assert asyncio.run(main()) == ["a", "cached b"]
+    assert call.rate_limiter.stats()["fallbacks"] == 1
+
+def test_sync_timeout_frees_the_slot():
+    from guardin_mind import CallTimeoutError
+    from guardin_mind.manager import is_cancelled
+    release = threading.Event()
+    stopped = threading.Event()
+
+    @limit_concurrency(1, timeout=0.05)
+    def stuck():
+        # Cooperative cancellation: notices that the caller gave up
+        while not is_cancelled():
+            if release.wait(0.005):
+                return "late"
+        stopped.set()
+
+    @limit_concurrency(stuck.limiter)
+    def quick():
+        return "ok"
+
+    start = time.monotonic()
+    with pytest.raises(CallTimeoutError):
+        stuck()
+    assert time.monotonic() - start < 1
+    assert stopped.wait(1)
+
+    # The slot was freed, other callers are not starved
+    assert quick() == "ok"
+    assert stuck.limiter.stats()["timed_out"] == 1 and stuck.limiter.in_flight == 0
+
+    # Per-call timeout overrides the per-method one
+    release.set()
+    assert stuck(_timeout=1) == "late"
+
+def test_stuck_sync_calls_do_not_starve_later_calls():
+    from guardin_mind import CallTimeoutError
+    release = threading.Event()
+
+    @limit_concurrency(2, timeout=0.02)
+    def call(stuck):
+        if stuck:
+            release.wait(10)
+        return "ok"
+
+    # More abandoned calls than a default thread pool has threads
+    try:
+        for _ in range(40):
+            with pytest.raises(CallTimeoutError):
+                call(True)
+        stats = call.limiter.stats()
+        assert stats["abandoned"] == 40 and stats["timed_out_unstarted"] == 0
+
+        # Later calls still get a thread right away
+        assert call(False, _timeout=1) == "ok"
+    finally:
+        release.set()
+
+    deadline = time.monotonic() + 5
+    while call.limiter.stats()["abandoned"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert call.limiter.stats()["abandoned"] == 0
+
+def test_async_timeout_and_cancellation_free_the_slot():
+    from guardin_mind import CallTimeoutError
+    cancelled = []
+
+    @limit_concurrency(1)
+    async def call(delay):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(delay)
+            raise
+        return delay
+
+    @limit_concurrency(1)
+    async def raises_timeout():
+        raise TimeoutError("from the function")
+
+    async def main():
+        with pytest.raises(CallTimeoutError):
+            await call(10, _timeout=0.02)
+        assert call.limiter.in_flight == 0
+
+        # Waiting for the slot counts towards the timeout
+        holder = asyncio.create_task(call(0.2))
+        await asyncio.sleep(0.01)
+        with pytest.raises(CallTimeoutError):
+            await call(0, _timeout=0.02)
+
+        # Cancelling the caller cancels the call and frees the slot
+        holder.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await holder
+        assert call.limiter.in_flight == 0
+        assert await call(0, _timeout=1) == 0
+
+        # A TimeoutError of the function itself is not a call timeout
+        with pytest.raises(TimeoutError) as error:
+            await raises_timeout(_timeout=1)
+        assert not isinstance(error.value, CallTimeoutError)
+
+    asyncio.run(main())
+    assert cancelled == [10, 0.2]
+    assert call.limiter.stats()["timed_out"] == 2
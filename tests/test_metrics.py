@@ -0,0 +1,117 @@
+import asyncio
+import pickle
+import urllib.request
+import pytest
+from guardin_mind import Mind
+from guardin_mind.mind_utils.metrics import MetricsRegistry
+
+MINDER_CODE = '''import asyncio
+import time
+from guardin_mind.manager import limit_concurrency, rate_limit
+
+class MeteredMinder:
+    def __init__(self):
+        self.asked = 0
+
+    def ask_sync(self, text):
+        self.asked += 1
+        return text.upper()
+
+    @limit_concurrency(2)
+    def slow(self, delay):
+        time.sleep(delay)
+        return delay
+
+    def fail(self):
+        raise ValueError("boom")
+
+    @rate_limit(1, mode="fallback", fallback=lambda self: "busy")
+    def limited(self):
+        return "ok"
+
+    async def ask_async(self, text):
+        await asyncio.sleep(0.001)
+        return text
+'''
+
+@pytest.fixture
+def mind(tmp_path):
+    minder_dir = tmp_path / "minders" / "MeteredMinder"
+    minder_dir.mkdir(parents=True)
+    (minder_dir / "minder.py").write_text(MINDER_CODE)
+    return Mind(path=tmp_path, metrics=True)
+
+def test_calls_are_recorded(mind):
+    minder = mind.MeteredMinder()
+    assert isinstance(minder, mind.MeteredMinder)
+    assert type(minder).__name__ == "MeteredMinder"
+
+    for _ in range(10):
+        assert minder.ask_sync("hi") == "HI"
+    assert asyncio.run(minder.ask_async("a")) == "a"
+    with pytest.raises(ValueError):
+        minder.fail()
+    minder.slow(0.02)
+
+    snapshot = mind.metrics.snapshot()["MeteredMinder"]
+    assert snapshot["ask_sync"]["calls"] == 10
+    assert snapshot["ask_sync"]["errors"] == 0
+    assert snapshot["ask_sync"]["in_flight"] == 0
+    assert snapshot["ask_async"]["latency_p50"] >= 0.0005
+    assert snapshot["fail"]["errors"] == 1
+
+    # Latency percentiles stay within the observed range
+    slow = snapshot["slow"]
+    assert 0.01 <= slow["latency_p50"] <= slow["latency_max"]
+    assert slow["limiter"]["max_concurrent"] == 2
+
+    # Explicitly loaded classes are instrumented too
+    mind.load(mind.MeteredMinder).ask_sync("x")
+    assert mind.metrics.snapshot()["MeteredMinder"]["ask_sync"]["calls"] == 11
+
+def test_instrumented_instances_pickle(mind):
+    minder = mind.MeteredMinder()
+    minder.ask_sync("hi")
+
+    copy = pickle.loads(pickle.dumps(minder))
+    assert type(copy) is type(minder) and copy.asked == 1
+    copy.ask_sync("again")
+    assert mind.metrics.snapshot()["MeteredMinder"]["ask_sync"]["calls"] == 2
+
+def test_prometheus_export(mind, tmp_path):
+    minder = mind.MeteredMinder()
+    minder.ask_sync("hi")
+    minder.slow(0)
+
+    text = mind.metrics.to_prometheus()
+    assert 'guardin_mind_calls_total{minder="MeteredMinder",method="ask_sync"} 1' in text
+    assert 'guardin_mind_call_duration_seconds_bucket{minder="MeteredMinder",method="ask_sync",le="+Inf"} 1' in text
+    assert 'guardin_mind_limiter_waited_total{minder="MeteredMinder",method="slow"} 0' in text
+
+    assert [minder.limited() for _ in range(3)] == ["ok", "busy", "busy"]
+    assert mind.metrics.snapshot()["MeteredMinder"]["limited"]["rate_limiter"]["fallbacks"] == 2
+    assert 'guardin_mind_rate_limit_rejected_total{minder="MeteredMinder",method="limited"} 2' in mind.metrics.to_prometheus()
+    text = mind.metrics.to_prometheus()
+
+    path = tmp_path / "metrics.prom"
+    mind.metrics.write_prometheus(path)
+    assert path.read_text() == text
+
+    server = mind.metrics.serve(0)
+    try:
+        host, port = server.server_address
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+            assert "guardin_mind_calls_total" in response.read().decode()
+    finally:
+        server.shutdown()
+
+def test_percentile_interpolation():
+    metrics = MetricsRegistry().method_metrics("M", "m")
+    for _ in range(99):
+        metrics.start()
+        metrics.finish(0.002, False)
+    metrics.start()
+    metrics.finish(3.0, False)
+
+    assert 0.001 <= metrics.percentile(0.5) <= 0.0025
+    assert metrics.percentile(0.995) <= 3.0
@@ -102,4 +102,109 @@ def test_get_version_from_file(tmp_path):
     bad_file = tmp_path / "bad_init.py"
     bad_file.write_text("no version here")
     with pytest.raises(RuntimeError):
-        mind.get_version_from_file(str(bad_file))
\ No newline at end of file
+        mind.get_version_from_file(str(bad_file))
+def test_load_minder_is_shared_and_executed_once(tmp_path):
+    minder_name = "CountedMinder"
+    counter_file = tmp_path / "executions.txt"
+    _, minder_file = create_minder_dir(tmp_path, minder_name, minder_code=(
+        f"with open({str(counter_file)!r}, 'a') as f:\n    f.write('x')\n"
+        f"class {minder_name}:\n    pass\n"))
+
+    # Concurrent first loads from several Mind instances execute the module once
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        classes = list(pool.map(lambda _: getattr(Mind(path=tmp_path), minder_name), range(16)))
+
+    assert all(cls is classes[0] for cls in classes)
+    assert counter_file.read_text() == "x"
+
+    # The module is registered under a unique namespaced name
+    import sys
+    module_name = classes[0].__module__
+    assert module_name.startswith("guardin_mind_minders.")
+    assert sys.modules[module_name].__file__ == os.path.realpath(minder_file)
+
+def test_minder_defined_classes_are_picklable(tmp_path):
+    import pickle
+    minder_name = "PicklingMinder"
+    create_minder_dir(tmp_path, minder_name, minder_code=(
+        "from dataclasses import dataclass\n"
+        "@dataclass\nclass Result:\n    value: int\n"
+        f"class {minder_name}:\n    def ask(self):\n        return Result(42)\n"))
+
+    result = Mind(path=tmp_path).PicklingMinder().ask()
+    copy = pickle.loads(pickle.dumps(result))
+    assert copy == result and type(copy) is type(result)
+
+def test_load_minder_reloads_changed_file(tmp_path):
+    minder_name = "ChangingMinder"
+    _, minder_file = create_minder_dir(tmp_path, minder_name,
+        minder_code=f"class {minder_name}:\n    value = 1\n")
+
+    ms = MinderSearch(minders_dir=tmp_path)
+    assert ms.load_minder(minder_file, minder_name).value == 1
+
+    with open(minder_file, "w", encoding="utf-8") as f:
+        f.write(f"class {minder_name}:\n    value = 22\n")
+    assert ms.load_minder(minder_file, minder_name).value == 22
+
+def test_concurrent_first_access_is_single_flight(tmp_path):
+    minder_name = "SingleFlightMinder"
+    create_minder_dir(tmp_path, minder_name, minder_code=f"import time\ntime.sleep(0.1)\nclass {minder_name}:\n    pass\n")
+    mind = Mind(path=tmp_path)
+
+    loads = []
+    original_get_minder = mind.get_minder
+    mind.get_minder = lambda name: loads.append(name) or original_get_minder(name)
+
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    barrier = threading.Barrier(16)
+    def access(_):
+        barrier.wait()
+        return getattr(mind, minder_name)
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        classes = list(pool.map(access, range(16)))
+
+    assert loads == [minder_name]
+    assert all(cls is classes[0] for cls in classes)
+
+def test_missing_minder_is_negatively_cached(tmp_path):
+    mind = Mind(path=tmp_path, miss_ttl=60)
+    with pytest.raises(ValueError):
+        mind.LateMinder
+
+    # Installed after the miss: still missing until the TTL expires or the miss is evicted
+    create_minder_dir(tmp_path, "LateMinder")
+    with pytest.raises(ValueError):
+        mind.LateMinder
+    mind.evict("LateMinder")
+    assert mind.LateMinder.__name__ == "LateMinder"
+
+    short_mind = Mind(path=tmp_path, miss_ttl=0.01)
+    with pytest.raises(ValueError):
+        short_mind.OtherMinder
+    create_minder_dir(tmp_path, "OtherMinder")
+    import time
+    time.sleep(0.02)
+    assert short_mind.OtherMinder.__name__ == "OtherMinder"
+
+def test_evict_and_invalidate(tmp_path):
+    minder_name = "EvictedMinder"
+    counter_file = tmp_path / "executions.txt"
+    create_minder_dir(tmp_path, minder_name, minder_code=(
+        f"with open({str(counter_file)!r}, 'a') as f:\n    f.write('x')\n"
+        f"class {minder_name}:\n    pass\n"))
+    mind = Mind(path=tmp_path)
+    first = getattr(mind, minder_name)
+
+    # Evict: looked up again, the unchanged module is reused
+    mind.evict(minder_name)
+    assert getattr(mind, minder_name) is first
+    assert counter_file.read_text() == "x"
+
+    # Invalidate: the module is executed again
+    mind.invalidate()
+    assert getattr(mind, minder_name) is not first
+    assert counter_file.read_text() == "xx"
@@ -0,0 +1,99 @@
+import json
+import os
+from guardin_mind.mind_utils.minder_index import MinderIndex, INDEX_FILE_NAME, INDEX_FOLDER_NAME
+
+# Helper function to create a minder folder with a config
+def create_minder(minders_folder, minder_name, version="0.1.0"):
+    minder_dir = minders_folder / minder_name
+    minder_dir.mkdir(parents=True)
+    (minder_dir / "minder_config.toml").write_text(
+        f'[minder]\nname = "{minder_name}"\nversion = "{version}"\n', encoding="utf-8")
+    return minder_dir
+
+def test_index_lookup_and_persistence(tmp_path):
+    minders_folder = tmp_path / "minders"
+    create_minder(minders_folder, "FirstMinder")
+    create_minder(minders_folder, "SecondMinder")
+
+    index = MinderIndex(minders_folder)
+    entry = index.lookup("SecondMinder")
+    assert entry["path"].endswith("minders/SecondMinder")
+    assert entry["config_hash"] is not None
+    assert index.lookup("NoSuchMinder") is None
+
+    # The index is persisted inside the minders folder, and its folder is not a minder
+    assert os.listdir(tmp_path) == ["minders"]
+    with open(minders_folder / INDEX_FOLDER_NAME / INDEX_FILE_NAME, encoding="utf-8") as f:
+        data = json.load(f)
+    assert set(data["entries"]) == {"FirstMinder", "SecondMinder"}
+
+    # A new index instance reuses the persisted entries
+    assert MinderIndex(minders_folder).lookup("FirstMinder")["path"] == index.lookup("FirstMinder")["path"]
+    assert set(index.entries()) == {"FirstMinder", "SecondMinder"}
+
+def test_sibling_folders_keep_their_own_index(tmp_path):
+    create_minder(tmp_path / "left", "LeftMinder")
+    create_minder(tmp_path / "right", "RightMinder")
+    assert MinderIndex(tmp_path / "left").lookup("LeftMinder") is not None
+    assert MinderIndex(tmp_path / "right").lookup("RightMinder") is not None
+
+    # Each folder persists its own entries, the second index does not overwrite the first one
+    for folder, minder_name in (("left", "LeftMinder"), ("right", "RightMinder")):
+        with open(tmp_path / folder / INDEX_FOLDER_NAME / INDEX_FILE_NAME, encoding="utf-8") as f:
+            assert set(json.load(f)["entries"]) == {minder_name}
+
+def test_index_incremental_refresh(tmp_path, monkeypatch):
+    minders_folder = tmp_path / "minders"
+    create_minder(minders_folder, "FirstMinder")
+
+    index = MinderIndex(minders_folder)
+    assert index.lookup("FirstMinder") is not None
+
+    # Only new entries are described on refresh
+    described = []
+    original_describe = MinderIndex._describe
+    monkeypatch.setattr(MinderIndex, "_describe", lambda self, name: described.append(name) or original_describe(self, name))
+
+    create_minder(minders_folder, "SecondMinder")
+    os.rename(minders_folder / "FirstMinder", minders_folder / "ThirdMinder")
+
+    assert index.lookup("SecondMinder") is not None
+    assert index.lookup("FirstMinder") is None
+    assert sorted(described) == ["SecondMinder", "ThirdMinder"]
+
+def test_index_update_and_remove(tmp_path):
+    minders_folder = tmp_path / "minders"
+    minders_folder.mkdir()
+
+    index = MinderIndex(minders_folder)
+    assert index.entries() == {}
+
+    create_minder(minders_folder, "NewMinder")
+    assert index.update("NewMinder")["path"].endswith("minders/NewMinder")
+
+    index.remove("NewMinder")
+    assert "NewMinder" not in index.entries()
+
+def test_index_missing_folder(tmp_path):
+    index = MinderIndex(tmp_path / "minders")
+    assert index.lookup("AnyMinder") is None
+
+def test_index_redescribes_changed_minders(tmp_path):
+    minders_folder = tmp_path / "minders"
+    minder_dir = create_minder(minders_folder, "ChangedMinder")
+
+    index = MinderIndex(minders_folder)
+    old_hash = index.lookup("ChangedMinder")["config_hash"]
+
+    # Edited in place (the minders folder mtime does not change)
+    config = minder_dir / "minder_config.toml"
+    config.write_text('[minder]\nname = "ChangedMinder"\nversion = "0.2.0"\n', encoding="utf-8")
+    os.utime(config, ns=(1, 1))
+    new_hash = index.lookup("ChangedMinder")["config_hash"]
+    assert new_hash != old_hash
+
+    # Reinstalled by another process: a fresh index loaded from disk describes it again
+    replacement = create_minder(tmp_path / "staging", "ChangedMinder", version="0.3.0")
+    os.rename(minder_dir, tmp_path / "old")
+    os.rename(replacement, minder_dir)
+    assert MinderIndex(minders_folder).lookup("ChangedMinder")["config_hash"] not in (old_hash, new_hash)
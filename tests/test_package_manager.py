@@ -0,0 +1,209 @@
+import threading
+import time
+import pytest
+from guardin_mind import MinderDependencyError, PythonVersionError
+from guardin_mind.package_manager import package_manager as pm
+
+# Fake GitHub: minder name -> (requires-minders, install-requires)
+FAKE_REPOS = {
+    "Root": (["test_Left", "test_Right"], ["first_missing_lib"]),
+    "Left": (["test_Shared"], ["json"]),
+    "Right": (["test_Shared"], ["second_missing_lib"]),
+    "Shared": ([], ["first_missing_lib"]),
+    "CycleA": (["test_CycleB"], []),
+    "CycleB": (["test_CycleA"], []),
+    "NeedsOld": (["test_Shared", "test_OldPython"], []),
+    "OldPython": ([], []),
+}
+FAKE_PYTHON = {"OldPython": "<3"} # Minder name -> required Python version
+
+@pytest.fixture
+def fake_github(monkeypatch):
+    downloads = []
+    pip_calls = []
+    active = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def fake_download(user_repo, minder, destination_folder):
+        with lock:
+            downloads.append(minder)
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        time.sleep(0.05) # Simulate network latency
+
+        requires, libs = FAKE_REPOS[minder]
+        minder_dir = pm.Path(destination_folder) / minder
+        minder_dir.mkdir(parents=True)
+        (minder_dir / "minder.py").write_text(f"class {minder}:\n    pass\n")
+        python = f'python = "{FAKE_PYTHON[minder]}"\n' if minder in FAKE_PYTHON else ""
+        (minder_dir / "minder_config.toml").write_text(
+            f'[minder]\nname = "{minder}"\nversion = "0.1.0"\n{python}'
+            f'requires-minders = {requires!r}\ninstall-requires = {libs!r}\n'.replace("'", '"'))
+
+        with lock:
+            active["now"] -= 1
+        return True
+
+    monkeypatch.setattr(pm, "download_repo_zip", fake_download)
+    monkeypatch.setattr(pm.subprocess, "check_call", lambda cmd: pip_calls.append(cmd))
+    return downloads, pip_calls, active
+
+def test_install_resolves_graph_once(tmp_path, fake_github):
+    downloads, pip_calls, active = fake_github
+
+    assert pm.install_minders(["test_Root"], str(tmp_path))
+
+    # Every minder is downloaded once, independent minders in parallel
+    assert sorted(downloads) == ["Left", "Right", "Root", "Shared"]
+    assert active["max"] >= 2
+
+    # All missing Python requirements are installed with a single pip call
+    assert len(pip_calls) == 1
+    assert pip_calls[0][-2:] == ["first_missing_lib", "second_missing_lib"]
+
+def test_install_shares_resolution_between_minders(tmp_path, fake_github):
+    downloads, _, _ = fake_github
+
+    pm.install_minders(["test_Left", "test_Right"], str(tmp_path))
+    assert sorted(downloads) == ["Left", "Right", "Shared"]
+
+    # Already installed minders are not downloaded again
+    pm.install_minder("test_Root", str(tmp_path))
+    assert sorted(downloads) == ["Left", "Right", "Root", "Shared"]
+
+def test_install_detects_cycles(tmp_path, fake_github):
+    with pytest.raises(MinderDependencyError):
+        pm.install_minders(["test_CycleA"], str(tmp_path))
+
+def test_resolve_order_puts_dependencies_first(tmp_path, fake_github):
+    order = [node.minder for node in pm.resolve_minders(["test_Root"], str(tmp_path))]
+    assert order.index("Shared") < order.index("Left") < order.index("Root")
+    assert order.index("Right") < order.index("Root")
+
+def test_minder_lock_excludes_other_processes(tmp_path):
+    import subprocess, sys
+    from guardin_mind.package_manager.atomic_fs import minder_lock
+
+    # A child process holds the lock until its stdin is closed
+    code = (
+        "import sys\n"
+        "from guardin_mind.package_manager.atomic_fs import minder_lock\n"
+        f"with minder_lock({str(tmp_path)!r}, 'Locked'):\n"
+        "    print('locked', flush=True)\n"
+        "    sys.stdin.read()\n"
+    )
+    child = subprocess.Popen([sys.executable, "-c", code], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    try:
+        assert child.stdout.readline().strip() == "locked"
+        with pytest.raises(TimeoutError):
+            minder_lock(str(tmp_path), "Locked", timeout=0.2).acquire()
+        with minder_lock(str(tmp_path), "Other", timeout=0.2): # Other minders are not blocked
+            pass
+    finally:
+        child.stdin.close()
+        child.wait()
+
+    with minder_lock(str(tmp_path), "Locked", timeout=5):
+        pass
+
+def test_publish_never_exposes_a_missing_minder(tmp_path):
+    from guardin_mind.package_manager import atomic_fs
+    from guardin_mind.package_manager.atomic_fs import publish_folder
+
+    final = tmp_path / "Minder"
+    final.mkdir()
+    (final / "minder.py").write_text("0")
+
+    stop = threading.Event()
+    missing = []
+
+    def reader():
+        while not stop.is_set():
+            if not (final / "minder.py").is_file():
+                missing.append(True)
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    try:
+        for version in range(1, 50):
+            staged = tmp_path / f".staging-{version}"
+            staged.mkdir()
+            (staged / "minder.py").write_text(str(version))
+            publish_folder(str(staged), str(final))
+    finally:
+        stop.set()
+        thread.join()
+
+    assert (final / "minder.py").read_text() == "49"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["Minder"] # No staging or trash folders left
+    if atomic_fs._renameat2: # Without renameat2 the old folder is moved aside for a moment
+        assert missing == []
+
+def test_parallel_installs_into_one_folder(tmp_path, archive_server, monkeypatch):
+    from guardin_mind.package_manager import archive_cache
+
+    monkeypatch.setattr(archive_cache, "_archive_url_template", archive_server.url_template)
+    monkeypatch.setattr(archive_cache, "_default_cache_folder", str(tmp_path / "cache"))
+    monkeypatch.setattr(pm.subprocess, "check_call", lambda cmd: None)
+    names = ["Alpha", "Beta", "Gamma"]
+    for name in names:
+        archive_server.add_minder(f"test/{name}", {
+            "minder.py": f"class {name}:\n    pass\n",
+            "minder_config.toml": f'[minder]\nname = "{name}"\nversion = "0.1.0"\n',
+        })
+
+    # Every install races with another install of the same minders
+    install_path = tmp_path / "minders"
+    errors = []
+
+    def install(minders):
+        try:
+            pm.install_minders(minders, str(install_path))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=install, args=([f"test_{name}" for name in names],)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    for name in names:
+        assert (install_path / name / "minder_config.toml").is_file()
+    assert not [p.name for p in install_path.iterdir() if p.name.startswith((".staging-", ".trash-"))]
+
+    # Uninstall removes the folder at once and leaves nothing behind
+    pm.uninstall_minder("test_Alpha", str(install_path), confirm=True)
+    assert sorted(p.name for p in install_path.iterdir() if not p.name.startswith(".")) == ["Beta", "Gamma"]
+    assert not [p.name for p in install_path.iterdir() if p.name.startswith(".trash-")]
+
+def test_cli_install_reports_failures_and_installs_the_rest(tmp_path, fake_github, monkeypatch, capsys):
+    import sys
+    from guardin_mind import cli
+
+    downloads, _, _ = fake_github
+    monkeypatch.setattr(sys, "argv", ["mind", "install", "test_Missing", "test_Left", "--path", str(tmp_path)])
+    cli.main()
+
+    assert "Shared" in downloads and "Left" in downloads
+    assert (tmp_path / "Left").is_dir()
+    assert "ERROR" in capsys.readouterr().out
+
+def test_failed_install_publishes_nothing(tmp_path, fake_github):
+    downloads, pip_calls, _ = fake_github
+
+    # OldPython is checked before anything of the graph is published
+    with pytest.raises(PythonVersionError):
+        pm.install_minders(["test_NeedsOld"], str(tmp_path))
+    assert sorted(downloads) == ["NeedsOld", "OldPython", "Shared"]
+    assert list(tmp_path.iterdir()) == [tmp_path / ".locks"]
+    assert pip_calls == []
+
+    # An already installed minder is checked again when a new minder requires it
+    pm.install_minders(["test_Shared"], str(tmp_path))
+    (tmp_path / "OldPython").mkdir()
+    (tmp_path / "OldPython" / "minder_config.toml").write_text('[minder]\nname = "OldPython"\nversion = "0.1.0"\npython = "<3"\n')
+    with pytest.raises(PythonVersionError):
+        pm.install_minders(["test_NeedsOld"], str(tmp_path))
+    assert not (tmp_path / "NeedsOld").exists()
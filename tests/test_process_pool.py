@@ -0,0 +1,65 @@
+import asyncio
+import os
+from guardin_mind import Mind
+
+MINDER_CODE = '''import os
+
+class ProcessMinder:
+    def __init__(self, base=0):
+        self.base = base
+        self.calls = 0
+
+    def add(self, value):
+        self.calls += 1
+        return self.base + value
+
+    def pid(self):
+        return os.getpid()
+
+    def count(self):
+        self.calls += 1
+        return self.calls
+
+    async def add_async(self, value):
+        return self.base + value
+'''
+
+def test_process_mode_proxies_calls(tmp_path):
+    minder_dir = tmp_path / "minders" / "ProcessMinder"
+    minder_dir.mkdir(parents=True)
+    (minder_dir / "minder.py").write_text(MINDER_CODE)
+
+    mind = Mind(path=tmp_path)
+    with mind.load(mind.ProcessMinder, mode="process", workers=2, kwargs={"base": 10}) as minder:
+        # Sync and awaitable variants
+        assert minder.add(5) == 15
+        assert minder.add.submit(1).result() == 11
+        assert asyncio.run(minder.add.acall(2)) == 12
+        assert asyncio.run(minder.add_async(3)) == 13
+
+        # Calls run in the worker processes
+        assert minder.pid() != os.getpid()
+        assert len(set(minder.warm_up())) == 2
+
+    # Worker recycling after N calls
+    with mind.load(mind.ProcessMinder, mode="process", workers=1, recycle_after=2) as minder:
+        counts = [minder.count() for _ in range(4)]
+        assert max(counts) <= 2
+
+def test_warm_up_does_not_use_recycle_budget(tmp_path):
+    minder_dir = tmp_path / "minders" / "ProcessMinder"
+    minder_dir.mkdir(parents=True)
+    (minder_dir / "minder.py").write_text(MINDER_CODE)
+
+    mind = Mind(path=tmp_path)
+    with mind.load(mind.ProcessMinder, mode="process", workers=1, recycle_after=2) as minder:
+        warm_pids = minder.warm_up() # Already warm: nothing is started again
+        pids = [minder.pid() for _ in range(4)]
+
+    # The warmed-up worker handles exactly `recycle_after` real calls, then it is replaced
+    assert pids[0] == pids[1] == warm_pids[0]
+    assert pids[2] == pids[3] != pids[0]
+
+    with mind.load(mind.ProcessMinder, mode="process", workers=1, recycle_after=1) as minder:
+        warm_pid = minder.warm_up()[0]
+        assert minder.pid() == warm_pid
@@ -0,0 +1,77 @@
+import asyncio
+import io
+import pstats
+import sys
+import pytest
+from guardin_mind import Mind
+from guardin_mind.cli import main
+
+MINDER_CODE = '''import asyncio
+
+def busy(n):
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+class ProfiledMinder:
+    def compute(self, n):
+        return busy(n)
+
+    async def fetch(self, n):
+        await asyncio.sleep(0.05)
+        return busy(n)
+
+    def untouched(self):
+        return 1
+'''
+
+@pytest.fixture
+def mind_path(tmp_path):
+    minder_dir = tmp_path / "minders" / "ProfiledMinder"
+    minder_dir.mkdir(parents=True)
+    (minder_dir / "minder.py").write_text(MINDER_CODE)
+    return tmp_path
+
+def function_names(stats: pstats.Stats) -> set[str]:
+    return {name for _, _, name in stats.stats}
+
+def test_profiles_sync_and_async_methods(mind_path, tmp_path):
+    mind = Mind(path=mind_path)
+    minder_cls = mind.ProfiledMinder # Loaded before profiling, hooked again
+
+    profiler = mind.enable_profiling(["ProfiledMinder"], ["compute", "fetch"], sampling_interval=0.001)
+    assert mind.ProfiledMinder is not minder_cls
+    minder = mind.ProfiledMinder()
+
+    minder.compute(200_000)
+    asyncio.run(minder.fetch(10_000))
+    minder.untouched()
+    profiler.stop()
+
+    timings = profiler.timings()["ProfiledMinder"]
+    assert set(timings) == {"compute", "fetch"}
+    assert timings["compute"]["calls"] == 1
+    # Time spent awaiting is separated from running time
+    assert timings["fetch"]["await_time"] >= 0.04
+    assert timings["fetch"]["cpu_time"] < timings["fetch"]["wall_time"]
+
+    stats = profiler.stats()
+    assert "busy" in function_names(stats)
+    # The 50 ms spent awaiting are not attributed to asyncio.sleep
+    sleep_time = sum(entry[3] for (_, _, name), entry in stats.stats.items() if name == "sleep")
+    assert sleep_time < 0.02
+
+    assert "busy (minder.py" in profiler.collapsed_stacks()
+
+def test_profile_command(mind_path, tmp_path, monkeypatch, capsys):
+    output = tmp_path / "out"
+    monkeypatch.setattr(sys, "argv", [
+        "mind", "profile", "ProfiledMinder", "compute", "--args", "20000",
+        "--path", str(mind_path), "-n", "20", "-c", "2", "-o", str(output),
+    ])
+    main()
+
+    assert "ProfiledMinder.compute: 20 calls" in capsys.readouterr().out
+    assert "busy" in function_names(pstats.Stats(f"{output}.pstats", stream=io.StringIO()))
+    assert (tmp_path / "out.collapsed").exists()
@@ -0,0 +1,67 @@
+import asyncio
+import os
+import pytest
+from guardin_mind import Mind
+from guardin_mind.mind_utils import shared_buffers
+from guardin_mind.mind_utils.ipc import MindServer
+
+np = pytest.importorskip("numpy")
+
+MINDER_CODE = '''
+class BufferMinder:
+    def double(self, array):
+        return array * 2
+
+    def describe(self, data):
+        return type(data).__name__, len(data)
+
+    async def reverse(self, data):
+        return data[::-1]
+'''
+
+def test_share_and_resolve_roundtrip():
+    array = np.arange(1000, dtype=np.float64).reshape(10, 100)
+    view = memoryview(bytearray(range(256)) * 8)
+    args = (b"x" * 4096, [array, b"small"], {"view": view})
+
+    created = []
+    shared = shared_buffers.share(args, 1024, created)
+    assert len(created) == 3
+    assert shared[1][1] == b"small" # Below the threshold, pickled as usual
+
+    data, items, mapping = shared_buffers.resolve(shared)
+    assert data == b"x" * 4096
+    np.testing.assert_array_equal(items[0], array)
+    assert items[0].shape == (10, 100)
+    assert bytes(mapping["view"]) == bytes(view)
+
+    # The receiver took ownership: segment files are already gone
+    assert not any(os.path.exists(path) for path in created)
+
+def test_process_mode_passes_buffers_through_shared_memory(tmp_path):
+    minder_dir = tmp_path / "minders" / "BufferMinder"
+    minder_dir.mkdir(parents=True)
+    (minder_dir / "minder.py").write_text(MINDER_CODE)
+
+    mind = Mind(path=tmp_path)
+    array = np.arange(100_000, dtype=np.int64)
+    with mind.load(mind.BufferMinder, mode="process", workers=1, shared_memory_threshold=1024) as minder:
+        np.testing.assert_array_equal(minder.double(array), array * 2)
+        assert minder.describe(b"a" * 10_000) == ("bytes", 10_000)
+        assert minder.describe(b"a" * 10) == ("bytes", 10)
+        assert asyncio.run(minder.reverse.acall(b"abc" * 1000)) == b"cba" * 1000
+
+def test_served_minder_passes_buffers_through_shared_memory(tmp_path):
+    minder_dir = tmp_path / "minders" / "BufferMinder"
+    minder_dir.mkdir(parents=True)
+    (minder_dir / "minder.py").write_text(MINDER_CODE)
+
+    server = MindServer(tmp_path / "m.sock", path=tmp_path).start()
+    try:
+        minder = Mind(server=server.socket_path, shared_memory_threshold=1024).BufferMinder()
+        array = np.ones((256, 256), dtype=np.float32)
+        np.testing.assert_array_equal(minder.double(array), array * 2)
+        assert minder.describe(memoryview(b"m" * 5000)) == ("memoryview", 5000)
+        assert asyncio.run(minder.reverse(b"xy" * 2048)) == b"yx" * 2048
+    finally:
+        server.stop()
@@ -0,0 +1,49 @@
+import json
+import os
+import subprocess
+import sys
+
+# Modules that must only be imported by the subcommands that need them
+HEAVY_MODULES = ["requests", "pydantic", "packaging", "zipfile", "subprocess", "colorama", "asyncio"]
+
+# Startup regression budget for `import guardin_mind` (cumulative, microseconds, from `-X importtime`)
+IMPORT_BUDGET_US = 50_000
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def run_python(code, tmp_path, *flags):
+    # Run in a fresh interpreter with an isolated home folder
+    env = dict(os.environ, HOME=str(tmp_path), USERPROFILE=str(tmp_path), PYTHONPATH=ROOT_DIR)
+    return subprocess.run([sys.executable, *flags, "-c", code], capture_output=True, text=True, env=env, cwd=ROOT_DIR, check=True)
+
+def new_modules(code, tmp_path):
+    # Modules imported by `code` on top of the interpreter startup
+    result = run_python(
+        "import sys, json; before = set(sys.modules)\n"
+        f"{code}\n"
+        "print(json.dumps(sorted(set(sys.modules) - before)))", tmp_path)
+    return set(json.loads(result.stdout.strip().splitlines()[-1]))
+
+def test_import_is_light_and_side_effect_free(tmp_path):
+    modules = new_modules("import guardin_mind", tmp_path)
+    assert not [m for m in HEAVY_MODULES if m in modules]
+
+    # Importing the library must not create the mind folder
+    assert not (tmp_path / ".guardin_mind").exists()
+
+def test_cli_version_is_light(tmp_path):
+    modules = new_modules("sys.argv = ['mind', '--version']\nfrom guardin_mind.cli import main\nmain()", tmp_path)
+    assert not [m for m in HEAVY_MODULES if m in modules and m != "colorama"]
+
+def test_import_time_budget(tmp_path):
+    result = run_python("import guardin_mind", tmp_path, "-X", "importtime")
+
+    # Line format: "import time: <self us> | <cumulative us> | <indented module name>"
+    cumulative = None
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == "guardin_mind" and parts[2].startswith(" guardin_mind"):
+            cumulative = int(parts[1])
+
+    assert cumulative is not None
+    assert cumulative < IMPORT_BUDGET_US, f"`import guardin_mind` took {cumulative} us (budget {IMPORT_BUDGET_US} us)"